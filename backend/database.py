@@ -1,13 +1,51 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# SQLite for local development (safe, zero setup)
-DATABASE_URL = "sqlite:///./interviews.db"
+from backend.metrics import instrument_engine
+
+# SQLite for local development (safe, zero setup).
+# Override with DATABASE_URL / ASYNC_DATABASE_URL and the DB_POOL_* knobs.
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./interviews.db")
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _default_async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{_ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _default_async_url(DATABASE_URL))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+def engine_options(url: str) -> dict:
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}  # needed for SQLite + FastAPI
+    else:
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+
+    return options
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # needed for SQLite + FastAPI
-)
+
+engine = instrument_engine(create_engine(DATABASE_URL, **engine_options(DATABASE_URL)))
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -25,3 +63,43 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# -----------------------------
+# Async engine (created on first use so the async driver stays optional)
+# -----------------------------
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            **engine_options(ASYNC_DATABASE_URL),
+        )
+        instrument_engine(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_sessionmaker():
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+
+# FastAPI dependency (async)
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,164 @@
+import threading
+from datetime import datetime
+
+from sqlalchemy import update
+
+from backend.database import SessionLocal
+from backend.orchestrator_adapter import (
+    OrchestratorExecutionError,
+    get_execution_service,
+)
+from backend.sessions import InterviewSession, InterviewSessionStatus
+
+TERMINAL_STATUSES = {
+    InterviewSessionStatus.COMPLETED,
+    InterviewSessionStatus.FAILED,
+}
+
+
+class InterviewJobRunner:
+    """
+    Runs interview jobs in the background and persists their status.
+
+    CREATED -> RUNNING -> COMPLETED | FAILED
+
+    The deterministic evaluation is committed as soon as it is ready;
+    the AI advisory is attached to the row later, with its own status.
+
+    Status of in-flight jobs is also kept in memory so pollers and
+    event streams can follow a job without hitting the database.
+    Entries are dropped once the terminal status is committed (a
+    terminal status that could not be committed is kept).
+    """
+
+    def __init__(self, execution_service=None, session_factory=SessionLocal):
+        self._service = execution_service or get_execution_service()
+        self._session_factory = session_factory
+        self._statuses = {}
+        self._lock = threading.Lock()
+
+    def status(self, session_id) -> InterviewSessionStatus | None:
+        with self._lock:
+            return self._statuses.get(str(session_id))
+
+    def _set_status(self, session_id, status: InterviewSessionStatus, persisted: bool = True):
+        with self._lock:
+            if status in TERMINAL_STATUSES and persisted:
+                self._statuses.pop(str(session_id), None)
+            else:
+                # A terminal status the database never took stays here,
+                # so pollers and event streams still see the job end.
+                self._statuses[str(session_id)] = status
+
+    def _update_session(self, session_id, **fields):
+        db = self._session_factory()
+        try:
+            session = db.get(InterviewSession, session_id)
+            if session is None:
+                return
+            for name, value in fields.items():
+                setattr(session, name, value)
+            db.commit()
+        finally:
+            db.close()
+
+    def _mark_running(self, session_id):
+        self._update_session(
+            session_id,
+            status=InterviewSessionStatus.RUNNING,
+            started_at=datetime.utcnow(),
+        )
+        self._set_status(session_id, InterviewSessionStatus.RUNNING)
+
+    def _attach_advisory(self, session_id, artifact: dict, only_if_missing: bool = False):
+        statement = (
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id)
+            .values(ai_advisory=artifact, ai_advisory_status=artifact["status"])
+        )
+        if only_if_missing:
+            # The advisory may already have settled; never overwrite it
+            statement = statement.where(InterviewSession.ai_advisory_status.is_(None))
+
+        db = self._session_factory()
+        try:
+            db.execute(statement)
+            db.commit()
+        finally:
+            db.close()
+
+    def _fail(self, session_id, message: str):
+        persisted = False
+        try:
+            self._update_session(
+                session_id,
+                status=InterviewSessionStatus.FAILED,
+                error_message=message,
+            )
+            persisted = True
+        finally:
+            self._set_status(session_id, InterviewSessionStatus.FAILED, persisted=persisted)
+
+    def _finish(self, session_id, future):
+        # Runs as a done-callback, where concurrent.futures swallows
+        # exceptions: every path has to end in a terminal status.
+        try:
+            evaluation = future.result()
+        except Exception as e:
+            self._fail(session_id, str(e) or "Orchestrator execution failed")
+            return
+
+        advisory = evaluation.pop("ai_advisory", None)
+
+        try:
+            self._update_session(
+                session_id,
+                status=InterviewSessionStatus.COMPLETED,
+                completed_at=datetime.utcnow(),
+                evaluation=evaluation,
+            )
+        except Exception as e:
+            self._fail(session_id, f"Could not store the evaluation: {e}")
+            return
+
+        self._set_status(session_id, InterviewSessionStatus.COMPLETED)
+
+        if advisory is not None:
+            # The evaluation is committed; a failed attach leaves the
+            # advisory missing, not the job unfinished.
+            try:
+                self._attach_advisory(session_id, advisory, only_if_missing=True)
+            except Exception:
+                pass
+
+    def enqueue(self, session_id):
+        """
+        Schedules the interview for a committed CREATED session.
+        Raises OrchestratorExecutionError when the queue is full.
+        """
+        self._set_status(session_id, InterviewSessionStatus.CREATED)
+
+        try:
+            future = self._service.submit(
+                on_start=lambda: self._mark_running(session_id),
+                on_advisory=lambda artifact: self._attach_advisory(session_id, artifact),
+            )
+        except OrchestratorExecutionError:
+            self._set_status(session_id, InterviewSessionStatus.FAILED)
+            raise
+
+        future.add_done_callback(lambda f: self._finish(session_id, f))
+        return future
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> InterviewJobRunner:
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = InterviewJobRunner()
+    return _runner
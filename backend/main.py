@@ -1,9 +1,48 @@
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from backend import metrics
 from backend.routes.interviews import router as interviews_router
+from interview_runtime.cache import get_session_state_cache
+from orchestrator.adapter import get_orchestrator_adapter
+
+# "async" serves /interview-runtime on AsyncSession (needs an async driver)
+RUNTIME_API_MODE = os.getenv("RUNTIME_API_MODE", "sync")
+
+if RUNTIME_API_MODE == "async":
+    from interview_runtime.api.async_routes import router as runtime_router
+else:
+    from interview_runtime.api.routes import router as runtime_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile (and validate) the active question graph before any
+    # session can start; a malformed graph fails startup.
+    get_orchestrator_adapter().graph()
+    # A session cache that cannot serve this deployment (e.g. in-process
+    # with several workers) fails startup too.
+    get_session_state_cache()
+    yield
+
 
 app = FastAPI(
     title="Interview Infra API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(interviews_router)
+app.include_router(runtime_router)
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    # Prometheus text exposition; METRICS_ENABLED=true to collect
+    body = metrics.render()
+    if body is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
@@ -0,0 +1,299 @@
+"""
+Metrics
+-------
+In-process counters and latency histograms, served in the Prometheus
+text format on GET /metrics.
+
+- Runtime engine: one histogram per operation (by outcome), FSM
+  transitions, version conflicts and session failures (by reason)
+- Database: one histogram per statement kind (SELECT / INSERT / ...)
+- Interview pipeline: per-stage timings (render, transcription with
+  streamed evidence, scoring, advisor, ...)
+
+Enabled with METRICS_ENABLED=true. When disabled every hook returns
+after a single flag check and nothing is recorded.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Seconds; covers sub-millisecond cache hits up to slow model calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# -----------------------------
+# Metric types
+# -----------------------------
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (non-cumulative) + overflow, sum]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        i = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            i += 1
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def count(self, *labels) -> int:
+        with self._lock:
+            series = self._series.get(labels)
+            return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            for labels, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    bucket_labels = _labels(self.labelnames, labels, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total:.6f}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+RUNTIME_OPERATION_SECONDS = REGISTRY.histogram(
+    "runtime_operation_seconds",
+    "InterviewRuntimeEngine operation latency.",
+    ("operation", "outcome"),
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_seconds",
+    "Database statement latency by statement kind.",
+    ("statement",),
+)
+FSM_TRANSITIONS = REGISTRY.counter(
+    "runtime_fsm_transitions_total",
+    "Session state transitions.",
+    ("from_state", "to_state"),
+)
+VERSION_CONFLICTS = REGISTRY.counter(
+    "runtime_version_conflicts_total",
+    "Writes rejected by optimistic concurrency checks.",
+    ("operation",),
+)
+SESSION_FAILURES = REGISTRY.counter(
+    "runtime_session_failures_total",
+    "Sessions moved to FAILED, by error type.",
+    ("reason",),
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    "pipeline_stage_seconds",
+    "Interview pipeline stage latency (orchestrator, scoring, advisor).",
+    ("stage",),
+)
+ADVISORY_OUTCOMES = REGISTRY.counter(
+    "advisory_outcomes_total",
+    "AI advisory terminal statuses.",
+    ("status",),
+)
+
+
+# -----------------------------
+# Hooks (no-ops when disabled)
+# -----------------------------
+
+def enabled() -> bool:
+    return METRICS_ENABLED
+
+
+def set_enabled(value: bool):
+    global METRICS_ENABLED
+    METRICS_ENABLED = value
+
+
+def inc(counter: Counter, *labels, amount: float = 1.0):
+    if METRICS_ENABLED:
+        counter.inc(*labels, amount=amount)
+
+
+def observe(histogram: Histogram, seconds: float, *labels):
+    if METRICS_ENABLED:
+        histogram.observe(seconds, *labels)
+
+
+@contextmanager
+def _stage(stage: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage)
+
+
+_DISABLED = nullcontext()
+
+
+def stage_timer(stage: str):
+    """
+    with stage_timer("scoring"): ...
+    """
+    if not METRICS_ENABLED:
+        return _DISABLED
+    return _stage(stage)
+
+
+def timed_operation(operation: str):
+    """
+    Decorator for engine operations: latency by outcome ("ok", or the
+    exception type that escaped).
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not METRICS_ENABLED:
+                return fn(*args, **kwargs)
+
+            started = time.perf_counter()
+            outcome = "ok"
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                RUNTIME_OPERATION_SECONDS.observe(
+                    time.perf_counter() - started, operation, outcome
+                )
+        return wrapper
+    return decorate
+
+
+# -----------------------------
+# Database
+# -----------------------------
+
+def _statement_kind(statement: str) -> str:
+    word = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return word if word in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+
+def instrument_engine(engine):
+    """
+    Times every statement on a (sync) SQLAlchemy engine. Listeners are
+    only attached when metrics are enabled.
+    """
+    if not METRICS_ENABLED:
+        return engine
+
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("_metrics_started")
+        if stack:
+            DB_QUERY_SECONDS.observe(
+                time.perf_counter() - stack.pop(), _statement_kind(statement)
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        stack = context.connection.info.get("_metrics_started") if context.connection else None
+        if stack:
+            stack.pop()
+
+    return engine
+
+
+def render() -> Optional[str]:
+    return REGISTRY.render() if METRICS_ENABLED else None
@@ -1,24 +1,149 @@
 import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
 
+from backend.metrics import stage_timer
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+ROLE_CONFIG_PATH = PROJECT_ROOT / "configs" / "roles" / "swe_entry_mid.json"
+QUESTION_GRAPH_PATH = PROJECT_ROOT / "configs" / "question_graphs" / "swe_graph.json"
+RUBRIC_PATH = PROJECT_ROOT / "configs" / "rubrics" / "swe_rubric.json"
+
 
 class OrchestratorExecutionError(Exception):
     pass
 
 
-def run_interview_orchestrator() -> dict:
+class OrchestratorMode(str, Enum):
+    IN_PROCESS = "in_process"
+    SUBPROCESS = "subprocess"
+
+
+class InterviewExecutionService:
     """
-    Executes orchestrator/run_interview.py as a subprocess.
+    Runs interviews inside the API process on a bounded worker pool.
 
-    Returns:
-        dict: evaluation JSON loaded from outputs/final_evaluation.json
+    Configs come pre-compiled from the shared config registry and results
+    are returned in memory, so concurrent interviews never share an
+    output file.
     """
 
-    project_root = Path(__file__).resolve().parent.parent
-    orchestrator_path = project_root / "orchestrator" / "run_interview.py"
-    output_file = project_root / "outputs" / "final_evaluation.json"
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="interview-exec",
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _load_configs(self) -> tuple:
+        from orchestrator.config_registry import get_config_registry
+
+        registry = get_config_registry()
+        return (
+            registry.role_config(ROLE_CONFIG_PATH),
+            registry.question_graph(QUESTION_GRAPH_PATH),
+            registry.rubric(RUBRIC_PATH),
+        )
+
+    def _execute(
+        self,
+        answer_provider=None,
+        on_start=None,
+        mode=None,
+        on_advisory=None,
+    ) -> dict:
+        from orchestrator.run_interview import execute_interview
+
+        try:
+            if on_start is not None:
+                on_start()
+
+            if mode == OrchestratorMode.SUBPROCESS:
+                return _run_interview_subprocess()
+
+            role_config, question_graph, rubric = self._load_configs()
+            with stage_timer("orchestrator"):
+                return execute_interview(
+                    role_config,
+                    question_graph,
+                    rubric,
+                    answer_provider=answer_provider,
+                    on_advisory=on_advisory,
+                )
+        finally:
+            self._slots.release()
+
+    def submit(self, answer_provider=None, on_start=None, mode=None, on_advisory=None):
+        """
+        Schedules one interview. Returns a Future resolving to the payload
+        as soon as deterministic scoring is done.
+        on_start() is called on the worker thread before the interview runs.
+        on_advisory(artifact) receives the AI advisory once it settles
+        (in-process mode; subprocess payloads already contain it).
+        Rejects work instead of queueing without bound.
+        """
+        mode = mode or default_mode()
+
+        if not self._slots.acquire(blocking=False):
+            raise OrchestratorExecutionError("Interview execution queue is full")
+
+        try:
+            return self._executor.submit(
+                self._execute, answer_provider, on_start, mode, on_advisory
+            )
+        except RuntimeError as e:
+            self._slots.release()
+            raise OrchestratorExecutionError("Execution service is shut down") from e
+
+    def run(
+        self,
+        answer_provider=None,
+        timeout: float | None = None,
+        mode=None,
+    ) -> dict:
+        future = self.submit(answer_provider, mode=mode)
+        try:
+            return future.result(timeout=timeout)
+        except OrchestratorExecutionError:
+            raise
+        except Exception as e:
+            raise OrchestratorExecutionError("Orchestrator execution failed") from e
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+def default_mode() -> OrchestratorMode:
+    return OrchestratorMode(
+        os.getenv("ORCHESTRATOR_MODE", OrchestratorMode.IN_PROCESS.value)
+    )
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_execution_service() -> InterviewExecutionService:
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = InterviewExecutionService(
+                    max_workers=int(os.getenv("ORCHESTRATOR_MAX_WORKERS", "4")),
+                    max_pending=int(os.getenv("ORCHESTRATOR_MAX_PENDING", "64")),
+                )
+    return _service
+
+
+def _run_interview_subprocess() -> dict:
+    orchestrator_path = PROJECT_ROOT / "orchestrator" / "run_interview.py"
+    output_file = PROJECT_ROOT / "outputs" / "final_evaluation.json"
 
     if not orchestrator_path.exists():
         raise OrchestratorExecutionError("run_interview.py not found")
@@ -26,7 +151,7 @@ def run_interview_orchestrator() -> dict:
     try:
         subprocess.run(
             [sys.executable, str(orchestrator_path)],
-            cwd=project_root,
+            cwd=PROJECT_ROOT,
             check=True,
         )
     except subprocess.CalledProcessError as e:
@@ -37,3 +162,19 @@ def run_interview_orchestrator() -> dict:
 
     with open(output_file, "r", encoding="utf-8") as f:
         return json.load(f)
+
+
+def run_interview_orchestrator(mode: OrchestratorMode | None = None) -> dict:
+    """
+    Executes the interview orchestrator.
+
+    IN_PROCESS (default) runs the pipeline in this interpreter.
+    SUBPROCESS runs orchestrator/run_interview.py in a fresh interpreter
+    for full isolation. Override the default with ORCHESTRATOR_MODE.
+    Both modes run on the shared, bounded execution service.
+
+    Returns:
+        dict: evaluation payload
+    """
+
+    return get_execution_service().run(mode=mode)
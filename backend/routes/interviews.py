@@ -1,22 +1,49 @@
-from datetime import datetime
+import asyncio
+import json
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.sessions import InterviewSession, InterviewSessionStatus
-from backend.orchestrator_adapter import (
-    run_interview_orchestrator,
-    OrchestratorExecutionError,
-)
+from backend.orchestrator_adapter import OrchestratorExecutionError
+from backend.jobs import TERMINAL_STATUSES, get_job_runner
 
 # IMPORTANT:
 # Replace with your real DB dependency
-from backend.database import get_db
+from backend.database import SessionLocal, get_db
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
 
+# Seconds between status checks on the event stream
+STATUS_POLL_INTERVAL = 0.5
 
-@router.post("/start")
+
+def _session_view(session: InterviewSession) -> dict:
+    return {
+        "session_id": str(session.id),
+        "status": session.status,
+        "evaluation": session.evaluation,
+        "ai_advisory": session.ai_advisory,
+        "ai_advisory_status": session.ai_advisory_status,
+        "error_message": session.error_message,
+        "started_at": session.started_at,
+        "completed_at": session.completed_at,
+    }
+
+
+def _load_status(session_id: UUID) -> InterviewSessionStatus | None:
+    db = SessionLocal()
+    try:
+        session = db.get(InterviewSession, session_id)
+        return session.status if session else None
+    finally:
+        db.close()
+
+
+@router.post("/start", status_code=202)
 def start_interview_session(
     role_config: str,
     question_graph: str,
@@ -25,8 +52,7 @@ def start_interview_session(
     session = InterviewSession(
         role_config=role_config,
         question_graph=question_graph,
-        status=InterviewSessionStatus.RUNNING,
-        started_at=datetime.utcnow(),
+        status=InterviewSessionStatus.CREATED,
     )
 
     db.add(session)
@@ -34,24 +60,62 @@ def start_interview_session(
     db.refresh(session)
 
     try:
-        evaluation = run_interview_orchestrator()
-
-        session.status = InterviewSessionStatus.COMPLETED
-        session.completed_at = datetime.utcnow()
-        session.evaluation = evaluation
-
+        get_job_runner().enqueue(session.id)
     except OrchestratorExecutionError as e:
         session.status = InterviewSessionStatus.FAILED
         session.error_message = str(e)
-
-    db.commit()
-    db.refresh(session)
-
-    if session.status == InterviewSessionStatus.FAILED:
-        raise HTTPException(status_code=500, detail=session.error_message)
+        db.commit()
+        raise HTTPException(status_code=503, detail=session.error_message)
 
     return {
         "session_id": str(session.id),
         "status": session.status,
-        "evaluation": session.evaluation,
     }
+
+
+@router.get("/{session_id}")
+def get_interview_session(
+    session_id: UUID,
+    db: Session = Depends(get_db),
+):
+    session = db.get(InterviewSession, session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return _session_view(session)
+
+
+@router.get("/{session_id}/events")
+async def stream_interview_status(session_id: UUID):
+    """
+    Server-sent events: one `status` event per status change,
+    closing after COMPLETED or FAILED.
+    """
+    if await run_in_threadpool(_load_status, session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    runner = get_job_runner()
+
+    async def events():
+        last_status = None
+        while True:
+            # In-flight jobs are answered from memory; the DB is only
+            # consulted once the runner has let go of the session.
+            status = runner.status(session_id)
+            if status is None:
+                status = await run_in_threadpool(_load_status, session_id)
+
+            if status != last_status:
+                last_status = status
+                data = json.dumps({
+                    "session_id": str(session_id),
+                    "status": status.value if status else None,
+                })
+                yield f"event: status\ndata: {data}\n\n"
+
+            if status is None or status in TERMINAL_STATUSES:
+                break
+
+            await asyncio.sleep(STATUS_POLL_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -34,6 +34,10 @@ class InterviewSession(Base):
     question_graph = Column(String, nullable=False)
 
     evaluation = Column(JSON, nullable=True)
+
+    # Non-authoritative AI advisory, attached after the evaluation
+    ai_advisory = Column(JSON, nullable=True)
+    ai_advisory_status = Column(String, nullable=True)
     error_message = Column(String, nullable=True)
 
     started_at = Column(DateTime, nullable=True)
@@ -0,0 +1,117 @@
+"""
+Sessions started per second.
+
+Starts the same number of sessions against a fresh SQLite database two
+ways:
+- single: create row + InterviewRuntimeEngine.start_session() per session,
+          the way POST /sessions/{id}/start does
+- batch:  batch_start_sessions() in chunks, as POST /sessions/batch-start
+and checks that both leave identical session, turn and event state.
+
+Usage:
+    python -m benchmarks.batch_start [--sessions N] [--chunk-size C]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from interview_runtime.engine import InterviewRuntimeEngine, batch_start_sessions
+from interview_runtime.models import (
+    InterviewQuestionTurn,
+    InterviewRuntimeEvent,
+    InterviewSessionRuntime,
+)
+from orchestrator.adapter import get_orchestrator_adapter
+
+
+def _sessionmaker(directory: str, name: str):
+    engine = create_engine(f"sqlite:///{os.path.join(directory, name)}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def start_single(SessionLocal, orchestrator, session_ids) -> float:
+    started = time.perf_counter()
+    for session_id in session_ids:
+        with SessionLocal() as db:
+            db.add(InterviewSessionRuntime(
+                session_id=session_id,
+                state="CREATED",
+                orchestrator_graph_version=orchestrator.graph_version(),
+                runtime_version=0,
+                next_turn_index=0,
+            ))
+            db.commit()
+            engine = InterviewRuntimeEngine(db, orchestrator)
+            engine.start_session(engine.load_session(session_id), orchestrator.start_node_id())
+    return time.perf_counter() - started
+
+
+def start_batch(SessionLocal, orchestrator, session_ids, chunk_size: int) -> float:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        batch_start_sessions(db, orchestrator, session_ids, chunk_size=chunk_size)
+    return time.perf_counter() - started
+
+
+def end_state(SessionLocal) -> list:
+    # Turn ids are random; compare what they point at
+    with SessionLocal() as db:
+        turns = {t.turn_id: t for t in db.query(InterviewQuestionTurn)}
+        state = []
+        for s in db.query(InterviewSessionRuntime).order_by(InterviewSessionRuntime.session_id):
+            turn = turns[s.open_turn_id]
+            events = (
+                db.query(InterviewRuntimeEvent)
+                .filter(InterviewRuntimeEvent.session_id == s.session_id)
+                .order_by(InterviewRuntimeEvent.seq)
+            )
+            state.append((
+                s.session_id, s.state, s.current_node_id, s.next_turn_index,
+                s.next_event_seq, s.runtime_version,
+                turn.node_id, turn.turn_index, turn.attempt_count,
+                [(e.seq, e.event_type, e.runtime_version,
+                  {k: v for k, v in e.payload.items() if k != "turn_id"}) for e in events],
+            ))
+        return state
+
+
+def run(n_sessions: int = 2000, chunk_size: int = 500) -> dict:
+    orchestrator = get_orchestrator_adapter()
+    session_ids = [f"wave-{i:06d}" for i in range(n_sessions)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        single_db = _sessionmaker(directory, "single.db")
+        batch_db = _sessionmaker(directory, "batch.db")
+
+        single_seconds = start_single(single_db, orchestrator, session_ids)
+        batch_seconds = start_batch(batch_db, orchestrator, session_ids, chunk_size)
+        identical = end_state(single_db) == end_state(batch_db)
+
+    return {
+        "sessions": n_sessions,
+        "chunk_size": chunk_size,
+        "single_sessions_per_second": round(n_sessions / single_seconds, 1),
+        "batch_sessions_per_second": round(n_sessions / batch_seconds, 1),
+        "speedup": round(single_seconds / batch_seconds, 1),
+        "identical_end_state": identical,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(run(args.sessions, args.chunk_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
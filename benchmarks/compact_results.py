@@ -0,0 +1,80 @@
+"""
+Memory held by many scoring results.
+
+Scores the same synthetic candidates and keeps every result alive as:
+- dicts:    score_candidate() outputs
+- compact:  CompactEvaluation per candidate
+- table:    one ScoreTable
+and reports traced bytes per candidate for each, plus how many compact
+results do not convert back to the score_candidate() output.
+
+Usage:
+    python -m benchmarks.compact_results [--candidates N]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.fused_scoring import make_candidates
+from evaluation.compact_results import ScoreTable, score_candidate_compact
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.scoring_engine import load_rubric, score_candidate
+from orchestrator.config_registry import DEFAULT_RUBRIC
+
+
+def _traced_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def run(n_candidates: int = 10000) -> dict:
+    rubric = compile_rubric(load_rubric(DEFAULT_RUBRIC))
+    candidates = make_candidates(rubric, n_candidates)
+
+    # Warm the decode cache so it is not counted against either side
+    for candidate in candidates[:100]:
+        score_candidate_compact(candidate, rubric).to_dict()
+
+    def build_table():
+        table = ScoreTable(rubric)
+        for candidate in candidates:
+            table.append(score_candidate_compact(candidate, rubric))
+        return table
+
+    dict_bytes = _traced_bytes(lambda: [score_candidate(c, rubric) for c in candidates])
+    compact_bytes = _traced_bytes(
+        lambda: [score_candidate_compact(c, rubric) for c in candidates]
+    )
+    table_bytes = _traced_bytes(build_table)
+
+    table = build_table()
+    mismatches = sum(
+        evaluation.to_dict() != score_candidate(candidate, rubric)
+        for evaluation, candidate in zip(table, candidates)
+    )
+
+    return {
+        "candidates": n_candidates,
+        "dict_bytes_per_candidate": dict_bytes // n_candidates,
+        "compact_bytes_per_candidate": compact_bytes // n_candidates,
+        "table_bytes_per_candidate": table_bytes // n_candidates,
+        "output_mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=10000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.candidates), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Per-candidate cost of the scoring + confidence stage.
+
+Scores the same synthetic candidates two ways with a compiled rubric:
+- two_pass: evaluate_candidate() then derive_overall_confidence()
+- fused:    score_candidate()
+and reports microseconds per candidate (best of --repeat runs).
+
+Usage:
+    python -m benchmarks.fused_scoring [--candidates N] [--repeat R]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.confidence import derive_overall_confidence
+from evaluation.scoring_engine import evaluate_candidate, load_rubric, score_candidate
+from orchestrator.config_registry import DEFAULT_QUESTION_GRAPH, DEFAULT_RUBRIC
+
+
+def make_candidates(rubric, n: int, seed: int = 0) -> list:
+    """
+    One response per question graph node, with a random subset of the
+    skill's rubric evidence.
+    """
+    with open(DEFAULT_QUESTION_GRAPH, "r", encoding="utf-8") as f:
+        nodes = json.load(f)["nodes"]
+
+    rng = random.Random(seed)
+    candidates = []
+    for c in range(n):
+        responses = []
+        for node_id, node in nodes.items():
+            vocabulary = rubric.evidence_by_id[node["skill_id"]]
+            responses.append({
+                "node_id": node_id,
+                "skill_id": node["skill_id"],
+                "evidence": rng.sample(vocabulary, rng.randint(0, len(vocabulary))),
+            })
+        candidates.append({"candidate_id": f"BENCH_{c:06d}", "responses": responses})
+    return candidates
+
+
+def two_pass(candidate, rubric) -> dict:
+    scoring_output = evaluate_candidate(candidate, rubric)
+    scoring_output.update(derive_overall_confidence(scoring_output["final_scores"]))
+    return scoring_output
+
+
+def _best_us_per_candidate(fn, candidates, rubric, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for candidate in candidates:
+            fn(candidate, rubric)
+        best = min(best, time.perf_counter() - started)
+    return best / len(candidates) * 1e6
+
+
+def run(n_candidates: int = 2000, repeat: int = 5) -> dict:
+    rubric = compile_rubric(load_rubric(DEFAULT_RUBRIC))
+    candidates = make_candidates(rubric, n_candidates)
+
+    mismatches = sum(
+        two_pass(candidate, rubric) != score_candidate(candidate, rubric)
+        for candidate in candidates
+    )
+
+    two_pass_us = _best_us_per_candidate(two_pass, candidates, rubric, repeat)
+    fused_us = _best_us_per_candidate(score_candidate, candidates, rubric, repeat)
+
+    return {
+        "candidates": n_candidates,
+        "responses_per_candidate": len(candidates[0]["responses"]) if candidates else 0,
+        "two_pass_us_per_candidate": round(two_pass_us, 1),
+        "fused_us_per_candidate": round(fused_us, 1),
+        "reduction": round(1 - fused_us / two_pass_us, 3),
+        "output_mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.candidates, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Headless load generator for /interview-runtime.
+
+Each simulated candidate walks one session through the real routes:
+    start -> current-question -> answer (retries, then final) -> ...
+until the session is COMPLETED. Thousands of clients run as asyncio
+tasks against the FastAPI app in-process (httpx ASGI transport), or
+against a running server with --url.
+
+- Answers come from script files (--answers, files or directories) or
+  a seeded generator; see AnswerScript for the file format
+- "start" creates + starts the session through batch-start with one id
+  (the routes have no other way to create a runtime session);
+  --batch-start starts every session up front in one request instead
+- 409s are conflicts: the client re-reads the current question and
+  carries on; any other non-2xx (or transport error) ends the session
+
+Reports per-endpoint latency (mean, p50, p90, p99, max), error and
+conflict rates, and sessions completed per second.
+
+Usage:
+    python -m benchmarks.loadgen [--clients 1000] [--sessions N]
+        [--answers PATH ...] [--retry-rate 0.2] [--seed 0]
+        [--url http://localhost:8000 | --database-url URL]
+        [--batch-start] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from array import array
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from uuid import uuid4
+
+import httpx
+
+PREFIX = "/interview-runtime/sessions"
+
+COMPLETED = "completed"
+ENDED = "ended"          # left RUNNING without completing (e.g. FAILED)
+ERROR = "error"
+
+# Canned candidate speech for generated answers; several of these match
+# the evidence rules, so answer scoring has real work to do.
+PHRASES = (
+    "I would break this down into subproblems first.",
+    "Step one is to validate the input, then handle the edge cases.",
+    "A hash map gives constant time lookups here.",
+    "The base case stops the recursion.",
+    "I would memoize the overlapping subproblems.",
+    "I'd add logging and reproduce the bug before changing anything.",
+    "The tradeoff is latency against consistency.",
+    "We can shard by user id and cache the hot reads.",
+    "I just guess it works.",
+    "Honestly I am not sure.",
+)
+
+
+# -----------------------------
+# Answer scripts
+# -----------------------------
+
+def _payload(answer: Union[str, Dict]) -> Dict:
+    return {"transcript_text": answer} if isinstance(answer, str) else dict(answer)
+
+
+def _attempts(answer: Union[str, Dict, List]) -> List[Dict]:
+    answers = answer if isinstance(answer, list) else [answer]
+    if not answers:
+        raise ValueError("An answer needs at least one attempt")
+    return [_payload(a) for a in answers]
+
+
+class AnswerScript:
+    """
+    One candidate's answers, read from JSON:
+
+        {"answers": {"<node_id>": <answer>, ...}, "default": <answer>}
+
+    An <answer> is a string (the final transcript), an object (sent as
+    the answer payload as-is) or a list of those, where every attempt
+    but the last is sent as non-final. Nodes without an entry use
+    "default".
+    """
+
+    def __init__(self, answers: Dict[str, List[Dict]], default: Optional[List[Dict]] = None):
+        self.answers = answers
+        self.default = default or [_payload("No answer scripted.")]
+
+    @classmethod
+    def from_dict(cls, raw: Dict) -> "AnswerScript":
+        return cls(
+            {node_id: _attempts(a) for node_id, a in raw.get("answers", {}).items()},
+            _attempts(raw["default"]) if "default" in raw else None,
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "AnswerScript":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def attempts(self, node_id: str) -> List[Dict]:
+        return self.answers.get(node_id, self.default)
+
+
+class GeneratedScript:
+    """
+    Seeded random answers: one to three canned sentences per attempt,
+    with a `retry_rate` chance of each non-final attempt before the
+    final one (at most two).
+    """
+
+    def __init__(self, rng: random.Random, retry_rate: float = 0.2):
+        self.rng = rng
+        self.retry_rate = retry_rate
+
+    def _answer(self) -> Dict:
+        return _payload(" ".join(self.rng.sample(PHRASES, self.rng.randint(1, 3))))
+
+    def attempts(self, node_id: str) -> List[Dict]:
+        retries = 0
+        while retries < 2 and self.rng.random() < self.retry_rate:
+            retries += 1
+        return [self._answer() for _ in range(retries + 1)]
+
+
+def load_scripts(paths: Sequence[Union[str, Path]]) -> List[AnswerScript]:
+    """
+    Script files, and every *.json in directories, in sorted order.
+    """
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+    if not files:
+        raise ValueError("No answer scripts found")
+    return [AnswerScript.from_file(f) for f in files]
+
+
+def script_source(
+    scripts: Optional[List[AnswerScript]] = None,
+    seed: int = 0,
+    retry_rate: float = 0.2,
+) -> Callable[[int], Union[AnswerScript, GeneratedScript]]:
+    """
+    session index -> its script: files round-robin, else generated.
+    """
+    if scripts:
+        return lambda i: scripts[i % len(scripts)]
+    return lambda i: GeneratedScript(random.Random(seed * 1_000_003 + i), retry_rate)
+
+
+# -----------------------------
+# Measurements
+# -----------------------------
+
+def distribution(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Latency summary in milliseconds.
+    """
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50": round(ordered[int(last * 0.50)] * 1000, 3),
+        "p90": round(ordered[int(last * 0.90)] * 1000, 3),
+        "p99": round(ordered[int(last * 0.99)] * 1000, 3),
+        "max": round(ordered[last] * 1000, 3),
+    }
+
+
+class LoadReport:
+    def __init__(self):
+        self.latencies: Dict[str, array] = {}
+        self.status_codes: Dict[str, Dict[str, int]] = {}
+        self.outcomes: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, status: Union[int, str]):
+        self.latencies.setdefault(endpoint, array("d")).append(seconds)
+        codes = self.status_codes.setdefault(endpoint, {})
+        codes[str(status)] = codes.get(str(status), 0) + 1
+
+    def finish(self, outcome: str):
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    @staticmethod
+    def _failed(code: str) -> bool:
+        return code == "409" or not code.startswith("2")
+
+    def to_dict(self, elapsed: float) -> Dict:
+        endpoints = {}
+        requests = errors = conflicts = 0
+
+        for endpoint, samples in self.latencies.items():
+            codes = self.status_codes[endpoint]
+            n = len(samples)
+            n_conflicts = codes.get("409", 0)
+            n_errors = sum(c for code, c in codes.items() if self._failed(code)) - n_conflicts
+            endpoints[endpoint] = {
+                "requests": n,
+                "errors": n_errors,
+                "conflicts": n_conflicts,
+                "error_rate": round(n_errors / n, 4),
+                "conflict_rate": round(n_conflicts / n, 4),
+                "status_codes": dict(sorted(codes.items())),
+                "latency_ms": distribution(samples),
+            }
+            requests += n
+            errors += n_errors
+            conflicts += n_conflicts
+
+        completed = self.outcomes.get(COMPLETED, 0)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "sessions": sum(self.outcomes.values()),
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "sessions_completed_per_second": round(completed / elapsed, 2) if elapsed else 0.0,
+            "requests": requests,
+            "requests_per_second": round(requests / elapsed, 1) if elapsed else 0.0,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "conflict_rate": round(conflicts / requests, 4) if requests else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+# -----------------------------
+# Clients
+# -----------------------------
+
+async def _call(client: httpx.AsyncClient, report: LoadReport, endpoint: str,
+                method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        report.record(endpoint, time.perf_counter() - started, type(e).__name__)
+        return None
+    report.record(endpoint, time.perf_counter() - started, response.status_code)
+    return response
+
+
+async def _start(client: httpx.AsyncClient, report: LoadReport, session_ids: List[str]) -> bool:
+    response = await _call(
+        client, report, "start" if len(session_ids) == 1 else "batch_start",
+        "POST", f"{PREFIX}/batch-start", json={"session_ids": session_ids},
+    )
+    if response is None or response.status_code != 200:
+        return False
+    return all(r["status"] == "started" for r in response.json()["results"])
+
+
+async def run_session(client: httpx.AsyncClient, report: LoadReport, session_id: str,
+                      script, started: bool = False) -> str:
+    """
+    One candidate from start to COMPLETED; returns the outcome.
+    """
+    if not started and not await _start(client, report, [session_id]):
+        return ERROR
+
+    while True:
+        response = await _call(client, report, "current_question",
+                               "GET", f"{PREFIX}/{session_id}/current-question")
+        if response is None:
+            return ERROR
+        if response.status_code == 400:
+            return ENDED
+        if response.status_code != 200:
+            return ERROR
+
+        question = response.json()
+        version = question["runtime_version"]
+        attempts = script.attempts(question["node_id"])
+
+        for i, payload in enumerate(attempts):
+            response = await _call(
+                client, report, "answer", "POST", f"{PREFIX}/{session_id}/answer",
+                params={
+                    "is_final": "true" if i == len(attempts) - 1 else "false",
+                    "expected_runtime_version": version,
+                },
+                json=payload,
+            )
+            if response is None:
+                return ERROR
+            if response.status_code == 409:
+                break  # re-read the question and answer it again
+            if response.status_code != 200:
+                return ERROR
+
+            body = response.json()
+            if body["session_state"] == "COMPLETED":
+                return COMPLETED
+            if body["session_state"] != "RUNNING":
+                return ENDED
+            version = body["runtime_version"]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    clients: int,
+    sessions: Optional[int] = None,
+    scripts: Optional[Callable[[int], object]] = None,
+    batch_start: bool = False,
+) -> Dict:
+    """
+    `clients` concurrent tasks share `sessions` interviews (default: one
+    each) and run them back to back.
+    """
+    sessions = clients if sessions is None else sessions
+    scripts = scripts or script_source()
+    report = LoadReport()
+    run_id = uuid4().hex[:8]
+    session_ids = [f"load-{run_id}-{i:07d}" for i in range(sessions)]
+    next_index = iter(range(sessions))
+
+    started_at = time.perf_counter()
+    if batch_start and not await _start(client, report, session_ids):
+        raise RuntimeError("batch-start did not start every session")
+
+    async def worker():
+        for i in next_index:
+            report.finish(await run_session(
+                client, report, session_ids[i], scripts(i), started=batch_start,
+            ))
+
+    await asyncio.gather(*(worker() for _ in range(min(clients, sessions))))
+    return report.to_dict(time.perf_counter() - started_at)
+
+
+# -----------------------------
+# Targets
+# -----------------------------
+
+@asynccontextmanager
+async def in_process_client(database_url: Optional[str] = None, timeout: float = 30.0):
+    """
+    An httpx client on the app itself, on a fresh temp-file SQLite
+    database unless `database_url` is given. Must be entered before
+    anything imports backend.database, which reads DATABASE_URL once.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DATABASE_URL"] = database_url or f"sqlite:///{os.path.join(directory, 'load.db')}"
+        os.environ.setdefault("RENDER_CACHE_DIR", "")
+
+        from backend.database import Base, engine
+        from backend.main import app
+        from orchestrator.adapter import get_orchestrator_adapter
+
+        Base.metadata.create_all(engine)
+        # What the app's lifespan does; ASGITransport does not run it
+        get_orchestrator_adapter().graph()
+
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadgen",
+                                         timeout=timeout) as client:
+                yield client
+        finally:
+            engine.dispose()
+
+
+@asynccontextmanager
+async def remote_client(url: str, clients: int, timeout: float = 30.0):
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=timeout) as client:
+        yield client
+
+
+async def _main(args) -> Dict:
+    scripts = script_source(
+        load_scripts(args.answers) if args.answers else None,
+        seed=args.seed,
+        retry_rate=args.retry_rate,
+    )
+    if args.url:
+        target = remote_client(args.url, args.clients, args.timeout)
+    else:
+        target = in_process_client(args.database_url, args.timeout)
+
+    async with target as client:
+        report = await run_load(client, args.clients, args.sessions, scripts, args.batch_start)
+
+    return {
+        "target": args.url or "in-process",
+        "clients": args.clients,
+        "answers": "scripted" if args.answers else "generated",
+        **report,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=1000, help="concurrent clients")
+    parser.add_argument("--sessions", type=int, default=None,
+                        help="interviews in total (default: one per client)")
+    parser.add_argument("--answers", nargs="+", metavar="PATH",
+                        help="answer script files or directories (default: generated)")
+    parser.add_argument("--retry-rate", type=float, default=0.2,
+                        help="chance of each non-final attempt in generated answers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="a running server instead of the in-process app")
+    parser.add_argument("--database-url", help="in-process app database (default: temp SQLite)")
+    parser.add_argument("--batch-start", action="store_true",
+                        help="start every session in one request before the clients run")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request seconds")
+    parser.add_argument("--output", metavar="PATH", help="also write the report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Round trips per runtime operation.
+
+Drives one full interview through InterviewRuntimeEngine against an
+in-memory SQLite database and counts the SQL statements issued per
+operation, the way the /interview-runtime routes call it
+(load_session + engine operation).
+
+Usage:
+    python -m benchmarks.runtime_round_trips [--retries N]
+"""
+
+import argparse
+import json
+from collections import Counter
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from interview_runtime.engine import InterviewRuntimeEngine
+from interview_runtime.models import InterviewSessionRuntime
+from orchestrator.adapter import get_orchestrator_adapter
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.counts = Counter()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.counts[statement.split(None, 1)[0].upper()] += 1
+
+    @contextmanager
+    def measure(self, into: Counter):
+        before = self.counts.copy()
+        yield
+        into.update(self.counts - before)
+
+
+def run(retries_per_question: int = 1) -> dict:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    counter = StatementCounter(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    orchestrator = get_orchestrator_adapter()
+
+    with SessionLocal() as db:
+        db.add(InterviewSessionRuntime(
+            session_id="bench",
+            state="CREATED",
+            orchestrator_graph_version=orchestrator.graph_version(),
+            runtime_version=0,
+            next_turn_index=0,
+        ))
+        db.commit()
+
+    per_op = {"start": Counter(), "answer": Counter()}
+    answers = 0
+
+    with SessionLocal() as db:
+        runtime = InterviewRuntimeEngine(db, orchestrator)
+        with counter.measure(per_op["start"]):
+            session = runtime.load_session("bench")
+            runtime.start_session(session, orchestrator.start_node_id())
+
+    while True:
+        with SessionLocal() as db:
+            runtime = InterviewRuntimeEngine(db, orchestrator)
+            session = runtime.load_session("bench")
+            if session.state != "RUNNING":
+                break
+            version = session.runtime_version
+
+        for attempt in range(retries_per_question + 1):
+            is_final = attempt == retries_per_question
+            with SessionLocal() as db:
+                runtime = InterviewRuntimeEngine(db, orchestrator)
+                with counter.measure(per_op["answer"]):
+                    session = runtime.load_session("bench")
+                    runtime.submit_answer(
+                        session,
+                        answer_payload={"text": "answer"},
+                        is_final=is_final,
+                        expected_runtime_version=version,
+                    )
+            answers += 1
+
+    total = sum(per_op["answer"].values())
+    return {
+        "answers": answers,
+        "statements_per_answer": round(total / answers, 2),
+        "by_kind_per_answer": {
+            kind: round(n / answers, 2) for kind, n in sorted(per_op["answer"].items())
+        },
+        "start_statements": dict(per_op["start"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--retries", type=int, default=1,
+                        help="non-final attempts before each final answer")
+    args = parser.parse_args()
+    print(json.dumps(run(args.retries), indent=2))
+
+
+if __name__ == "__main__":
+    main()
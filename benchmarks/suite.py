@@ -0,0 +1,413 @@
+"""
+Benchmark suite: throughput, p50/p99 latency and peak memory.
+
+Cases, each run in its own subprocess so peak RSS belongs to one case:
+- scoring:  score_candidate() over a streamed synthetic corpus
+- graph:    compile + traverse synthetic question graphs (10 .. 10k nodes)
+- runtime:  full interviews through InterviewRuntimeEngine on a
+            synthetic graph (batch start, then final answers to the end)
+- api:      benchmarks.loadgen: concurrent asyncio clients driving
+            /interview-runtime on the FastAPI app until every session
+            completes
+
+Profiles: "smoke" (seconds), "laptop" (under a minute) and "large" (1M candidates, 10k-node
+graph, 1000 concurrent clients). Runtime and API cases use in-memory /
+temp-file SQLite unless --database-url points at e.g. a local Postgres
+(tables are created if missing; session ids are unique per run).
+
+Baselines:
+    python -m benchmarks.suite --save-baseline benchmarks/baselines/laptop.json
+    python -m benchmarks.suite --baseline benchmarks/baselines/laptop.json \\
+        [--tolerance 0.25] [--fail-on-regression]
+
+Metric names carry their direction: *_per_second is higher-is-better;
+*_ms, *_us and *_mb are lower-is-better; anything else is reported only.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from typing import Dict, Optional, Sequence
+from uuid import uuid4
+
+CASES = ("scoring", "graph", "runtime", "api")
+
+PROFILES = {
+    "smoke": {
+        "candidates": 1000,
+        "graph_sizes": [10, 1000],
+        "runtime_graph_nodes": 10,
+        "runtime_sessions": 10,
+        "api_clients": 20,
+    },
+    "laptop": {
+        "candidates": 20000,
+        "graph_sizes": [10, 1000, 10000],
+        "runtime_graph_nodes": 100,
+        "runtime_sessions": 50,
+        "api_clients": 50,
+    },
+    "large": {
+        "candidates": 1000000,
+        "graph_sizes": [10, 1000, 10000],
+        "runtime_graph_nodes": 10000,
+        "runtime_sessions": 200,
+        "api_clients": 1000,
+    },
+}
+
+DEFAULT_TOLERANCE = 0.25
+
+
+# -----------------------------
+# Measurement helpers
+# -----------------------------
+
+def percentiles(samples: Sequence[float], scale: float = 1000.0) -> Dict[str, float]:
+    """
+    p50 / p99 of latency samples in seconds, scaled (default: to ms).
+    """
+    if not samples:
+        return {"p50": 0.0, "p99": 0.0}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        "p50": round(ordered[int(last * 0.50)] * scale, 4),
+        "p99": round(ordered[int(last * 0.99)] * scale, 4),
+    }
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _latency_metrics(prefix: str, samples: Sequence[float]) -> Dict[str, float]:
+    p = percentiles(samples)
+    return {f"{prefix}_p50_ms": p["p50"], f"{prefix}_p99_ms": p["p99"]}
+
+
+def _sessionmaker(database_url: str):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from backend.database import Base
+
+    if database_url == "sqlite://":
+        # One shared in-memory database for every session
+        engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+# -----------------------------
+# Cases
+# -----------------------------
+
+def case_scoring(profile: Dict, database_url: str) -> Dict:
+    from benchmarks.synthetic import iter_candidates
+    from evaluation.compiled_rubric import compile_rubric
+    from evaluation.scoring_engine import load_rubric, score_candidate
+    from orchestrator.config_registry import DEFAULT_RUBRIC
+
+    rubric = compile_rubric(load_rubric(DEFAULT_RUBRIC))
+    n = profile["candidates"]
+    latencies = array("d")
+
+    started = time.perf_counter()
+    for candidate in iter_candidates(rubric, n):
+        t = time.perf_counter()
+        score_candidate(candidate, rubric)
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "candidates": n,
+        # Includes generating the synthetic input
+        "candidates_per_second": round(n / elapsed, 1),
+        **_latency_metrics("score", latencies),
+    }
+
+
+def case_graph(profile: Dict, database_url: str) -> Dict:
+    from benchmarks.synthetic import make_question_graph
+    from evaluation.compiled_rubric import compile_rubric
+    from evaluation.scoring_engine import load_rubric
+    from orchestrator.config_registry import DEFAULT_RUBRIC
+    from orchestrator.graph_compiler import compile_question_graph
+
+    skill_ids = list(compile_rubric(load_rubric(DEFAULT_RUBRIC)).skills)
+    result = {}
+
+    for n_nodes in profile["graph_sizes"]:
+        raw = make_question_graph(n_nodes, skill_ids)
+
+        started = time.perf_counter()
+        graph = compile_question_graph(raw)
+        result[f"compile_{n_nodes}_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+        # What a turn asks of the graph: next node, progress, remaining
+        lookups = array("d")
+        for node_id in graph.topological_order:
+            t = time.perf_counter()
+            graph.next_node(node_id)
+            graph.progress(node_id)
+            graph.questions_remaining(node_id)
+            lookups.append(time.perf_counter() - t)
+
+        p = percentiles(lookups, scale=1e6)
+        result[f"lookup_{n_nodes}_p50_us"] = p["p50"]
+        result[f"lookup_{n_nodes}_p99_us"] = p["p99"]
+
+    return result
+
+
+def case_runtime(profile: Dict, database_url: str) -> Dict:
+    from benchmarks.synthetic import make_question_graph
+    from evaluation.compiled_rubric import compile_rubric
+    from evaluation.scoring_engine import load_rubric
+    from interview_runtime.engine import InterviewRuntimeEngine, batch_start_sessions
+    from orchestrator.adapter import OrchestratorAdapter
+    from orchestrator.config_registry import DEFAULT_RUBRIC
+
+    skill_ids = list(compile_rubric(load_rubric(DEFAULT_RUBRIC)).skills)
+    SessionLocal = _sessionmaker(database_url)
+
+    with tempfile.TemporaryDirectory() as directory:
+        graph_path = os.path.join(directory, "graph.json")
+        with open(graph_path, "w", encoding="utf-8") as f:
+            json.dump(make_question_graph(profile["runtime_graph_nodes"], skill_ids), f)
+        orchestrator = OrchestratorAdapter(graph_path=graph_path)
+        orchestrator.graph()
+
+        run_id = uuid4().hex[:8]
+        session_ids = [f"bench-{run_id}-{i:06d}" for i in range(profile["runtime_sessions"])]
+
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            batch_start_sessions(db, orchestrator, session_ids)
+        start_seconds = time.perf_counter() - started
+
+        latencies = array("d")
+        started = time.perf_counter()
+        for session_id in session_ids:
+            while True:
+                t = time.perf_counter()
+                with SessionLocal() as db:
+                    runtime = InterviewRuntimeEngine(db, orchestrator)
+                    session = runtime.load_session(session_id)
+                    if session.state != "RUNNING":
+                        break
+                    runtime.submit_answer(
+                        session,
+                        answer_payload={"text": "answer"},
+                        is_final=True,
+                        expected_runtime_version=session.runtime_version,
+                    )
+                latencies.append(time.perf_counter() - t)
+        answer_seconds = time.perf_counter() - started
+
+    return {
+        "sessions": len(session_ids),
+        "answers": len(latencies),
+        "starts_per_second": round(len(session_ids) / start_seconds, 1),
+        "answers_per_second": round(len(latencies) / answer_seconds, 1),
+        **_latency_metrics("answer", latencies),
+    }
+
+
+def case_api(profile: Dict, database_url: str) -> Dict:
+    from benchmarks.loadgen import in_process_client, run_load
+
+    async def drive() -> Dict:
+        # In-memory SQLite is per connection; the app gets a temp file
+        url = None if database_url == "sqlite://" else database_url
+        async with in_process_client(url) as client:
+            return await run_load(client, profile["api_clients"], batch_start=True)
+
+    report = asyncio.run(drive())
+    endpoints = report["endpoints"]
+    result = {
+        "clients": profile["api_clients"],
+        "requests": report["requests"],
+        "error_rate": report["error_rate"],
+        "conflict_rate": report["conflict_rate"],
+        "batch_start_ms": endpoints["batch_start"]["latency_ms"]["max"],
+        "requests_per_second": report["requests_per_second"],
+        "sessions_completed_per_second": report["sessions_completed_per_second"],
+    }
+    for endpoint in ("current_question", "answer"):
+        latency = endpoints[endpoint]["latency_ms"]
+        result[f"{endpoint}_p50_ms"] = latency["p50"]
+        result[f"{endpoint}_p99_ms"] = latency["p99"]
+    return result
+
+
+CASE_FUNCTIONS = {
+    "scoring": case_scoring,
+    "graph": case_graph,
+    "runtime": case_runtime,
+    "api": case_api,
+}
+
+
+# -----------------------------
+# Running
+# -----------------------------
+
+def run_case(name: str, profile_name: str, database_url: str) -> Dict:
+    result = CASE_FUNCTIONS[name](PROFILES[profile_name], database_url)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def run_isolated(name: str, profile_name: str, database_url: str) -> Dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--case", name,
+         "--profile", profile_name, "--database-url", database_url],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1:] or ["failed"]}
+    return json.loads(completed.stdout)
+
+
+def run_suite(profile_name: str, cases: Sequence[str], database_url: str) -> Dict:
+    return {
+        "profile": profile_name,
+        "parameters": PROFILES[profile_name],
+        "database": database_url.split("://", 1)[0],
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "cases": {name: run_isolated(name, profile_name, database_url) for name in cases},
+    }
+
+
+# -----------------------------
+# Baselines
+# -----------------------------
+
+def _direction(metric: str) -> Optional[int]:
+    if metric.endswith("_per_second"):
+        return 1
+    if metric.endswith(("_ms", "_us", "_mb")):
+        return -1
+    return None
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = DEFAULT_TOLERANCE) -> Dict:
+    """
+    Every directional metric present in both runs, with its relative
+    change; a regression is a change for the worse beyond `tolerance`,
+    or a baseline case that errored or is missing in the current run.
+    Runs from different profiles or databases are not comparable.
+    """
+    for field in ("profile", "database"):
+        if baseline.get(field) != current.get(field):
+            raise ValueError(
+                f"Baseline {field} is {baseline.get(field)!r}, "
+                f"this run's is {current.get(field)!r}"
+            )
+
+    rows, regressions = [], []
+
+    for case, before in baseline.get("cases", {}).items():
+        metrics = current["cases"].get(case)
+        if metrics is None or "error" in metrics:
+            regressions.append({
+                "case": case,
+                "metric": "error",
+                "baseline": None,
+                "current": (metrics or {}).get("error", ["missing"]),
+                "change": None,
+            })
+            continue
+
+        for metric, value in metrics.items():
+            direction = _direction(metric)
+            old = before.get(metric)
+            if direction is None or not isinstance(old, (int, float)) or not old:
+                continue
+
+            change = (value - old) / old
+            row = {
+                "case": case,
+                "metric": metric,
+                "baseline": old,
+                "current": value,
+                "change": round(change, 3),
+            }
+            rows.append(row)
+            if change * direction < -tolerance:
+                regressions.append(row)
+
+    return {"tolerance": tolerance, "compared": rows, "regressions": regressions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="laptop")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--database-url", default="sqlite://",
+                        help="runtime/api database (default: in-memory SQLite)")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved run")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--case", choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: one case, JSON on stdout
+        print(json.dumps(run_case(args.case, args.profile, args.database_url)))
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        for field, value in (("profile", args.profile),
+                             ("database", args.database_url.split("://", 1)[0])):
+            if baseline.get(field) != value:
+                parser.error(f"baseline {field} is {baseline.get(field)!r}, not {value!r}")
+
+    result = run_suite(args.profile, args.cases, args.database_url)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+
+    if baseline is not None:
+        result["comparison"] = compare(baseline, result, args.tolerance)
+
+    print(json.dumps(result, indent=2))
+
+    if args.fail_on_regression and result.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Synthetic workloads for the benchmark suite.
+
+- make_question_graph(): a valid, acyclic question graph of any size,
+  laid out in layers so the interview length stays a fraction of the
+  node count
+- iter_candidates(): a stream of scoring inputs against a compiled
+  rubric; nothing is materialized, so 1M candidates run in flat memory
+
+Everything is seeded and reproducible.
+"""
+
+import random
+from typing import Dict, Iterator, Optional, Sequence
+
+
+def make_question_graph(
+    n_nodes: int,
+    skill_ids: Sequence[str],
+    width: Optional[int] = None,
+    seed: int = 0,
+) -> Dict:
+    """
+    Layers of `width` nodes between a single start and end node. Every
+    node moves forward to a node of the next layer; the rest of the next
+    layer is reached through conditional branch transitions.
+    """
+    if n_nodes < 2:
+        raise ValueError("A question graph needs at least 2 nodes")
+
+    rng = random.Random(seed)
+    inner = n_nodes - 2
+    width = width or max(1, min(inner, int(inner ** 0.5)))
+    layers = [["q_start"]]
+    for start in range(0, inner, width):
+        layers.append([f"q_{i:06d}" for i in range(start, min(start + width, inner))])
+    layers.append(["q_end"])
+
+    nodes = {}
+    for depth, layer in enumerate(layers):
+        following = layers[depth + 1] if depth + 1 < len(layers) else []
+
+        # Every node of the next layer gets a predecessor, so the whole
+        # graph is reachable; extra edges are conditional branches
+        targets = {node_id: [] for node_id in layer}
+        for k, target in enumerate(following):
+            targets[layer[k % len(layer)]].append(target)
+
+        for node_id in layer:
+            transitions = {}
+            if following:
+                chosen = targets[node_id] or [rng.choice(following)]
+                transitions["move_forward"] = {"then": chosen[0]}
+                for b, target in enumerate(chosen[1:]):
+                    transitions[f"branch_{b}"] = {"if": f"score >= {b % 10}", "then": target}
+            nodes[node_id] = {
+                "section": f"section_{depth % 4}",
+                "skill_id": skill_ids[(depth + len(nodes)) % len(skill_ids)],
+                "type": "conceptual",
+                "difficulty": ("easy", "medium", "hard")[depth % 3],
+                "prompt_id": f"prompt_{node_id}",
+                "transitions": transitions,
+            }
+
+    return {
+        "versioning": {"config_version": f"synthetic-{n_nodes}-{seed}"},
+        "start_node": "q_start",
+        "end_node": "q_end",
+        "nodes": nodes,
+    }
+
+
+def iter_candidates(
+    rubric,
+    n: int,
+    responses_per_candidate: int = 10,
+    seed: int = 0,
+) -> Iterator[Dict]:
+    """
+    Candidates answering `responses_per_candidate` questions, each with a
+    random subset of its skill's rubric evidence (some skills repeat, so
+    merge policies are exercised).
+    """
+    rng = random.Random(seed)
+    skill_ids = list(rubric.skills)
+
+    for c in range(n):
+        responses = []
+        for r in range(responses_per_candidate):
+            skill_id = skill_ids[(c + r) % len(skill_ids)]
+            vocabulary = rubric.evidence_by_id[skill_id]
+            responses.append({
+                "node_id": f"q_{r:06d}",
+                "skill_id": skill_id,
+                "evidence": rng.sample(vocabulary, rng.randint(0, len(vocabulary))),
+            })
+        yield {"candidate_id": f"SYN_{c:07d}", "responses": responses}
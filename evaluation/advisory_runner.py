@@ -0,0 +1,180 @@
+"""
+Advisory Runner
+---------------
+Runs the NON-AUTHORITATIVE AI advisor off the scoring path.
+
+- Deterministic scores never wait for the advisor
+- Each advisory runs on a bounded thread pool with a timeout; the
+  outcome is delivered once, as a versioned artifact with its own status
+- Cancellation budget: advisories that are queued or still running
+  (including ones already timed out) hold a slot; when none is free the
+  advisory is SKIPPED instead of piling up behind a slow model
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from evaluation.ai_score_advisor import ai_score_advisor
+
+ADVISORY_ARTIFACT_VERSION = "1.0.0"
+
+
+class AdvisoryStatus(str, Enum):
+    PENDING = "PENDING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    TIMED_OUT = "TIMED_OUT"
+    SKIPPED = "SKIPPED"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class AdvisoryHandle:
+    """
+    One advisory request. artifact() is a snapshot; the first terminal
+    outcome wins and is passed to on_done exactly once.
+    """
+
+    def __init__(self, on_done: Optional[Callable[[Dict], None]] = None):
+        self._on_done = on_done
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._started = time.perf_counter()
+        self._artifact = {
+            "artifact_version": ADVISORY_ARTIFACT_VERSION,
+            "status": AdvisoryStatus.PENDING.value,
+            "requested_at": _now(),
+            "completed_at": None,
+            "elapsed_ms": None,
+            "advisory": None,
+            "error": None,
+        }
+
+    def artifact(self) -> Dict:
+        with self._lock:
+            return dict(self._artifact)
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict:
+        self._done.wait(timeout)
+        return self.artifact()
+
+    def _resolve(
+        self,
+        status: AdvisoryStatus,
+        advisory: Optional[Dict] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        with self._lock:
+            if self._done.is_set():
+                return False
+            self._artifact.update(
+                status=status.value,
+                completed_at=_now(),
+                elapsed_ms=round((time.perf_counter() - self._started) * 1000, 1),
+                advisory=advisory,
+                error=error,
+            )
+            self._done.set()
+            artifact = dict(self._artifact)
+
+        if self._on_done is not None:
+            self._on_done(artifact)
+        return True
+
+
+class AdvisoryRunner:
+    def __init__(
+        self,
+        advisor: Callable[..., Dict] = ai_score_advisor,
+        timeout: float = 30.0,
+        max_workers: int = 4,
+        max_in_flight: int = 16,
+    ):
+        self.advisor = advisor
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="ai-advisory",
+        )
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+
+    def _run(self, handle: AdvisoryHandle, transcript_bundle: Dict, rubric):
+        try:
+            if handle.done():
+                return  # timed out while queued
+            advisory = self.advisor(transcript_bundle=transcript_bundle, rubric=rubric)
+            handle._resolve(AdvisoryStatus.COMPLETED, advisory=advisory)
+        except Exception as e:
+            handle._resolve(AdvisoryStatus.FAILED, error=f"{type(e).__name__}: {e}")
+        finally:
+            self._slots.release()
+
+    def submit(
+        self,
+        transcript_bundle: Dict,
+        rubric=None,
+        on_done: Optional[Callable[[Dict], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> AdvisoryHandle:
+        """
+        Never blocks. on_done(artifact) is called from a worker or timer
+        thread (or inline when the advisory is skipped).
+        """
+        handle = AdvisoryHandle(on_done)
+
+        if not self._slots.acquire(blocking=False):
+            handle._resolve(AdvisoryStatus.SKIPPED, error="Advisory budget exhausted")
+            return handle
+
+        try:
+            future = self._executor.submit(self._run, handle, transcript_bundle, rubric)
+        except RuntimeError:
+            self._slots.release()
+            handle._resolve(AdvisoryStatus.SKIPPED, error="Advisory runner is shut down")
+            return handle
+
+        timeout = self.timeout if timeout is None else timeout
+
+        def _expire():
+            if handle._resolve(AdvisoryStatus.TIMED_OUT, error=f"No advisory after {timeout}s"):
+                # Drops it if still queued; a running call is abandoned and
+                # keeps its slot until it returns
+                if future.cancel():
+                    self._slots.release()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.daemon = True
+        timer.start()
+        future.add_done_callback(lambda _: timer.cancel())
+
+        return handle
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_advisory_runner() -> AdvisoryRunner:
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = AdvisoryRunner(
+                    timeout=float(os.getenv("AI_ADVISORY_TIMEOUT", "30")),
+                    max_workers=int(os.getenv("AI_ADVISORY_MAX_WORKERS", "4")),
+                    max_in_flight=int(os.getenv("AI_ADVISORY_MAX_IN_FLIGHT", "16")),
+                )
+    return _runner
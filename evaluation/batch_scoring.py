@@ -0,0 +1,157 @@
+"""
+Vectorized batch scoring.
+
+Same rules and output as score_candidate, applied to many candidates
+at once:
+- evidence is interned to skill-relative ids by the compiled rubric
+- every response becomes a uint64 bitmask over its skill's evidence;
+  a candidate's responses per skill are merged with the rubric's merge
+  policy, so each (candidate, skill) is one row
+- the required / forbidden / partial decision table is evaluated with
+  NumPy bitwise ops across the whole batch
+- skill confidence, the overall confidence and the review decision come
+  from the shared scoring rules (confidence_rules.json)
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from evaluation.compiled_rubric import CompiledRubric, compile_rubric
+from evaluation.rubric_tables import RubricMasks, skill_template
+from evaluation.scoring_rules import (
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    OUTCOME_FULL,
+    OUTCOME_NONE,
+    OUTCOME_PARTIAL,
+    ScoringRules,
+    empty_confidence_counts,
+    get_scoring_rules,
+)
+from evaluation.skill_aggregation import (
+    MergePolicy,
+    merge_masks,
+    resolve_merge_policy,
+)
+
+
+def evaluate_candidates_batch(
+    inputs: Sequence[Dict],
+    rubric: Union[Dict, CompiledRubric],
+    merge_policy: Optional[Union[str, MergePolicy]] = None,
+    rules: Optional[ScoringRules] = None,
+) -> List[Dict]:
+    """
+    Scores a batch of evaluation inputs.
+    Returns one score_candidate-shaped result per input, in order.
+    """
+
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
+
+    rules = rules or get_scoring_rules()
+    masks = RubricMasks(rubric)
+    policy = resolve_merge_policy(rubric, merge_policy)
+
+    # -----------------------------
+    # Flatten responses (merged per skill)
+    # -----------------------------
+    row_skill = []
+    row_mask = []
+
+    # Per candidate: skill_id -> (row, [(node_id, mask), ...]) in
+    # first-seen skill order
+    final_rows = []
+
+    for input_data in inputs:
+        sources = {}
+        for response in input_data["responses"]:
+            skill_id = response["skill_id"]
+            sources.setdefault(skill_id, []).append((
+                response.get("node_id"),
+                masks.mask(skill_id, response.get("evidence", [])),
+            ))
+
+        rows = {}
+        for skill_id, skill_sources in sources.items():
+            rows[skill_id] = (len(row_mask), skill_sources)
+            row_skill.append(masks.skill_pos[skill_id])
+            row_mask.append(merge_masks([mask for _, mask in skill_sources], policy))
+        final_rows.append(rows)
+
+    row_skill = np.array(row_skill, dtype=np.intp)
+    provided = np.array(row_mask, dtype=np.uint64)
+
+    # -----------------------------
+    # Decision table (vectorized)
+    # -----------------------------
+    required = masks.required[row_skill]
+    matched_required = provided & required
+    matched_forbidden = provided & masks.forbidden[row_skill]
+
+    has_required = matched_required != 0
+    has_forbidden = matched_forbidden != 0
+
+    outcome = np.select(
+        [
+            has_required & has_forbidden,
+            has_forbidden,
+            matched_required == required,
+            has_required,
+        ],
+        [OUTCOME_CONFLICT, OUTCOME_FORBIDDEN, OUTCOME_FULL, OUTCOME_PARTIAL],
+        default=OUTCOME_NONE,
+    )
+
+    # -----------------------------
+    # Materialize results
+    # -----------------------------
+    outcome = outcome.tolist()
+    matched_required = matched_required.tolist()
+    matched_forbidden = matched_forbidden.tolist()
+    row_skill = row_skill.tolist()
+
+    # The outcome is fully determined by (skill, matched masks), so each
+    # distinct combination is decoded once per batch
+    templates = {}
+    results = []
+
+    for c, rows in enumerate(final_rows):
+        final_scores = {}
+        counts = empty_confidence_counts()
+        any_conflict = False
+
+        for skill_id, (row, skill_sources) in rows.items():
+            key = (row_skill[row], matched_required[row], matched_forbidden[row])
+            template = templates.get(key)
+            if template is None:
+                template = skill_template(masks, rules, key[0], outcome[row], key[1], key[2])
+                used, conflicts = template[2], template[4]
+                confidence = rules.skill_confidence(outcome[row], bool(used), bool(conflicts))
+                template = template[:1] + (confidence,) + template[2:]
+                templates[key] = template
+
+            score, confidence, used, missing, conflicts, review = template
+            final_scores[skill_id] = {
+                "score": score,
+                "confidence": confidence,
+                "evidence_used": list(used),
+                "missing_evidence": list(missing),
+                "conflicts": list(conflicts),
+                "human_review_required": review,
+                "provenance": masks.provenance(skill_id, skill_sources),
+            }
+            counts[confidence] += 1
+            any_conflict = any_conflict or bool(conflicts)
+
+        overall = rules.overall(counts, any_conflict)
+        results.append({
+            "candidate_id": inputs[c]["candidate_id"],
+            "final_scores": final_scores,
+            "overall_confidence": overall["overall_confidence"],
+            "human_review_required": overall["human_review_required"],
+            "confidence_breakdown": overall["confidence_breakdown"],
+        })
+
+    return results
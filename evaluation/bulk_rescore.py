@@ -0,0 +1,257 @@
+"""
+Bulk re-scoring
+---------------
+Streams candidate evaluation inputs through the deterministic scoring
+and confidence layers on a process pool and streams results as JSONL.
+
+Usage:
+    python -m evaluation.bulk_rescore INPUT [INPUT ...] \
+        --rubric configs/rubrics/swe_rubric.json --output results.jsonl
+
+INPUT is a .jsonl file (one input per line), a .json file (one input),
+a directory of such files, or "-" for JSONL on stdin.
+
+Each worker memoizes skill scores in memory; --cache-db adds a SQLite
+store shared by the workers and by later runs.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.scoring_cache import ScoringCache
+from evaluation.scoring_engine import load_rubric, score_candidate
+
+DEFAULT_RUBRIC = "configs/rubrics/swe_rubric.json"
+
+# Per-worker rubric and scoring cache, built once by the pool initializer
+_RUBRIC = None
+_CACHE = None
+
+
+# -----------------------------
+# Input streaming
+# -----------------------------
+
+def _iter_file(path: Path) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield json.load(f)
+
+
+def iter_inputs(sources: Iterable[str]) -> Iterator[Dict]:
+    for source in sources:
+        if source == "-":
+            for line in sys.stdin:
+                if line.strip():
+                    yield json.loads(line)
+            continue
+
+        path = Path(source)
+        if path.is_dir():
+            for child in sorted(path.iterdir()):
+                if child.suffix in (".json", ".jsonl"):
+                    yield from _iter_file(child)
+        else:
+            yield from _iter_file(path)
+
+
+def iter_chunks(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+
+_CACHE_COUNTERS = ("hits", "disk_hits", "misses")
+
+
+def _init_worker(rubric_path: str, cache_db: str | None = None):
+    global _RUBRIC, _CACHE
+    _RUBRIC = compile_rubric(load_rubric(rubric_path))
+    _CACHE = ScoringCache(cache_db)
+
+
+def score_one(candidate_input: Dict, rubric, cache: ScoringCache | None = None) -> Dict:
+    return score_candidate(candidate_input, rubric, cache=cache)
+
+
+def _score_chunk(chunk: List[Dict]) -> tuple:
+    """
+    Returns (jsonl lines, failures, seconds, cache counters for the
+    chunk). Lines are serialized in the worker so only strings cross the
+    process boundary.
+    """
+    started = time.perf_counter()
+    before = _CACHE.stats()
+    lines = []
+    failures = 0
+
+    for candidate_input in chunk:
+        try:
+            result = score_one(candidate_input, _RUBRIC, _CACHE)
+        except (KeyError, TypeError, ValueError) as e:
+            failures += 1
+            result = {
+                "candidate_id": candidate_input.get("candidate_id"),
+                "error": f"{type(e).__name__}: {e}",
+            }
+        lines.append(json.dumps(result))
+
+    after = _CACHE.stats()
+    cache_counts = {k: after[k] - before[k] for k in _CACHE_COUNTERS}
+    return lines, failures, time.perf_counter() - started, cache_counts
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+
+class _Progress:
+    def __init__(self, stream, interval: float):
+        self.stream = stream
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.candidates = 0
+        self.failures = 0
+        self.chunks = 0
+        self.chunk_seconds = []
+        self.cache = dict.fromkeys(_CACHE_COUNTERS, 0)
+
+    def record(self, n: int, failures: int, seconds: float, cache_counts: Dict):
+        self.candidates += n
+        for k, v in cache_counts.items():
+            self.cache[k] += v
+        self.failures += failures
+        self.chunks += 1
+        self.chunk_seconds.append(seconds)
+
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.stream.write(
+                f"[PROGRESS] {self.candidates} candidates "
+                f"({self.throughput():.0f}/s), {self.failures} failed, "
+                f"last chunk {seconds * 1000:.1f} ms\n"
+            )
+            self.stream.flush()
+
+    def throughput(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.candidates / elapsed if elapsed else 0.0
+
+    def summary(self) -> Dict:
+        timings = sorted(self.chunk_seconds) or [0.0]
+        lookups = sum(self.cache.values())
+        return {
+            "candidates": self.candidates,
+            "failures": self.failures,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+            "candidates_per_second": round(self.throughput(), 1),
+            "chunk_ms": {
+                "min": round(timings[0] * 1000, 2),
+                "avg": round(sum(timings) / len(timings) * 1000, 2),
+                "max": round(timings[-1] * 1000, 2),
+            },
+            "scoring_cache": {
+                **self.cache,
+                "hit_rate": round(
+                    (self.cache["hits"] + self.cache["disk_hits"]) / lookups, 4
+                ) if lookups else 0.0,
+            },
+        }
+
+
+def rescore(
+    sources: Iterable[str],
+    rubric_path: str,
+    output,
+    workers: int | None = None,
+    chunk_size: int = 500,
+    progress_interval: float = 5.0,
+    progress_stream=sys.stderr,
+    cache_db: str | None = None,
+) -> Dict:
+    """
+    Scores every input and writes one JSON line per candidate, in input
+    order. At most 2 chunks per worker are in flight, so memory stays
+    bounded regardless of corpus size.
+    """
+    progress = _Progress(progress_stream, progress_interval)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(rubric_path, cache_db),
+    ) as pool:
+        in_flight = deque()
+
+        def drain_one():
+            n, future = in_flight.popleft()
+            lines, failures, seconds, cache_counts = future.result()
+            output.write("\n".join(lines))
+            output.write("\n")
+            progress.record(n, failures, seconds, cache_counts)
+
+        for chunk in iter_chunks(iter_inputs(sources), chunk_size):
+            if len(in_flight) >= max_in_flight:
+                drain_one()
+            in_flight.append((len(chunk), pool.submit(_score_chunk, chunk)))
+
+        while in_flight:
+            drain_one()
+
+    output.flush()
+    return progress.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk deterministic re-scoring")
+    parser.add_argument("inputs", nargs="+", help=".jsonl/.json files, directories, or -")
+    parser.add_argument("--rubric", default=DEFAULT_RUBRIC)
+    parser.add_argument("--output", default="-", help="JSONL output path (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--progress-interval", type=float, default=5.0)
+    parser.add_argument("--cache-db", default=None,
+                        help="SQLite file for memoized skill scores (default: memory only)")
+    args = parser.parse_args(argv)
+
+    if args.output == "-":
+        output = sys.stdout
+        summary = rescore(args.inputs, args.rubric, output, args.workers,
+                          args.chunk_size, args.progress_interval,
+                          cache_db=args.cache_db)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            summary = rescore(args.inputs, args.rubric, output, args.workers,
+                              args.chunk_size, args.progress_interval,
+                              cache_db=args.cache_db)
+
+    sys.stderr.write(f"[DONE] {json.dumps(summary)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Compact Results
+---------------
+Scoring outputs held as rubric-relative integers, for analytics and
+re-scoring jobs that keep many evaluations in memory.
+
+- CompactEvaluation: one candidate, __slots__ only; per skill its
+  rubric index, merged evidence mask and per-node (node_id, mask)
+  sources. Evidence ids are bit positions in the rubric's vocabulary
+- ScoreTable: struct-of-arrays store for many CompactEvaluations, one
+  array per column, one row per scored skill
+- Nothing is decoded until to_dict(), which returns exactly what
+  score_candidate() returns for the same input
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from evaluation.compiled_rubric import CompiledRubric, compile_rubric
+from evaluation.rubric_tables import ScoringTables, tables_for
+from evaluation.scoring_rules import (
+    CONFIDENCE_LEVELS,
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    ScoringRules,
+    get_scoring_rules,
+)
+from evaluation.skill_aggregation import MergePolicy, merge_masks, resolve_merge_policy
+
+_LEVEL_POS = {level: i for i, level in enumerate(CONFIDENCE_LEVELS)}
+
+# (node_id, evidence mask) per response, in response order
+Sources = Tuple[Tuple[Optional[str], int], ...]
+
+
+def _node_id(node_id: Optional[str]) -> Optional[str]:
+    # Node ids repeat across every candidate; keep one copy of each
+    return sys.intern(node_id) if isinstance(node_id, str) else node_id
+
+
+@dataclass(frozen=True, slots=True)
+class CompactEvaluation:
+    candidate_id: Optional[str]
+    skills: Tuple[int, ...]              # rubric skill index, first-seen order
+    masks: Tuple[int, ...]               # merged evidence mask per skill
+    sources: Tuple[Sources, ...]         # per skill
+    overall: int                         # index into CONFIDENCE_LEVELS
+    human_review_required: bool
+    breakdown: Tuple[int, ...]           # skill count per CONFIDENCE_LEVELS
+    tables: ScoringTables = field(repr=False, compare=False)
+
+    @property
+    def overall_confidence(self) -> str:
+        return CONFIDENCE_LEVELS[self.overall]
+
+    def skill_ids(self) -> List[str]:
+        skill_ids = self.tables.masks.skill_ids
+        return [skill_ids[k] for k in self.skills]
+
+    def skill_result(self, i: int) -> Dict:
+        tables = self.tables
+        k = self.skills[i]
+        score, confidence, used, missing, conflicts, review = tables.decode(k, self.masks[i])
+        return {
+            "score": score,
+            "confidence": confidence,
+            "evidence_used": list(used),
+            "missing_evidence": list(missing),
+            "conflicts": list(conflicts),
+            "human_review_required": review,
+            "provenance": tables.masks.provenance(
+                tables.masks.skill_ids[k], self.sources[i]
+            ),
+        }
+
+    def to_dict(self) -> Dict:
+        """
+        The score_candidate() output shape; built on every call.
+        """
+        skill_ids = self.tables.masks.skill_ids
+        return {
+            "candidate_id": self.candidate_id,
+            "final_scores": {
+                skill_ids[k]: self.skill_result(i) for i, k in enumerate(self.skills)
+            },
+            "overall_confidence": self.overall_confidence,
+            "human_review_required": self.human_review_required,
+            "confidence_breakdown": dict(zip(CONFIDENCE_LEVELS, self.breakdown)),
+        }
+
+
+# -----------------------------
+# Building
+# -----------------------------
+
+def _compact(
+    candidate_id: Optional[str],
+    skills: List[int],
+    masks: List[int],
+    sources: List[Sources],
+    tables: ScoringTables,
+) -> CompactEvaluation:
+    counts = dict.fromkeys(CONFIDENCE_LEVELS, 0)
+    any_conflict = False
+
+    for k, mask in zip(skills, masks):
+        counts[tables.confidence(k, mask)] += 1
+        if tables.outcome(k, mask) in (OUTCOME_CONFLICT, OUTCOME_FORBIDDEN):
+            any_conflict = True
+
+    overall = tables.rules.overall(counts, any_conflict)
+
+    return CompactEvaluation(
+        candidate_id=candidate_id,
+        skills=tuple(skills),
+        masks=tuple(masks),
+        sources=tuple(sources),
+        overall=_LEVEL_POS[overall["overall_confidence"]],
+        human_review_required=overall["human_review_required"],
+        breakdown=tuple(counts[level] for level in CONFIDENCE_LEVELS),
+        tables=tables,
+    )
+
+
+def score_candidate_compact(
+    input_data: Dict,
+    rubric: Union[Dict, CompiledRubric],
+    merge_policy: Optional[Union[str, MergePolicy]] = None,
+    rules: Optional[ScoringRules] = None,
+) -> CompactEvaluation:
+    """
+    score_candidate() without building the result dicts; call to_dict()
+    on the result where the JSON shape is needed.
+    """
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
+
+    tables = tables_for(rubric, rules or get_scoring_rules())
+    policy = resolve_merge_policy(rubric, merge_policy)
+    masks = tables.masks
+
+    grouped: Dict[str, List[Tuple[Optional[str], int]]] = {}
+    for response in input_data["responses"]:
+        skill_id = response["skill_id"]
+        source = (
+            _node_id(response.get("node_id")),
+            masks.mask(skill_id, response.get("evidence", ())),
+        )
+        skill_sources = grouped.get(skill_id)
+        if skill_sources is None:
+            grouped[skill_id] = [source]
+        else:
+            skill_sources.append(source)
+
+    return _compact(
+        input_data["candidate_id"],
+        [masks.skill_pos[skill_id] for skill_id in grouped],
+        [merge_masks([m for _, m in s], policy) for s in grouped.values()],
+        [tuple(s) for s in grouped.values()],
+        tables,
+    )
+
+
+def compact_result(
+    result: Dict,
+    rubric: Union[Dict, CompiledRubric],
+    rules: Optional[ScoringRules] = None,
+) -> CompactEvaluation:
+    """
+    Packs an existing score_candidate() output (e.g. a bulk_rescore
+    line). The merged mask is exactly the evidence used plus conflicts,
+    so to_dict() gives the same result back.
+    """
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
+
+    tables = tables_for(rubric, rules or get_scoring_rules())
+    masks = tables.masks
+
+    skills, merged, sources = [], [], []
+    for skill_id, skill_result in result["final_scores"].items():
+        skills.append(masks.skill_pos[skill_id])
+        merged.append(masks.mask(
+            skill_id, skill_result["evidence_used"] + skill_result["conflicts"]
+        ))
+        sources.append(tuple(
+            (_node_id(entry["node_id"]), masks.mask(skill_id, entry["evidence"]))
+            for entry in skill_result.get("provenance", ())
+        ))
+
+    return _compact(result["candidate_id"], skills, merged, sources, tables)
+
+
+# -----------------------------
+# Struct-of-arrays store
+# -----------------------------
+
+class ScoreTable:
+    """
+    Many evaluations against one rubric and rule set, one array per
+    column. Rows are scored skills; candidate i owns rows
+    skill_offsets[i]:skill_offsets[i + 1], and row r owns sources
+    source_offsets[r]:source_offsets[r + 1].
+    """
+
+    def __init__(self, rubric: Union[Dict, CompiledRubric], rules: Optional[ScoringRules] = None):
+        if not isinstance(rubric, CompiledRubric):
+            rubric = compile_rubric(rubric)
+        self.tables = tables_for(rubric, rules or get_scoring_rules())
+
+        # Per candidate
+        self.candidate_ids: List[Optional[str]] = []
+        self.overall = array("B")
+        self.human_review = array("B")
+        self.breakdown = array("I")          # len(CONFIDENCE_LEVELS) per candidate
+        self.skill_offsets = array("I", [0])
+
+        # Per scored skill
+        self.skill = array("H")
+        self.mask = array("Q")
+        self.source_offsets = array("I", [0])
+
+        # Per response; node ids are indexes into node_ids
+        self.source_node = array("I")
+        self.source_mask = array("Q")
+        self.node_ids: List[Optional[str]] = []
+        self._node_pos: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def _node(self, node_id: Optional[str]) -> int:
+        pos = self._node_pos.get(node_id)
+        if pos is None:
+            pos = self._node_pos[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+        return pos
+
+    def append(self, evaluation: CompactEvaluation):
+        if evaluation.tables is not self.tables:
+            raise ValueError(
+                "Evaluation was scored with a different rubric or rule set"
+            )
+
+        self.candidate_ids.append(evaluation.candidate_id)
+        self.overall.append(evaluation.overall)
+        self.human_review.append(evaluation.human_review_required)
+        self.breakdown.extend(evaluation.breakdown)
+
+        for k, mask, sources in zip(evaluation.skills, evaluation.masks, evaluation.sources):
+            self.skill.append(k)
+            self.mask.append(mask)
+            for node_id, source_mask in sources:
+                self.source_node.append(self._node(node_id))
+                self.source_mask.append(source_mask)
+            self.source_offsets.append(len(self.source_mask))
+
+        self.skill_offsets.append(len(self.skill))
+
+    def extend(self, evaluations: Sequence[CompactEvaluation]):
+        for evaluation in evaluations:
+            self.append(evaluation)
+
+    def __getitem__(self, i: int) -> CompactEvaluation:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("ScoreTable index out of range")
+
+        rows = range(self.skill_offsets[i], self.skill_offsets[i + 1])
+        levels = len(CONFIDENCE_LEVELS)
+
+        return CompactEvaluation(
+            candidate_id=self.candidate_ids[i],
+            skills=tuple(self.skill[r] for r in rows),
+            masks=tuple(self.mask[r] for r in rows),
+            sources=tuple(
+                tuple(
+                    (self.node_ids[self.source_node[s]], self.source_mask[s])
+                    for s in range(self.source_offsets[r], self.source_offsets[r + 1])
+                )
+                for r in rows
+            ),
+            overall=self.overall[i],
+            human_review_required=bool(self.human_review[i]),
+            breakdown=tuple(self.breakdown[i * levels:(i + 1) * levels]),
+            tables=self.tables,
+        )
+
+    def __iter__(self) -> Iterator[CompactEvaluation]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self) -> Iterator[Dict]:
+        for evaluation in self:
+            yield evaluation.to_dict()
@@ -0,0 +1,134 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+from evaluation.skill_aggregation import DEFAULT_MERGE_POLICY, MergePolicy
+
+
+class RubricValidationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledRubric:
+    """
+    Immutable, pre-indexed rubric.
+    Built once per rubric version and shared by every scoring call.
+    """
+
+    rubric_version: str
+    skills: Mapping[str, Mapping[str, Any]]
+    section_of: Mapping[str, str]
+
+    # Skill-relative evidence interning:
+    # evidence_ids[skill_id][evidence] -> id, evidence_by_id[skill_id][id] -> evidence
+    evidence_ids: Mapping[str, Mapping[str, int]]
+    evidence_by_id: Mapping[str, Tuple[str, ...]]
+
+    # Deduplicated, in rubric order
+    required_evidence: Mapping[str, Tuple[str, ...]]
+    disallowed_evidence: Mapping[str, Tuple[str, ...]]
+
+    # How responses for the same skill are merged before scoring
+    merge_policy: MergePolicy = DEFAULT_MERGE_POLICY
+
+    # sha256 of the canonical rubric JSON; changes with any rubric edit,
+    # even one made without a version bump
+    content_hash: str = ""
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively converts dicts to read-only mappings and lists to tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Inverse of freeze(): returns plain, JSON-serializable dicts and lists.
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def validate_rubric(rubric: Dict) -> None:
+    if not isinstance(rubric.get("sections"), list):
+        raise RubricValidationError("Rubric has no sections")
+
+    merge_policy = rubric.get("aggregation", {}).get("merge_policy")
+    if merge_policy is not None and merge_policy not in {p.value for p in MergePolicy}:
+        raise RubricValidationError(f"Unknown merge_policy: {merge_policy}")
+
+    seen = set()
+    for section in rubric["sections"]:
+        for skill in section.get("skills", []):
+            skill_id = skill.get("skill_id")
+            if not skill_id:
+                raise RubricValidationError("Rubric skill without skill_id")
+            if skill_id in seen:
+                raise RubricValidationError(f"Duplicate rubric skill: {skill_id}")
+            seen.add(skill_id)
+
+            for field in ("required_evidence", "explicitly_disallowed_evidence"):
+                if not isinstance(skill.get(field), list):
+                    raise RubricValidationError(
+                        f"Skill {skill_id} is missing {field}"
+                    )
+
+
+def rubric_content_hash(rubric: Dict) -> str:
+    canonical = json.dumps(rubric, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_rubric(rubric: Dict) -> CompiledRubric:
+    validate_rubric(rubric)
+
+    skills = {}
+    section_of = {}
+    evidence_ids = {}
+    evidence_by_id = {}
+    required_evidence = {}
+    disallowed_evidence = {}
+    for section in rubric["sections"]:
+        for skill in section["skills"]:
+            skill_id = skill["skill_id"]
+            skills[skill_id] = freeze(skill)
+            section_of[skill_id] = section.get("section_id")
+
+            required_evidence[skill_id] = tuple(dict.fromkeys(skill["required_evidence"]))
+            disallowed_evidence[skill_id] = tuple(
+                dict.fromkeys(skill["explicitly_disallowed_evidence"])
+            )
+
+            vocabulary = tuple(dict.fromkeys(
+                skill["required_evidence"] + skill["explicitly_disallowed_evidence"]
+            ))
+            evidence_by_id[skill_id] = vocabulary
+            evidence_ids[skill_id] = MappingProxyType(
+                {evidence: i for i, evidence in enumerate(vocabulary)}
+            )
+
+    return CompiledRubric(
+        rubric_version=rubric.get("versioning", {}).get("rubric_version", ""),
+        skills=MappingProxyType(skills),
+        section_of=MappingProxyType(section_of),
+        evidence_ids=MappingProxyType(evidence_ids),
+        evidence_by_id=MappingProxyType(evidence_by_id),
+        required_evidence=MappingProxyType(required_evidence),
+        disallowed_evidence=MappingProxyType(disallowed_evidence),
+        merge_policy=MergePolicy(
+            rubric.get("aggregation", {}).get("merge_policy", DEFAULT_MERGE_POLICY)
+        ),
+        content_hash=rubric_content_hash(rubric),
+    )
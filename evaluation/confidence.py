@@ -1,62 +1,63 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from evaluation.scoring_rules import (
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    OUTCOME_FULL,
+    OUTCOME_NONE,
+    OUTCOME_PARTIAL,
+    ScoringRules,
+    empty_confidence_counts,
+    get_scoring_rules,
+)
 
 CONFIDENCE_HIGH = "HIGH"
 CONFIDENCE_MEDIUM = "MEDIUM"
 CONFIDENCE_LOW = "LOW"
 
 
-def derive_skill_confidence(skill_result: Dict[str, Any]) -> str:
-    if skill_result.get("conflicts"):
-        return CONFIDENCE_LOW
+def derive_skill_confidence(
+    skill_result: Dict[str, Any],
+    rules: Optional[ScoringRules] = None,
+) -> str:
+    rules = rules or get_scoring_rules()
 
+    conflicts = bool(skill_result.get("conflicts"))
     missing = len(skill_result.get("missing_evidence", []))
     used = len(skill_result.get("evidence_used", []))
 
-    if missing == 0 and used > 0:
-        return CONFIDENCE_HIGH
-
-    if used > 0:
-        return CONFIDENCE_MEDIUM
+    # Recover the outcome row from the result's evidence lists
+    if conflicts:
+        outcome = OUTCOME_CONFLICT if used else OUTCOME_FORBIDDEN
+    elif used:
+        outcome = OUTCOME_FULL if missing == 0 else OUTCOME_PARTIAL
+    else:
+        outcome = OUTCOME_NONE
 
-    return CONFIDENCE_LOW
+    return rules.skill_confidence(outcome, used > 0, conflicts)
 
 
-def derive_overall_confidence(final_scores: Dict[str, Any]) -> Dict[str, Any]:
-    confidence_counts = {
-        CONFIDENCE_HIGH: 0,
-        CONFIDENCE_MEDIUM: 0,
-        CONFIDENCE_LOW: 0,
-    }
+def derive_overall_confidence(
+    final_scores: Dict[str, Any],
+    rules: Optional[ScoringRules] = None,
+) -> Dict[str, Any]:
+    """
+    Confidence layer over evaluate_candidate() output. Prefer
+    scoring_engine.score_candidate(), which produces the same fields in
+    the same pass as the scores.
+    """
+    rules = rules or get_scoring_rules()
 
-    human_review_required = False
+    confidence_counts = empty_confidence_counts()
+    any_conflict = False
 
     for _, result in final_scores.items():
-        confidence = derive_skill_confidence(result)
+        confidence = derive_skill_confidence(result, rules)
         result["confidence"] = confidence
 
         confidence_counts[confidence] += 1
 
-        if confidence == CONFIDENCE_LOW:
-            human_review_required = True
-
         if result.get("conflicts"):
-            human_review_required = True
-
-    total_skills = sum(confidence_counts.values())
-    medium_ratio = confidence_counts[CONFIDENCE_MEDIUM] / max(total_skills, 1)
-
-    if medium_ratio > 0.3:
-        human_review_required = True
-
-    if confidence_counts[CONFIDENCE_LOW] > 0:
-        overall_confidence = CONFIDENCE_LOW
-    elif confidence_counts[CONFIDENCE_MEDIUM] > 0:
-        overall_confidence = CONFIDENCE_MEDIUM
-    else:
-        overall_confidence = CONFIDENCE_HIGH
+            any_conflict = True
 
-    return {
-        "overall_confidence": overall_confidence,
-        "confidence_breakdown": confidence_counts,
-        "human_review_required": human_review_required
-    }
\ No newline at end of file
+    return rules.overall(confidence_counts, any_conflict)
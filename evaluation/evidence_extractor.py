@@ -0,0 +1,277 @@
+"""
+Evidence Extractor
+------------------
+Deterministic transcript -> rubric evidence, driven by declarative
+rules (configs/evidence_rules/*.json).
+
+- Per (rubric, rules) version and content, cached process-wide: one
+  combined lookahead regex per skill (and one over every rule)
+- A transcript is scanned once with the skill's combined regex, which
+  only finds the offsets where some rule matches; each of the skill's
+  rules is then tried at those offsets, so overlapping hits of
+  different rules are all reported and other skills' rules are never
+  run
+- Patterns are case-insensitive and anchored at word starts
+- Matches carry character offsets for auditability
+- extract_streamed(): the same evidence from streamed transcript
+  segments, scanned as each final segment arrives
+- Only evidence from the rubric vocabulary can be emitted
+"""
+
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from evaluation.compiled_rubric import CompiledRubric
+
+
+class EvidenceRuleError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledEvidenceRules:
+    config_version: str
+    rubric_version: str
+    # ((evidence, (pattern, ...)), ...) in file order
+    rules: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    # sha256 of the canonical rules file; changes on any edit, even one
+    # that keeps config_version
+    content_hash: str = ""
+
+
+def compile_evidence_rules(raw: Dict) -> CompiledEvidenceRules:
+    if not isinstance(raw.get("rules"), list):
+        raise EvidenceRuleError("Evidence rules file has no rules")
+
+    rules = []
+    for position, rule in enumerate(raw["rules"]):
+        evidence = rule.get("evidence")
+        patterns = rule.get("patterns")
+        if not evidence or not isinstance(patterns, list) or not patterns:
+            raise EvidenceRuleError(f"Evidence rule {position} needs evidence and patterns")
+
+        for pattern in patterns:
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise EvidenceRuleError(f"Bad pattern for {evidence!r}: {e}")
+            if compiled.groups:
+                raise EvidenceRuleError(
+                    f"Pattern for {evidence!r} must use (?:...) instead of capturing groups"
+                )
+
+        rules.append((evidence, tuple(patterns)))
+
+    versioning = raw.get("versioning", {})
+    return CompiledEvidenceRules(
+        config_version=versioning.get("config_version", ""),
+        rubric_version=versioning.get("rubric_version", ""),
+        rules=tuple(rules),
+        content_hash=hashlib.sha256(
+            json.dumps(raw, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest(),
+    )
+
+
+class EvidenceExtractor:
+    """
+    Combined patterns for a rubric + rule set. Thread-safe; build it
+    through get_evidence_extractor() so it is compiled once per
+    version and content.
+    """
+
+    def __init__(self, rubric: CompiledRubric, rules: CompiledEvidenceRules):
+        if rules.rubric_version and rules.rubric_version != rubric.rubric_version:
+            raise EvidenceRuleError(
+                f"Evidence rules {rules.config_version} target rubric "
+                f"{rules.rubric_version}, not {rubric.rubric_version}"
+            )
+
+        vocabulary = {
+            evidence
+            for skill_evidence in rubric.evidence_by_id.values()
+            for evidence in skill_evidence
+        }
+
+        compiled = []
+        for evidence, patterns in rules.rules:
+            if evidence not in vocabulary:
+                raise EvidenceRuleError(f"Evidence not in rubric: {evidence!r}")
+            for pattern in patterns:
+                compiled.append((evidence, pattern, re.compile(pattern, re.IGNORECASE)))
+
+        self.rubric = rubric
+        self.rules_version = rules.config_version
+        # skill_id (None: every rule) -> (combined lookahead, rules)
+        self._no_rules = self._scope([])
+        self._scopes = {None: self._scope(compiled)}
+        for skill_id, allowed in rubric.evidence_ids.items():
+            self._scopes[skill_id] = self._scope(
+                [rule for rule in compiled if rule[0] in allowed]
+            )
+
+    @staticmethod
+    def _scope(compiled: List[Tuple]) -> Tuple:
+        alternatives = [f"(?:{pattern})" for _, pattern, _ in compiled]
+        combined = re.compile(
+            r"\b(?=" + "|".join(alternatives) + ")" if alternatives else "(?!)",
+            re.IGNORECASE,
+        )
+        return combined, tuple((evidence, regex) for evidence, _, regex in compiled)
+
+    def scan(self, text: str, pos: int = 0, skill_id: Optional[str] = None) -> List[Dict]:
+        """
+        Single pass over text[pos:] (word boundaries still see text
+        before pos), with the rules of skill_id only when given. Returns
+        matches in text order, every matching rule at an offset in file
+        order: {"evidence", "start", "end", "text"}.
+        """
+        combined, rules = self._scopes.get(skill_id, self._no_rules)
+        matches = []
+        for m in combined.finditer(text, pos):
+            start = m.start()
+            found = set()
+            for evidence, regex in rules:
+                hit = regex.match(text, start)
+                if hit is None or evidence in found:
+                    continue
+                found.add(evidence)
+                matches.append({
+                    "evidence": evidence,
+                    "start": start,
+                    "end": hit.end(),
+                    "text": text[start:hit.end()],
+                })
+        return matches
+
+    def extract(self, text: str, skill_id: Optional[str] = None) -> Dict:
+        """
+        Evidence for one response. With skill_id, only that skill's
+        rules are run and evidence follows rubric order.
+        """
+        return self.select(self.scan(text, skill_id=skill_id), skill_id)
+
+    def select(self, matches: List[Dict], skill_id: Optional[str] = None) -> Dict:
+        if skill_id is not None:
+            allowed = self.rubric.evidence_ids.get(skill_id, {})
+            matches = [m for m in matches if m["evidence"] in allowed]
+            found = {m["evidence"] for m in matches}
+            evidence = [e for e in self.rubric.evidence_by_id.get(skill_id, ()) if e in found]
+        else:
+            evidence = list(dict.fromkeys(m["evidence"] for m in matches))
+
+        return {
+            "evidence": evidence,
+            "matches": matches,
+        }
+
+
+class StreamingEvidenceScanner:
+    """
+    Incremental extract() over final transcript segments.
+
+    Each feed() scans only the new text plus the last `overlap`
+    characters before it, so a phrase split across segments is still
+    found, while work per answer stays linear in its length. Offsets are
+    relative to the joined transcript (segments separated by one space).
+    """
+
+    def __init__(
+        self,
+        extractor: EvidenceExtractor,
+        skill_id: Optional[str] = None,
+        overlap: int = 128,
+    ):
+        self.extractor = extractor
+        self.skill_id = skill_id
+        self.overlap = overlap
+        self._text = ""
+        self._matches: List[Dict] = []
+        self._seen = set()  # (start, evidence)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def feed(self, segment: Dict) -> List[Dict]:
+        """
+        Consumes one transcript segment; partial segments are ignored.
+        Returns the matches first seen in this call.
+        """
+        if not segment.get("is_final") or not segment["transcript_text"]:
+            return []
+
+        scan_from = max(0, len(self._text) - self.overlap)
+        if self._text:
+            self._text += " "
+        self._text += segment["transcript_text"]
+
+        new_matches = []
+        for m in self.extractor.scan(self._text, scan_from, self.skill_id):
+            key = (m["start"], m["evidence"])
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            new_matches.append(m)
+
+        self._matches.extend(new_matches)
+        return new_matches
+
+    def result(self) -> Dict:
+        """
+        Same shape as EvidenceExtractor.extract() on the whole transcript.
+        """
+        return self.extractor.select(self._matches, self.skill_id)
+
+
+async def extract_streamed(
+    segments: AsyncIterator[Dict],
+    extractor: EvidenceExtractor,
+    skill_id: Optional[str] = None,
+) -> Dict:
+    """
+    Consumes transcript segments as they arrive (e.g. from
+    transcribe_stream()) and extracts evidence from each final one, so
+    the response is ready for scoring as soon as the stream ends.
+
+    Returns the transcript, the segments (partials included) and the
+    same "evidence" / "evidence_matches" extract() gives on it.
+    """
+    scanner = StreamingEvidenceScanner(extractor, skill_id=skill_id)
+    received = []
+
+    async for segment in segments:
+        received.append(segment)
+        scanner.feed(segment)
+
+    extracted = scanner.result()
+    return {
+        "transcript_text": scanner.text,
+        "segments": received,
+        "evidence": extracted["evidence"],
+        "evidence_matches": extracted["matches"],
+    }
+
+
+_extractors: Dict[Tuple[str, str, str, str], EvidenceExtractor] = {}
+_extractors_lock = threading.Lock()
+
+
+def get_evidence_extractor(
+    rubric: CompiledRubric,
+    rules: CompiledEvidenceRules,
+) -> EvidenceExtractor:
+    # Content hashes too: a file edited without a version bump is new
+    key = (rubric.rubric_version, rubric.content_hash, rules.config_version, rules.content_hash)
+    extractor = _extractors.get(key)
+    if extractor is None:
+        with _extractors_lock:
+            extractor = _extractors.get(key)
+            if extractor is None:
+                extractor = EvidenceExtractor(rubric, rules)
+                _extractors[key] = extractor
+    return extractor
@@ -0,0 +1,208 @@
+"""
+Incremental Scoring
+-------------------
+Per-answer scoring with the same rules and output as
+score_candidate().
+
+- Each skill keeps the evidence bitmask of each of its responses (with
+  the node it came from) and their merge under the rubric's policy
+- add_response() is O(evidence): one mask, one merge, one decision-table
+  lookup and a confidence counter update (majority re-merges the
+  responses of that one skill)
+- The overall confidence / review flag come from the running counters,
+  so they are always current; snapshot() only decodes the skills
+- state() is plain JSON (the responses as evidence names, not the
+  derived counters), so the scorer can live on a session row and be
+  resumed with IncrementalScorer(rubric, state=...)
+- A state from another rubric version can be re-based onto the given
+  rubric (rebase=True): its evidence is re-masked, and skills or
+  evidence the rubric does not know are dropped
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+from evaluation.compiled_rubric import (
+    CompiledRubric,
+    RubricValidationError,
+    compile_rubric,
+)
+from evaluation.rubric_tables import tables_for
+from evaluation.scoring_rules import (
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    ScoringRules,
+    empty_confidence_counts,
+    get_scoring_rules,
+)
+from evaluation.skill_aggregation import (
+    MergePolicy,
+    merge_masks,
+    resolve_merge_policy,
+)
+
+
+class IncrementalScorer:
+    """
+    Running score for one candidate. Not thread-safe; one instance per
+    candidate / session.
+    """
+
+    def __init__(
+        self,
+        rubric: Union[Dict, CompiledRubric],
+        candidate_id: Optional[str] = None,
+        state: Optional[Dict] = None,
+        merge_policy: Optional[Union[str, MergePolicy]] = None,
+        rules: Optional[ScoringRules] = None,
+        rebase: bool = False,
+    ):
+        if not isinstance(rubric, CompiledRubric):
+            rubric = compile_rubric(rubric)
+
+        state = state or {}
+        foreign = bool(state.get("skills")) and state.get("rubric_version") != rubric.rubric_version
+        if foreign and not rebase:
+            raise RubricValidationError(
+                f"Score state was built with rubric {state.get('rubric_version')}, "
+                f"not {rubric.rubric_version}"
+            )
+
+        self.rubric = rubric
+        self.merge_policy = resolve_merge_policy(
+            rubric, state.get("merge_policy", merge_policy)
+        )
+        self.candidate_id = state.get("candidate_id", candidate_id)
+        self.rules = rules or get_scoring_rules()
+        self._tables = tables_for(rubric, self.rules)
+
+        # skill_id -> [[node_id, mask], ...] in response order; skills in
+        # first-seen order
+        self._sources: Dict[str, List[List]] = {}
+        for skill_id, sources in state.get("skills", []):
+            if skill_id not in self._tables.masks.skill_pos:
+                if foreign:
+                    continue
+                raise RubricValidationError(f"Skill {skill_id} is not in the rubric")
+            self._sources[skill_id] = [
+                [node_id, self._source_mask(skill_id, evidence, foreign)]
+                for node_id, evidence in sources
+            ]
+        # skill_id -> merged mask, and the running counters over them
+        self._merged: Dict[str, int] = {}
+        self._counts = empty_confidence_counts()
+        self._conflicts = 0
+        for skill_id, sources in self._sources.items():
+            self._merged[skill_id] = self._merge(sources)
+            self._account(skill_id, self._merged[skill_id], 1)
+
+    def _source_mask(self, skill_id: str, evidence: Union[int, List[str]], foreign: bool) -> int:
+        if not isinstance(evidence, int):
+            return self._tables.masks.mask(skill_id, evidence)
+        # Older states kept the rubric's own masks, which only that
+        # rubric version can decode
+        if foreign:
+            raise RubricValidationError(
+                "Score state keeps evidence masks and cannot be re-based"
+            )
+        return evidence
+
+    def _merge(self, sources: List[List]) -> int:
+        return merge_masks([mask for _, mask in sources], self.merge_policy)
+
+    def _account(self, skill_id: str, merged: int, delta: int):
+        tables = self._tables
+        k = tables.masks.skill_pos[skill_id]
+        self._counts[tables.confidence(k, merged)] += delta
+        if tables.outcome(k, merged) in (OUTCOME_CONFLICT, OUTCOME_FORBIDDEN):
+            self._conflicts += delta
+
+    # -----------------------------
+    # Updates
+    # -----------------------------
+
+    def add_response(
+        self,
+        skill_id: str,
+        evidence: Sequence[str],
+        node_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Records one final response and re-merges its skill.
+        Returns the skill's new result.
+        """
+        mask = self._tables.masks.mask(skill_id, evidence)
+
+        previous = self._merged.get(skill_id)
+        if previous is not None:
+            self._account(skill_id, previous, -1)
+
+        sources = self._sources.setdefault(skill_id, [])
+        sources.append([node_id, mask])
+
+        if self.merge_policy == MergePolicy.LATEST:
+            merged = mask
+        elif self.merge_policy == MergePolicy.UNION:
+            merged = (previous or 0) | mask
+        else:
+            merged = self._merge(sources)
+
+        self._merged[skill_id] = merged
+        self._account(skill_id, merged, 1)
+
+        return self.skill_result(skill_id)
+
+    # -----------------------------
+    # Views
+    # -----------------------------
+
+    def skill_result(self, skill_id: str) -> Dict:
+        tables = self._tables
+        k = tables.masks.skill_pos[skill_id]
+        score, confidence, used, missing, conflicts, review = tables.decode(
+            k, self._merged[skill_id]
+        )
+        return {
+            "score": score,
+            "confidence": confidence,
+            "evidence_used": list(used),
+            "missing_evidence": list(missing),
+            "conflicts": list(conflicts),
+            "human_review_required": review,
+            "provenance": tables.masks.provenance(skill_id, self._sources[skill_id]),
+        }
+
+    def overall(self) -> Dict:
+        """
+        Overall confidence from the running counters; O(1).
+        """
+        return self.rules.overall(self._counts, self._conflicts > 0)
+
+    def snapshot(self) -> Dict:
+        """
+        Same output as score_candidate(). Nothing is re-scored.
+        """
+        overall = self.overall()
+        return {
+            "candidate_id": self.candidate_id,
+            "final_scores": {
+                skill_id: self.skill_result(skill_id) for skill_id in self._merged
+            },
+            "overall_confidence": overall["overall_confidence"],
+            "human_review_required": overall["human_review_required"],
+            "confidence_breakdown": overall["confidence_breakdown"],
+        }
+
+    def state(self) -> Dict:
+        # Skills are a list of pairs: JSONB does not keep key order.
+        # Evidence is kept by name so any rubric version can read it.
+        evidence = self._tables.masks.evidence
+        return {
+            "rubric_version": self.rubric.rubric_version,
+            "candidate_id": self.candidate_id,
+            "merge_policy": self.merge_policy.value,
+            "skills": [
+                [skill_id, [[node_id, evidence(skill_id, mask)] for node_id, mask in sources]]
+                for skill_id, sources in self._sources.items()
+            ],
+        }
+
@@ -0,0 +1,190 @@
+"""
+Rubric Tables
+-------------
+The compiled-rubric lookup tables shared by the batch, incremental and
+compact scorers.
+
+- RubricMasks: per-skill evidence bitmasks (required / forbidden) and
+  the mask <-> evidence-name conversions
+- skill_template(): decodes one (skill, outcome, matched masks)
+  combination back to a score_skill-shaped result
+- ScoringTables: the masks as plain ints plus a bounded cache of decoded
+  (skill, mask) results; one shared instance per (rubric, rules) content
+  via tables_for()
+"""
+
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from evaluation.compiled_rubric import CompiledRubric, RubricValidationError
+from evaluation.scoring_rules import (
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    OUTCOME_FULL,
+    OUTCOME_NONE,
+    OUTCOME_PARTIAL,
+    ScoringRules,
+    classify_outcome,
+)
+
+MAX_EVIDENCE_PER_SKILL = 64
+
+
+class RubricMasks:
+    """
+    Per-skill bitmasks for one compiled rubric.
+    """
+
+    def __init__(self, rubric: CompiledRubric):
+        self.skill_ids = tuple(rubric.skills)
+        self.skill_pos = {skill_id: i for i, skill_id in enumerate(self.skill_ids)}
+        self.evidence_ids = rubric.evidence_ids
+        self.evidence_by_id = rubric.evidence_by_id
+
+        required = []
+        forbidden = []
+        self.required_order = []
+        self.forbidden_order = []
+
+        for skill_id in self.skill_ids:
+            ids = rubric.evidence_ids[skill_id]
+            if len(ids) > MAX_EVIDENCE_PER_SKILL:
+                raise RubricValidationError(
+                    f"Skill {skill_id} has more than {MAX_EVIDENCE_PER_SKILL} evidence items"
+                )
+
+            skill = rubric.skills[skill_id]
+            req_order = tuple(dict.fromkeys(skill["required_evidence"]))
+            forb_order = tuple(dict.fromkeys(skill["explicitly_disallowed_evidence"]))
+
+            required.append(sum(1 << ids[e] for e in req_order))
+            forbidden.append(sum(1 << ids[e] for e in forb_order))
+            self.required_order.append(tuple((e, 1 << ids[e]) for e in req_order))
+            self.forbidden_order.append(tuple((e, 1 << ids[e]) for e in forb_order))
+
+        self.required = np.array(required, dtype=np.uint64)
+        self.forbidden = np.array(forbidden, dtype=np.uint64)
+
+    def mask(self, skill_id: str, evidence: Sequence[str]) -> int:
+        ids = self.evidence_ids[skill_id]
+        mask = 0
+        for item in evidence:
+            bit = ids.get(item)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def evidence(self, skill_id: str, mask: int) -> List[str]:
+        return [
+            e for i, e in enumerate(self.evidence_by_id[skill_id]) if mask >> i & 1
+        ]
+
+    def provenance(self, skill_id: str, sources) -> List[Dict]:
+        return [
+            {"node_id": node_id, "evidence": self.evidence(skill_id, mask)}
+            for node_id, mask in sources
+        ]
+
+
+def skill_template(masks: RubricMasks, rules: ScoringRules, k: int, outcome: int,
+                    matched_required: int, matched_forbidden: int) -> tuple:
+    """
+    Decodes one (skill, outcome, matched masks) combination back to
+    evidence strings in rubric order.
+    """
+    req_order = masks.required_order[k]
+
+    used = ()
+    missing = ()
+    conflicts = ()
+
+    if outcome in (OUTCOME_CONFLICT, OUTCOME_FULL, OUTCOME_PARTIAL):
+        used = tuple(e for e, bit in req_order if matched_required & bit)
+
+    if outcome in (OUTCOME_CONFLICT, OUTCOME_PARTIAL):
+        missing = tuple(e for e, bit in req_order if not matched_required & bit)
+    elif outcome in (OUTCOME_FORBIDDEN, OUTCOME_NONE):
+        missing = tuple(e for e, _ in req_order)
+
+    if outcome in (OUTCOME_CONFLICT, OUTCOME_FORBIDDEN):
+        conflicts = tuple(
+            e for e, bit in masks.forbidden_order[k] if matched_forbidden & bit
+        )
+
+    return (
+        rules.outcome_score[outcome],
+        rules.outcome_confidence[outcome],
+        used,
+        missing,
+        conflicts,
+        rules.outcome_review[outcome],
+    )
+
+
+# Bound on cached (skill, mask) decodings per rubric
+MAX_DECODED = 4096
+
+
+class ScoringTables:
+    """
+    Rubric masks as plain ints, plus decoded results per
+    (skill, mask) so repeated snapshots do not decode again.
+    """
+
+    def __init__(self, rubric: CompiledRubric, rules: ScoringRules):
+        self.rules = rules
+        self.masks = RubricMasks(rubric)
+        self.required = tuple(int(m) for m in self.masks.required)
+        self.forbidden = tuple(int(m) for m in self.masks.forbidden)
+        self._decoded: Dict[Tuple[int, int], tuple] = {}
+
+    def outcome(self, k: int, mask: int) -> int:
+        matched_required = mask & self.required[k]
+        return classify_outcome(
+            bool(matched_required),
+            bool(mask & self.forbidden[k]),
+            matched_required == self.required[k],
+        )
+
+    def confidence(self, k: int, mask: int) -> str:
+        return self.decode(k, mask)[1]
+
+    def decode(self, k: int, mask: int) -> tuple:
+        key = (k, mask)
+        decoded = self._decoded.get(key)
+        if decoded is None:
+            outcome = self.outcome(k, mask)
+            decoded = skill_template(
+                self.masks,
+                self.rules,
+                k,
+                outcome,
+                mask & self.required[k],
+                mask & self.forbidden[k],
+            )
+            used, conflicts = decoded[2], decoded[4]
+            confidence = self.rules.skill_confidence(outcome, bool(used), bool(conflicts))
+            decoded = decoded[:1] + (confidence,) + decoded[2:]
+            if len(self._decoded) >= MAX_DECODED:
+                self._decoded.clear()
+            self._decoded[key] = decoded
+        return decoded
+
+
+_tables: Dict[Tuple[str, str, str, str], ScoringTables] = {}
+_tables_lock = threading.Lock()
+
+
+def tables_for(rubric: CompiledRubric, rules: ScoringRules) -> ScoringTables:
+    # Content hashes too: a file edited without a version bump is new
+    key = (rubric.rubric_version, rubric.content_hash, rules.config_version, rules.content_hash)
+    tables = _tables.get(key)
+    if tables is None:
+        with _tables_lock:
+            tables = _tables.get(key)
+            if tables is None:
+                tables = ScoringTables(rubric, rules)
+                _tables[key] = tables
+    return tables
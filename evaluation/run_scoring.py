@@ -1,6 +1,5 @@
 import json
-from evaluation.scoring_engine import load_rubric, evaluate_candidate
-from evaluation.confidence import derive_overall_confidence
+from evaluation.scoring_engine import load_rubric, score_candidate
 
 # Load rubric
 rubric = load_rubric(
@@ -11,11 +10,7 @@ rubric = load_rubric(
 with open("evaluation/sample_input.json") as f:
     candidate_input = json.load(f)
 
-# Deterministic scoring
-scoring_output = evaluate_candidate(candidate_input, rubric)
-
-# Confidence layer
-confidence_result = derive_overall_confidence(scoring_output["final_scores"])
-scoring_output.update(confidence_result)
+# Deterministic scoring + confidence (one pass)
+scoring_output = score_candidate(candidate_input, rubric)
 
 print(json.dumps(scoring_output, indent=2))
\ No newline at end of file
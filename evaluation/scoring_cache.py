@@ -0,0 +1,267 @@
+"""
+Scoring Cache
+-------------
+Memoized skill scores. Scoring a skill is pure: the same rubric, rule
+set, skill and merged evidence always give the same result, so results
+are cached under
+
+    sha256(scoring hash, skill_id, sorted evidence)
+
+where the scoring hash covers the rubric content and the scoring rules.
+
+- Bounded in-memory LRU in front of an optional SQLite store (survives
+  restarts, shareable between re-scoring workers)
+- Hit / miss counters and hit rate via stats()
+- A rubric version seen with a new scoring hash (rubric edited or rules
+  changed) drops every entry cached under its previous hash
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from evaluation.compiled_rubric import CompiledRubric
+from evaluation.scoring_rules import ScoringRules
+
+# (outcome, skill result without provenance)
+Scored = Tuple[int, Dict]
+
+
+def scoring_hash(rubric: CompiledRubric, rules: ScoringRules) -> str:
+    rules_fields = asdict(rules)
+    rules_fields["review_levels"] = sorted(rules.review_levels)
+    canonical = json.dumps(
+        {"rubric": rubric.content_hash, "rules": rules_fields},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def skill_key(scoring_hash_: str, skill_id: str, evidence: Iterable[str]) -> str:
+    canonical = json.dumps(
+        [scoring_hash_, skill_id, sorted(evidence)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _copy(scored: Scored) -> Scored:
+    outcome, result = scored
+    return outcome, {
+        "score": result["score"],
+        "confidence": result["confidence"],
+        "evidence_used": list(result["evidence_used"]),
+        "missing_evidence": list(result["missing_evidence"]),
+        "conflicts": list(result["conflicts"]),
+        "human_review_required": result["human_review_required"],
+    }
+
+
+class ScoringCache:
+    """
+    Thread-safe two-level cache. Callers get a private copy of each
+    result.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 65536):
+        self.path = path
+        self.max_entries = max_entries
+        # key -> (scoring hash, scored)
+        self._entries: "OrderedDict[str, Tuple[str, Scored]]" = OrderedDict()
+        # (rubric version + content hash, rules version + content hash) -> scoring
+        # hash, for versions already checked; one small entry per version
+        self._hashes: Dict[Tuple[str, str, str, str], str] = {}
+        # rubric_version -> scoring hash currently in use
+        self._current: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS skill_scores ("
+                "key TEXT PRIMARY KEY, scoring_hash TEXT NOT NULL, value TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS ix_skill_scores_hash ON skill_scores (scoring_hash)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rubric_hashes ("
+                "rubric_version TEXT PRIMARY KEY, scoring_hash TEXT NOT NULL)"
+            )
+
+    # -----------------------------
+    # Invalidation
+    # -----------------------------
+
+    def _drop(self, old_hash: str):
+        # Caller holds the lock
+        self._entries = OrderedDict(
+            (key, entry) for key, entry in self._entries.items() if entry[0] != old_hash
+        )
+        if self._db is not None:
+            self._db.execute("DELETE FROM skill_scores WHERE scoring_hash = ?", (old_hash,))
+        self.invalidations += 1
+
+    def _activate(self, rubric_version: str, new_hash: str):
+        # Caller holds the lock
+        previous = self._current.get(rubric_version)
+        if previous is None and self._db is not None:
+            row = self._db.execute(
+                "SELECT scoring_hash FROM rubric_hashes WHERE rubric_version = ?",
+                (rubric_version,),
+            ).fetchone()
+            previous = row[0] if row else None
+
+        if previous == new_hash:
+            self._current[rubric_version] = new_hash
+            return
+
+        if previous is not None:
+            self._drop(previous)
+        self._current[rubric_version] = new_hash
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO rubric_hashes (rubric_version, scoring_hash) VALUES (?, ?)",
+                (rubric_version, new_hash),
+            )
+
+    def scoring_hash(self, rubric: CompiledRubric, rules: ScoringRules) -> str:
+        """
+        Hash for a (rubric, rules) pair, invalidating the rubric version's
+        previous entries if it changed.
+        """
+        versions = (
+            rubric.rubric_version, rubric.content_hash,
+            rules.config_version, rules.content_hash,
+        )
+        checked = self._hashes.get(versions)
+        if checked is not None:
+            return checked
+
+        new_hash = scoring_hash(rubric, rules)
+        with self._lock:
+            self._activate(rubric.rubric_version, new_hash)
+            self._hashes[versions] = new_hash
+        return new_hash
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current.clear()
+            self._hashes.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM skill_scores")
+                self._db.execute("DELETE FROM rubric_hashes")
+
+    # -----------------------------
+    # Storage
+    # -----------------------------
+
+    def _read_disk(self, key: str) -> Optional[Scored]:
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM skill_scores WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        outcome, result = json.loads(row[0])
+        return outcome, result
+
+    def _write_disk(self, key: str, hash_: str, scored: Scored):
+        if self._db is None:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO skill_scores (key, scoring_hash, value) VALUES (?, ?, ?)",
+                (key, hash_, json.dumps(scored, separators=(",", ":"))),
+            )
+
+    def _remember(self, key: str, hash_: str, scored: Scored):
+        with self._lock:
+            self._entries[key] = (hash_, scored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+
+    def get_or_score(
+        self,
+        rubric: CompiledRubric,
+        rules: ScoringRules,
+        skill_id: str,
+        evidence: Iterable[str],
+        score: Callable[[], Scored],
+    ) -> Scored:
+        hash_ = self.scoring_hash(rubric, rules)
+        key = skill_key(hash_, skill_id, evidence)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(entry[1])
+
+        scored = self._read_disk(key)
+        if scored is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            # Concurrent misses may both score; the result is identical
+            scored = score()
+            self._write_disk(key, hash_, scored)
+            with self._lock:
+                self.misses += 1
+
+        self._remember(key, hash_, scored)
+        return _copy(scored)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_scoring_cache() -> ScoringCache:
+    """
+    Process-wide cache configured from SCORING_CACHE_DB (SQLite path; ""
+    or unset keeps it in memory only) and SCORING_CACHE_MAX_ENTRIES.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ScoringCache(
+                    path=os.getenv("SCORING_CACHE_DB", "") or None,
+                    max_entries=int(os.getenv("SCORING_CACHE_MAX_ENTRIES", "65536")),
+                )
+    return _cache
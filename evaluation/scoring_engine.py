@@ -1,5 +1,24 @@
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from evaluation.compiled_rubric import CompiledRubric, compile_rubric
+from evaluation.scoring_cache import ScoringCache
+from evaluation.scoring_rules import (
+    OUTCOME_CONFLICT,
+    OUTCOME_FORBIDDEN,
+    OUTCOME_FULL,
+    OUTCOME_PARTIAL,
+    ScoringRules,
+    classify_outcome,
+    empty_confidence_counts,
+    get_scoring_rules,
+)
+from evaluation.skill_aggregation import (
+    MergePolicy,
+    group_responses,
+    merge_evidence,
+    resolve_merge_policy,
+)
 
 
 def load_rubric(path: str) -> Dict:
@@ -7,108 +26,149 @@ def load_rubric(path: str) -> Dict:
         return json.load(f)
 
 
-def score_skill(skill_rubric: Dict, provided_evidence: List[str]) -> Dict:
-    required = set(skill_rubric["required_evidence"])
-    forbidden = set(skill_rubric["explicitly_disallowed_evidence"])
-    provided = set(provided_evidence)
-
-    matched_required = required & provided
-    matched_forbidden = forbidden & provided
-    missing_required = required - provided
-
-    # Conflict case
-    if matched_required and matched_forbidden:
-        return {
-            "score": 4,
-            "confidence": "LOW",
-            "evidence_used": list(matched_required),
-            "missing_evidence": list(missing_required),
-            "conflicts": list(matched_forbidden),
-            "human_review_required": True
-        }
-
-    # Forbidden evidence only
-    if matched_forbidden:
-        return {
-            "score": 3,
-            "confidence": "LOW",
-            "evidence_used": [],
-            "missing_evidence": list(required),
-            "conflicts": list(matched_forbidden),
-            "human_review_required": True
-        }
-
-    # Full evidence
-    if matched_required == required:
-        return {
-            "score": 9,
-            "confidence": "HIGH",
-            "evidence_used": list(matched_required),
-            "missing_evidence": [],
-            "conflicts": [],
-            "human_review_required": False
-        }
-
-    # Partial evidence
-    if matched_required:
-        return {
-            "score": 6,
-            "confidence": "MEDIUM",
-            "evidence_used": list(matched_required),
-            "missing_evidence": list(missing_required),
-            "conflicts": [],
-            "human_review_required": False
-        }
-
-    # No evidence
-    return {
-        "score": 2,
-        "confidence": "LOW",
-        "evidence_used": [],
-        "missing_evidence": list(required),
-        "conflicts": [],
-        "human_review_required": True
+def _score_skill(
+    required: Sequence[str],
+    forbidden: Sequence[str],
+    provided: Set[str],
+    rules: ScoringRules,
+) -> Tuple[int, Dict]:
+    # Evidence lists keep rubric order so output is stable across runs
+
+    matched_required = [e for e in required if e in provided]
+    matched_forbidden = [e for e in forbidden if e in provided]
+    missing_required = [e for e in required if e not in provided]
+
+    outcome = classify_outcome(
+        bool(matched_required),
+        bool(matched_forbidden),
+        not missing_required,
+    )
+
+    if outcome in (OUTCOME_CONFLICT, OUTCOME_PARTIAL):
+        used, missing = matched_required, missing_required
+    elif outcome == OUTCOME_FULL:
+        used, missing = matched_required, []
+    else:  # forbidden evidence only, or no evidence
+        used, missing = [], list(required)
+
+    return outcome, {
+        "score": rules.outcome_score[outcome],
+        "confidence": rules.outcome_confidence[outcome],
+        "evidence_used": used,
+        "missing_evidence": missing,
+        "conflicts": matched_forbidden if outcome in (OUTCOME_CONFLICT, OUTCOME_FORBIDDEN) else [],
+        "human_review_required": rules.outcome_review[outcome]
     }
 
 
-def evaluate_candidate(input_data: Dict, rubric: Dict) -> Dict:
+def score_skill(
+    skill_rubric: Dict,
+    provided_evidence: List[str],
+    rules: Optional[ScoringRules] = None,
+) -> Dict:
+    return _score_skill(
+        tuple(dict.fromkeys(skill_rubric["required_evidence"])),
+        tuple(dict.fromkeys(skill_rubric["explicitly_disallowed_evidence"])),
+        set(provided_evidence),
+        rules or get_scoring_rules(),
+    )[1]
+
+
+def _score_merged(
+    rubric: CompiledRubric,
+    skill_id: str,
+    provided: Set[str],
+    rules: ScoringRules,
+    cache: Optional[ScoringCache],
+) -> Tuple[int, Dict]:
+    def score():
+        return _score_skill(
+            rubric.required_evidence[skill_id],
+            rubric.disallowed_evidence[skill_id],
+            provided,
+            rules
+        )
+
+    if cache is None:
+        return score()
+    return cache.get_or_score(rubric, rules, skill_id, provided, score)
+
+
+def evaluate_candidate(
+    input_data: Dict,
+    rubric: Union[Dict, CompiledRubric],
+    merge_policy: Optional[Union[str, MergePolicy]] = None,
+    rules: Optional[ScoringRules] = None,
+    cache: Optional[ScoringCache] = None,
+) -> Dict:
     """
     Pure deterministic scoring engine.
     No AI, no heuristics, no ML.
+
+    Kept for existing callers; the same as score_candidate(), so skill
+    confidence, overall confidence and the review decision come from the
+    one rule set in confidence_rules.json.
     """
+    return score_candidate(input_data, rubric, merge_policy, rules, cache)
 
-    results = {}
-    human_review = False
 
-    rubric_skills = {
-        skill["skill_id"]: skill
-        for section in rubric["sections"]
-        for skill in section["skills"]
-    }
+def score_candidate(
+    input_data: Dict,
+    rubric: Union[Dict, CompiledRubric],
+    merge_policy: Optional[Union[str, MergePolicy]] = None,
+    rules: Optional[ScoringRules] = None,
+    cache: Optional[ScoringCache] = None,
+) -> Dict:
+    """
+    Fused scoring + confidence stage.
+
+    One traversal of the merged skills yields the scores, each skill's
+    confidence, the confidence breakdown and the review decision, all
+    from the same rule set. Pass a CompiledRubric to skip re-indexing
+    the rubric on every call. Responses for the same skill are merged
+    first (merge_policy, default from the rubric), so each skill is
+    scored once. With a cache, skill results are memoized per (rubric,
+    rules, skill, merged evidence). derive_overall_confidence() over the
+    result gives the same fields again.
+    """
+
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
 
-    for response in input_data["responses"]:
-        skill_id = response["skill_id"]
-        skill_rubric = rubric_skills[skill_id]
+    rules = rules or get_scoring_rules()
+    policy = resolve_merge_policy(rubric, merge_policy)
 
-        skill_result = score_skill(
-            skill_rubric,
-            response.get("evidence", [])
+    results = {}
+    counts = empty_confidence_counts()
+    any_conflict = False
+
+    for skill_id, provenance in group_responses(input_data["responses"], rubric).items():
+        outcome, skill_result = _score_merged(
+            rubric,
+            skill_id,
+            merge_evidence(provenance, policy),
+            rules,
+            cache
         )
 
+        conflicts = bool(skill_result["conflicts"])
+        if skill_result["evidence_used"] or conflicts:
+            confidence = skill_result["confidence"]
+        else:
+            confidence = rules.confidence_without_evidence
+        skill_result["confidence"] = confidence
+        skill_result["provenance"] = provenance
+
         results[skill_id] = skill_result
+        counts[confidence] += 1
+        any_conflict = any_conflict or conflicts
 
-        if skill_result["human_review_required"]:
-            human_review = True
-
-    overall_confidence = (
-        "HIGH" if all(r["confidence"] == "HIGH" for r in results.values())
-        else "MEDIUM" if not human_review
-        else "LOW"
-    )
+    overall = rules.overall(counts, any_conflict)
 
     return {
         "candidate_id": input_data["candidate_id"],
         "final_scores": results,
-        "overall_confidence": overall_confidence,
-        "human_review_required": human_review
-    }
\ No newline at end of file
+        "overall_confidence": overall["overall_confidence"],
+        "human_review_required": overall["human_review_required"],
+        "confidence_breakdown": overall["confidence_breakdown"],
+    }
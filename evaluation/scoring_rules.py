@@ -0,0 +1,180 @@
+"""
+Scoring Rules
+-------------
+The single deterministic rule set behind skill scores, skill confidence
+and the human-review decision, compiled from the "scoring_rules" block
+of evaluation/confidence_rules.json.
+
+- Outcome table: one row per decision (conflict, forbidden, full,
+  partial, none) with its score, confidence and review flag
+- A skill that used no evidence and has no conflicts is given
+  confidence_without_evidence, whatever its outcome row says
+- Overall confidence is the first level in `precedence` that any skill
+  has; review is required for any skill at a review level, any conflict,
+  or a MEDIUM share above max_medium_ratio
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+DEFAULT_CONFIDENCE_RULES = Path(__file__).resolve().parent / "confidence_rules.json"
+
+# Decision table rows, in the precedence order used by score_skill
+OUTCOME_CONFLICT = 0
+OUTCOME_FORBIDDEN = 1
+OUTCOME_FULL = 2
+OUTCOME_PARTIAL = 3
+OUTCOME_NONE = 4
+
+OUTCOME_NAMES = ("conflict", "forbidden", "full", "partial", "none")
+
+CONFIDENCE_LEVELS = ("HIGH", "MEDIUM", "LOW")
+
+
+class ScoringRulesError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ScoringRules:
+    config_version: str
+
+    # Indexed by OUTCOME_*
+    outcome_score: Tuple[int, ...]
+    outcome_confidence: Tuple[str, ...]
+    outcome_review: Tuple[bool, ...]
+
+    confidence_without_evidence: str
+    precedence: Tuple[str, ...]
+    review_levels: frozenset
+    review_on_conflict: bool
+    max_medium_ratio: float
+
+    # sha256 of the canonical scoring_rules block; changes on any edit,
+    # even one that keeps config_version
+    content_hash: str = ""
+
+    def skill_confidence(self, outcome: int, used: bool, conflicts: bool) -> str:
+        if not used and not conflicts:
+            return self.confidence_without_evidence
+        return self.outcome_confidence[outcome]
+
+    def overall(self, counts: Dict[str, int], any_conflict: bool) -> Dict:
+        """
+        Overall confidence and review decision from per-level skill counts.
+        """
+        total = sum(counts.values())
+        medium_ratio = counts["MEDIUM"] / max(total, 1)
+
+        human_review_required = (
+            any(counts[level] for level in self.review_levels)
+            or (self.review_on_conflict and any_conflict)
+            or medium_ratio > self.max_medium_ratio
+        )
+
+        overall_confidence = next(
+            (level for level in self.precedence if counts[level] > 0),
+            self.precedence[-1],
+        )
+
+        return {
+            "overall_confidence": overall_confidence,
+            "confidence_breakdown": dict(counts),
+            "human_review_required": human_review_required,
+        }
+
+
+def empty_confidence_counts() -> Dict[str, int]:
+    return {level: 0 for level in CONFIDENCE_LEVELS}
+
+
+def classify_outcome(has_required: bool, has_forbidden: bool, required_complete: bool) -> int:
+    if has_required and has_forbidden:
+        return OUTCOME_CONFLICT
+    if has_forbidden:
+        return OUTCOME_FORBIDDEN
+    if required_complete:
+        return OUTCOME_FULL
+    if has_required:
+        return OUTCOME_PARTIAL
+    return OUTCOME_NONE
+
+
+def compile_scoring_rules(raw: Dict) -> ScoringRules:
+    block = raw.get("scoring_rules")
+    if not isinstance(block, dict):
+        raise ScoringRulesError("Confidence rules file has no scoring_rules")
+
+    def _level(value, where: str) -> str:
+        if value not in CONFIDENCE_LEVELS:
+            raise ScoringRulesError(f"{where} must be one of {', '.join(CONFIDENCE_LEVELS)}")
+        return value
+
+    outcomes = block.get("outcomes", {})
+    rows = []
+    for name in OUTCOME_NAMES:
+        row = outcomes.get(name)
+        if not isinstance(row, dict):
+            raise ScoringRulesError(f"Missing outcome rule: {name}")
+        if not isinstance(row.get("score"), int) or not isinstance(row.get("human_review"), bool):
+            raise ScoringRulesError(f"Outcome {name} needs an integer score and a boolean human_review")
+        rows.append((
+            row["score"],
+            _level(row.get("confidence"), f"Outcome {name} confidence"),
+            row["human_review"],
+        ))
+
+    overall = block.get("overall", {})
+    precedence = tuple(overall.get("precedence", ()))
+    if sorted(precedence) != sorted(CONFIDENCE_LEVELS):
+        raise ScoringRulesError("overall.precedence must list every confidence level once")
+
+    max_medium_ratio = overall.get("max_medium_ratio")
+    if not isinstance(max_medium_ratio, (int, float)):
+        raise ScoringRulesError("overall.max_medium_ratio must be a number")
+
+    return ScoringRules(
+        config_version=block.get("config_version", ""),
+        outcome_score=tuple(r[0] for r in rows),
+        outcome_confidence=tuple(r[1] for r in rows),
+        outcome_review=tuple(r[2] for r in rows),
+        confidence_without_evidence=_level(
+            block.get("confidence_without_evidence"),
+            "confidence_without_evidence",
+        ),
+        precedence=precedence,
+        review_levels=frozenset(
+            _level(level, "overall.human_review_levels")
+            for level in overall.get("human_review_levels", ())
+        ),
+        review_on_conflict=bool(overall.get("human_review_on_conflict", True)),
+        max_medium_ratio=float(max_medium_ratio),
+        content_hash=hashlib.sha256(
+            json.dumps(block, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest(),
+    )
+
+
+def load_scoring_rules(path=DEFAULT_CONFIDENCE_RULES) -> ScoringRules:
+    with open(path, "r", encoding="utf-8") as f:
+        return compile_scoring_rules(json.load(f))
+
+
+_rules: Optional[ScoringRules] = None
+_rules_lock = threading.Lock()
+
+
+def get_scoring_rules() -> ScoringRules:
+    """
+    The packaged rule set, loaded once per process.
+    """
+    global _rules
+    if _rules is None:
+        with _rules_lock:
+            if _rules is None:
+                _rules = load_scoring_rules()
+    return _rules
@@ -0,0 +1,106 @@
+"""
+Skill Aggregation
+-----------------
+Merges the evidence of every response for a skill before it is scored,
+so skills asked at several nodes are judged on all of their answers.
+
+- One pass over the responses, grouped by skill (first-seen order)
+- Merge policy (per rubric, "aggregation.merge_policy"):
+    union     evidence given in any response
+    latest    evidence of the last response only
+    majority  evidence given in more than half of the responses
+- Per-node provenance: which node contributed which evidence
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Union
+
+if TYPE_CHECKING:  # compiled_rubric validates policies against this module
+    from evaluation.compiled_rubric import CompiledRubric
+
+
+class MergePolicy(str, Enum):
+    UNION = "union"
+    LATEST = "latest"
+    MAJORITY = "majority"
+
+
+DEFAULT_MERGE_POLICY = MergePolicy.LATEST
+
+
+def resolve_merge_policy(
+    rubric: "CompiledRubric",
+    merge_policy: Optional[Union[str, MergePolicy]] = None,
+) -> MergePolicy:
+    return MergePolicy(merge_policy or rubric.merge_policy)
+
+
+def merge_masks(masks: Sequence[int], policy: MergePolicy) -> int:
+    """
+    Same merge over evidence bitmasks (one per response, in order).
+    """
+    if not masks:
+        return 0
+
+    if policy == MergePolicy.LATEST:
+        return masks[-1]
+
+    union = 0
+    for mask in masks:
+        union |= mask
+    if policy == MergePolicy.UNION:
+        return union
+
+    merged = 0
+    bit = 1
+    while bit <= union:
+        if bit & union and 2 * sum(1 for mask in masks if mask & bit) > len(masks):
+            merged |= bit
+        bit <<= 1
+    return merged
+
+
+def group_responses(
+    responses: Sequence[Dict],
+    rubric: "CompiledRubric",
+) -> Dict[str, List[Dict]]:
+    """
+    One pass: skill_id -> provenance, i.e. [{"node_id", "evidence"}, ...]
+    in response order. Evidence outside the skill's rubric vocabulary
+    never affects a score, so it is dropped here.
+    """
+    groups: Dict[str, List[Dict]] = {}
+
+    for response in responses:
+        skill_id = response["skill_id"]
+        provided = set(response.get("evidence", ()))
+        entry = {
+            "node_id": response.get("node_id"),
+            "evidence": [e for e in rubric.evidence_by_id[skill_id] if e in provided],
+        }
+
+        provenance = groups.get(skill_id)
+        if provenance is None:
+            groups[skill_id] = [entry]
+        else:
+            provenance.append(entry)
+
+    return groups
+
+
+def merge_evidence(provenance: Sequence[Dict], policy: MergePolicy) -> Set[str]:
+    if policy == MergePolicy.LATEST:
+        return set(provenance[-1]["evidence"])
+
+    if policy == MergePolicy.UNION:
+        merged = set()
+        for entry in provenance:
+            merged.update(entry["evidence"])
+        return merged
+
+    counts: Dict[str, int] = {}
+    for entry in provenance:
+        for item in entry["evidence"]:
+            counts[item] = counts.get(item, 0) + 1
+    return {e for e, count in counts.items() if 2 * count > len(provenance)}
+
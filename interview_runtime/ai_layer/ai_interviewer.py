@@ -23,6 +23,15 @@ FOLLOW_UP_TEMPLATES = {
 }
 
 
+def synthesize(text: str) -> str:
+    """
+    Text to speech for one utterance.
+    """
+    # ---- TEXT TO SPEECH PLACEHOLDER ----
+    # In real life, this would call a TTS service
+    return f"[AUDIO] {text}"
+
+
 def render_question(
     question_id: str,
     question_text: str,
@@ -34,9 +43,7 @@ def render_question(
     Same input -> Same output
     """
 
-    # ---- TEXT TO SPEECH PLACEHOLDER ----
-    # In real life, this would call a TTS service
-    spoken_audio = f"[AUDIO] {question_text}"
+    spoken_audio = synthesize(question_text)
 
     # ---- FOLLOW-UP GENERATION (SAFE & BOUNDED) ----
     followups = []
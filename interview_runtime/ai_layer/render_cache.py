@@ -0,0 +1,254 @@
+"""
+Render Cache
+------------
+Content-addressed cache for rendered (TTS) prompts.
+
+render_question() is pure, so its output is cached under a hash of
+every input plus the voice / TTS config version:
+
+- In-memory LRU in front of an on-disk store (survives restarts,
+  shareable between workers)
+- Follow-up templates are cached the same way
+- `python -m interview_runtime.ai_layer.render_cache` pre-renders every
+  node of a question graph and every FOLLOW_UP_TEMPLATE
+
+Usage:
+    python -m interview_runtime.ai_layer.render_cache \
+        [--graph configs/question_graphs/swe_graph.json] [--cache-dir DIR]
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from interview_runtime.ai_layer.ai_interviewer import (
+    FOLLOW_UP_TEMPLATES,
+    render_question,
+    synthesize,
+)
+
+# Bump when the synthesis output changes for the same text
+TTS_CONFIG_VERSION = "placeholder-1"
+
+# How the runtime presents a question node (no follow-ups offered)
+NODE_TEMPLATE_IDS = ["F1"]
+NODE_FOLLOWUP_POLICY = {
+    "enabled": False,
+    "max_followups": 0
+}
+
+
+def render_key(kind: str, inputs: Dict, voice: str) -> str:
+    canonical = json.dumps(
+        {
+            "kind": kind,
+            "inputs": inputs,
+            "voice": voice,
+            "tts_config_version": TTS_CONFIG_VERSION,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Thread-safe two-level cache. Values are JSON dicts; callers get a
+    private copy.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path],
+        max_entries: int = 4096,
+        voice: str = "default",
+    ):
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self.voice = voice
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    # -----------------------------
+    # Storage
+    # -----------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, value: Dict):
+        if not self.directory:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+
+    def _remember(self, key: str, value: Dict):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+
+    def get_or_render(self, key: str, render: Callable[[], Dict]) -> Dict:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(value)
+
+        value = self._read_disk(key)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            # Concurrent misses may both render; the output is identical
+            value = render()
+            self._write_disk(key, value)
+            with self._lock:
+                self.misses += 1
+
+        self._remember(key, value)
+        return copy.deepcopy(value)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+    # -----------------------------
+    # Renders
+    # -----------------------------
+
+    def render_question(
+        self,
+        question_id: str,
+        question_text: str,
+        allowed_template_ids: List[str],
+        followup_policy: Dict,
+    ) -> Dict:
+        inputs = {
+            "question_id": question_id,
+            "question_text": question_text,
+            "allowed_template_ids": list(allowed_template_ids),
+            "followup_policy": dict(followup_policy),
+        }
+        return self.get_or_render(
+            render_key("question", inputs, self.voice),
+            lambda: render_question(**inputs),
+        )
+
+    def render_followup(self, template_id: str) -> Dict:
+        text = FOLLOW_UP_TEMPLATES[template_id]
+        inputs = {"template_id": template_id, "text": text}
+        return self.get_or_render(
+            render_key("followup", inputs, self.voice),
+            lambda: {
+                "template_id": template_id,
+                "text": text,
+                "spoken_audio": synthesize(text),
+            },
+        )
+
+    def render_node(self, node_id: str, node) -> Dict:
+        """
+        A question graph node, rendered the way the runtime presents it.
+        """
+        return self.render_question(
+            question_id=node_id,
+            question_text=node["prompt_id"],
+            allowed_template_ids=NODE_TEMPLATE_IDS,
+            followup_policy=NODE_FOLLOWUP_POLICY,
+        )
+
+    def warm(self, question_graph) -> Dict:
+        """
+        Pre-renders every node of a compiled question graph and every
+        follow-up template.
+        """
+        for node_id, node in question_graph.nodes.items():
+            self.render_node(node_id, node)
+        for template_id in FOLLOW_UP_TEMPLATES:
+            self.render_followup(template_id)
+        return self.stats()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """
+    Process-wide cache configured from RENDER_CACHE_DIR ("" disables the
+    disk layer), RENDER_CACHE_MAX_ENTRIES and TTS_VOICE.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RenderCache(
+                    directory=os.getenv("RENDER_CACHE_DIR", "./render_cache") or None,
+                    max_entries=int(os.getenv("RENDER_CACHE_MAX_ENTRIES", "4096")),
+                    voice=os.getenv("TTS_VOICE", "default"),
+                )
+    return _cache
+
+
+def main(argv=None):
+    from orchestrator.config_registry import DEFAULT_QUESTION_GRAPH, get_config_registry
+
+    parser = argparse.ArgumentParser(description="Pre-render question graph prompts")
+    parser.add_argument("--graph", default=str(DEFAULT_QUESTION_GRAPH))
+    parser.add_argument("--cache-dir", default=None, help="overrides RENDER_CACHE_DIR")
+    args = parser.parse_args(argv)
+
+    if args.cache_dir:
+        cache = RenderCache(
+            directory=args.cache_dir,
+            voice=os.getenv("TTS_VOICE", "default"),
+        )
+    else:
+        cache = get_render_cache()
+
+    question_graph = get_config_registry().question_graph(args.graph)
+    summary = cache.warm(question_graph)
+    sys.stderr.write(f"[WARM] {question_graph.config_version}: {json.dumps(summary)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,15 @@
 Transcription Layer
 -------------------
 Responsibilities:
-- Speech-to-Text (STT)
+- Speech-to-Text (STT), whole-blob or streaming
 - NO interpretation
 - NO evaluation
 """
 
-from typing import Dict
+import codecs
+import os
+import re
+from typing import AsyncIterator, Callable, Dict, Union
 
 
 def transcribe_audio(audio_blob: str) -> Dict:
@@ -32,3 +35,117 @@ def transcribe_audio(audio_blob: str) -> Dict:
             "incomplete_capture": transcript_text == ""
         }
     }
+
+
+# -----------------------------
+# Streaming transcription
+# -----------------------------
+#
+# Audio arrives as chunks (async iterator of bytes / memoryview slices,
+# or placeholder str).
+# A backend yields transcript segments:
+#
+#   {
+#     "segment_index": int,          # utterance number within the answer
+#     "is_final": bool,
+#     "transcript_text": str,        # partial: text added since the last
+#                                    # segment; final: the whole utterance
+#     "confidence": {"acoustic_confidence": float},
+#     "flags": {"low_audio_quality": bool, "incomplete_capture": bool}
+#   }
+#
+# Partials for an utterance repeat its segment_index and carry only the
+# new text (append them for the utterance so far); exactly one final
+# segment closes it with the full text.
+
+AudioChunk = Union[bytes, memoryview, str]
+
+_SENTENCE_END = re.compile(r"[.?!](?=\s|$)")
+
+
+def _segment(segment_index: int, text: str, is_final: bool) -> Dict:
+    # Same heuristic as transcribe_audio, applied per segment; partial
+    # deltas keep their whitespace so they concatenate back
+    result = transcribe_audio(text)
+    return {
+        "segment_index": segment_index,
+        "is_final": is_final,
+        "transcript_text": result["transcript_text"] if is_final else text,
+        "confidence": result["confidence"],
+        "flags": result["flags"],
+    }
+
+
+class FakeStreamingBackend:
+    """
+    Deterministic local backend (no STT service).
+
+    Chunks are treated as already-spoken text ("[AUDIO]" markers are
+    dropped). A partial segment with the chunk's new text is emitted
+    after every chunk and a final segment at each sentence end and at
+    end of stream, so the output depends only on the chunk contents.
+    Work per chunk is linear in the chunk: sentence ends are only
+    searched for in the new text.
+    """
+
+    name = "fake"
+
+    async def stream(self, chunks: AsyncIterator[AudioChunk]) -> AsyncIterator[Dict]:
+        segment_index = 0
+        pending = ""
+        emitted = 0  # length of pending already sent as partials
+        # Incremental: a multi-byte character may span two chunks
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        async for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            # A sentence end in the old text would already have matched
+            scan_from = len(pending)
+            pending += chunk.replace("[AUDIO]", "")
+
+            while True:
+                end = _SENTENCE_END.search(pending, scan_from)
+                if end is None:
+                    break
+                sentence, pending = pending[:end.end()], pending[end.end():]
+                scan_from, emitted = 0, 0
+                if sentence.strip():
+                    yield _segment(segment_index, sentence, is_final=True)
+                    segment_index += 1
+
+            if pending[emitted:].strip():
+                yield _segment(segment_index, pending[emitted:], is_final=False)
+                emitted = len(pending)
+
+        pending += decoder.decode(b"", final=True)
+        if pending.strip():
+            yield _segment(segment_index, pending, is_final=True)
+
+
+TRANSCRIPTION_BACKENDS: Dict[str, Callable[[], object]] = {
+    "fake": FakeStreamingBackend,
+}
+
+
+def get_transcription_backend(name: str = None):
+    """
+    Backend from TRANSCRIPTION_BACKEND (default: fake). Real STT
+    integrations register a factory in TRANSCRIPTION_BACKENDS.
+    """
+    name = name or os.getenv("TRANSCRIPTION_BACKEND", "fake")
+    if name not in TRANSCRIPTION_BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {name}")
+    return TRANSCRIPTION_BACKENDS[name]()
+
+
+async def transcribe_stream(
+    chunks: AsyncIterator[AudioChunk],
+    backend=None,
+) -> AsyncIterator[Dict]:
+    """
+    Pure streaming transcription: audio chunks in, segments out.
+    """
+    backend = backend or get_transcription_backend()
+    async for segment in backend.stream(chunks):
+        yield segment
@@ -0,0 +1,259 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_runtime.api.routes import (
+    audio_answer_payload,
+    batch_start_ids,
+    check_answer_payload,
+    check_expected_version,
+    spooled_request_audio,
+    version_conflicts_as_409,
+)
+from interview_runtime.engine import (
+    batch_start_sessions,
+    get_answer_scoring,
+    read_events,
+    replay,
+)
+from interview_runtime.engine.async_runtime_engine import AsyncInterviewRuntimeEngine
+from interview_runtime.cache import get_session_state_cache, resolve_session_state
+from interview_runtime.models import InterviewSessionRuntime
+from interview_runtime.state_machine import SessionState
+from backend.database import get_async_db
+from orchestrator.adapter import get_orchestrator_adapter
+
+# Same contract as interview_runtime.api.routes, served on AsyncSession
+router = APIRouter(prefix="/interview-runtime", tags=["Interview Runtime"])
+
+
+def get_async_runtime_engine(
+    db: AsyncSession = Depends(get_async_db),
+):
+    orchestrator = get_orchestrator_adapter()
+    return AsyncInterviewRuntimeEngine(
+        db=db,
+        orchestrator_adapter=orchestrator,
+        state_cache=get_session_state_cache(),
+        answer_scoring=get_answer_scoring(),
+    )
+
+
+@router.post("/sessions/batch-start")
+async def batch_start(
+    payload: dict,
+    chunk_size: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    session_ids = batch_start_ids(payload)
+    orchestrator = get_orchestrator_adapter()
+    return await db.run_sync(
+        lambda sync_db: batch_start_sessions(
+            sync_db, orchestrator, session_ids, chunk_size=chunk_size
+        )
+    )
+
+
+@router.post("/sessions/{session_id}/start")
+async def start_session(
+    session_id: str,
+    engine: AsyncInterviewRuntimeEngine = Depends(get_async_runtime_engine),
+):
+    session = await engine.load_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    start_node_id = engine.orchestrator.start_node_id()
+
+    with version_conflicts_as_409():
+        await engine.start_session(
+            session=session,
+            start_node_id=start_node_id,
+        )
+
+    return {"status": "started", "session_id": session_id}
+
+
+@router.get("/sessions/{session_id}/current-question")
+async def get_current_question(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Steady-state polls are served from the cache; the engine
+    # invalidates it whenever it bumps runtime_version.
+    cache = get_session_state_cache()
+    state = cache.get(session_id)
+
+    if state is None:
+        session = await db.get(InterviewSessionRuntime, session_id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        # Question content comes directly from orchestrator
+        state = resolve_session_state(session, get_orchestrator_adapter())
+        cache.put(state)
+
+    if state["state"] != SessionState.RUNNING.value:
+        raise HTTPException(status_code=400, detail="Session not running")
+
+    return {
+        "node_id": state["current_node_id"],
+        "question": state["question"],
+        "rendered_question": state["rendered_question"],
+        "progress": state["progress"],
+        "questions_remaining": state["questions_remaining"],
+        "runtime_version": state["runtime_version"],
+    }
+
+
+@router.get("/sessions/{session_id}/scores")
+async def get_scores(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Live view of the running deterministic score; nothing is re-scored
+    session = await db.get(InterviewSessionRuntime, session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {
+        "session_state": session.state,
+        "runtime_version": session.runtime_version,
+        "deterministic_scores": get_answer_scoring().snapshot(session),
+    }
+
+
+@router.get("/sessions/{session_id}/events")
+async def get_events(
+    session_id: str,
+    after_seq: int = -1,
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    events = await db.run_sync(
+        lambda sync_db: read_events(sync_db, session_id, after_seq=after_seq, limit=limit)
+    )
+    if not events and await db.get(InterviewSessionRuntime, session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {"session_id": session_id, "events": events}
+
+
+@router.get("/sessions/{session_id}/replay")
+async def get_replay(
+    session_id: str,
+    db: AsyncSession = Depends(get_async_db),
+):
+    replayed = await db.run_sync(lambda sync_db: replay(sync_db, session_id))
+    if replayed.seq < 0 and await db.get(InterviewSessionRuntime, session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {"session_id": session_id, "replay": replayed.to_dict()}
+
+
+@router.post("/sessions/{session_id}/answer")
+async def submit_answer(
+    session_id: str,
+    payload: dict,
+    is_final: bool,
+    expected_runtime_version: int,
+    engine: AsyncInterviewRuntimeEngine = Depends(get_async_runtime_engine),
+):
+    check_answer_payload(payload)
+    session = await engine.load_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    with version_conflicts_as_409():
+        await engine.submit_answer(
+            session=session,
+            answer_payload=payload,
+            is_final=is_final,
+            expected_runtime_version=expected_runtime_version,
+        )
+
+    return {
+        "status": "answer_recorded",
+        "session_state": session.state,
+        "runtime_version": session.runtime_version,
+    }
+
+
+@router.post("/sessions/{session_id}/answer/audio")
+async def submit_audio_answer(
+    session_id: str,
+    request: Request,
+    is_final: bool,
+    expected_runtime_version: int,
+    engine: AsyncInterviewRuntimeEngine = Depends(get_async_runtime_engine),
+):
+    session = await engine.load_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    check_expected_version(session, expected_runtime_version)
+
+    async with spooled_request_audio(session_id, request) as audio_ref:
+        payload, evidence = await audio_answer_payload(
+            engine, session, audio_ref, request.headers.get("content-type")
+        )
+        with version_conflicts_as_409():
+            await engine.submit_answer(
+                session=session,
+                answer_payload=payload,
+                is_final=is_final,
+                expected_runtime_version=expected_runtime_version,
+                audio_ref=audio_ref,
+                evidence=evidence,
+            )
+
+    return {
+        "status": "answer_recorded",
+        "session_state": session.state,
+        "runtime_version": session.runtime_version,
+        "audio_length": audio_ref["length"],
+        "audio_checksum": audio_ref["checksum"],
+    }
+
+
+@router.post("/sessions/{session_id}/pause")
+async def pause_session(
+    session_id: str,
+    expected_runtime_version: int,
+    engine: AsyncInterviewRuntimeEngine = Depends(get_async_runtime_engine),
+):
+    session = await engine.load_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    with version_conflicts_as_409():
+        await engine.pause_session(
+            session=session,
+            expected_runtime_version=expected_runtime_version,
+        )
+
+    return {
+        "status": "paused",
+        "runtime_version": session.runtime_version,
+    }
+
+
+@router.post("/sessions/{session_id}/resume")
+async def resume_session(
+    session_id: str,
+    expected_runtime_version: int,
+    engine: AsyncInterviewRuntimeEngine = Depends(get_async_runtime_engine),
+):
+    session = await engine.load_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    with version_conflicts_as_409():
+        await engine.resume_session(
+            session=session,
+            expected_runtime_version=expected_runtime_version,
+        )
+
+    return {
+        "status": "resumed",
+        "runtime_version": session.runtime_version,
+    }
@@ -1,38 +1,177 @@
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from contextlib import asynccontextmanager, contextmanager
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from interview_runtime.engine import InterviewRuntimeEngine
+from interview_runtime.engine import (
+    InterviewRuntimeEngine,
+    VersionConflictError,
+    batch_start_sessions,
+    get_answer_scoring,
+    read_events,
+    replay,
+)
+from interview_runtime.audio import SpoolBusyError, get_audio_spool
+from interview_runtime.cache import get_session_state_cache, resolve_session_state
 from interview_runtime.models import InterviewSessionRuntime
 from interview_runtime.state_machine import SessionState
-from db.session import get_db  # adjust if needed
+from backend.database import get_db
 from orchestrator.adapter import get_orchestrator_adapter  # existing adapter
 
 router = APIRouter(prefix="/interview-runtime", tags=["Interview Runtime"])
 
+# Upper bound on sessions per batch-start request
+MAX_BATCH_START = int(os.getenv("RUNTIME_MAX_BATCH_START", "10000"))
+
 
 def get_runtime_engine(
     db: Session = Depends(get_db),
 ):
     orchestrator = get_orchestrator_adapter()
-    return InterviewRuntimeEngine(db=db, orchestrator_adapter=orchestrator)
+    return InterviewRuntimeEngine(
+        db=db,
+        orchestrator_adapter=orchestrator,
+        state_cache=get_session_state_cache(),
+        answer_scoring=get_answer_scoring(),
+    )
+
+
+@contextmanager
+def version_conflicts_as_409():
+    try:
+        yield
+    except VersionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+def check_expected_version(session: InterviewSessionRuntime, expected_runtime_version: int):
+    # Early reject before an upload is spooled; the commit re-checks
+    if session.runtime_version != expected_runtime_version:
+        raise HTTPException(
+            status_code=409,
+            detail="Concurrent modification detected for session",
+        )
+
+
+def check_answer_payload(payload: dict):
+    # Evidence is extracted on the server; the transcript is all we read
+    text = payload.get("transcript_text")
+    if text is not None and not isinstance(text, str):
+        raise HTTPException(status_code=422, detail="transcript_text must be a string")
+
+
+# Upload bytes handed to the spool per (threaded) write
+SPOOL_WRITE_CHUNK = 256 * 1024
+
+
+@asynccontextmanager
+async def spooled_request_audio(session_id: str, request: Request):
+    """
+    Streams the request body into the session's spool file and yields
+    the (fsynced) audio reference. The answer is kept if the block
+    succeeds and truncated away if it raises (rejected upload, version
+    conflict, ...). Spool I/O runs in the threadpool, never on the
+    event loop.
+    """
+    try:
+        writer = await run_in_threadpool(get_audio_spool().writer, session_id)
+    except SpoolBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    try:
+        buffered = bytearray()
+        async for chunk in request.stream():
+            buffered += chunk
+            if len(buffered) >= SPOOL_WRITE_CHUNK:
+                await run_in_threadpool(writer.write, buffered)
+                buffered = bytearray()
+        if buffered:
+            await run_in_threadpool(writer.write, buffered)
+
+        yield await run_in_threadpool(writer.sync)
+    except BaseException:
+        await run_in_threadpool(writer.abort)
+        raise
+
+    await run_in_threadpool(writer.close)
+
+
+async def audio_answer_payload(engine, session: InterviewSessionRuntime, audio_ref: dict,
+                               content_type: str | None) -> tuple:
+    """
+    Answer payload for spooled audio (its transcript and evidence
+    matches) and the evidence extracted for the open node's skill,
+    streamed off the event loop. The evidence goes to submit_answer()
+    separately, never through the payload.
+    """
+    payload = {"content_type": content_type}
+    if session.current_node_id is None:
+        return payload, None
+
+    skill_id = engine.orchestrator.get_node(session.current_node_id)["skill_id"]
+    scoring = engine.answer_scoring or get_answer_scoring()
+    payload.update(await run_in_threadpool(
+        scoring.transcribe_audio, session, skill_id, audio_ref
+    ))
+    return payload, payload.pop("evidence", None)
+
+
+def batch_start_ids(payload: dict) -> list:
+    """
+    {"session_ids": [...]} starts the given ids; {"count": N} starts N
+    sessions under generated ids.
+    """
+    if "session_ids" in payload:
+        session_ids = payload["session_ids"]
+        if not isinstance(session_ids, list):
+            raise HTTPException(status_code=422, detail="session_ids must be a list")
+    elif isinstance(payload.get("count"), int) and payload["count"] >= 0:
+        session_ids = [str(uuid4()) for _ in range(payload["count"])]
+    else:
+        raise HTTPException(status_code=422, detail="Provide session_ids or a count")
+
+    if len(session_ids) > MAX_BATCH_START:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BATCH_START} sessions per batch",
+        )
+    return session_ids
+
+
+@router.post("/sessions/batch-start")
+def batch_start(
+    payload: dict,
+    chunk_size: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+):
+    # Bulk create + start; per-item results in request order
+    return batch_start_sessions(
+        db,
+        get_orchestrator_adapter(),
+        batch_start_ids(payload),
+        chunk_size=chunk_size,
+    )
 
 
 @router.post("/sessions/{session_id}/start")
 def start_session(
     session_id: str,
-    db: Session = Depends(get_db),
     engine: InterviewRuntimeEngine = Depends(get_runtime_engine),
 ):
-    session = db.query(InterviewSessionRuntime).get(session_id)
+    session = engine.load_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     start_node_id = engine.orchestrator.start_node_id()
 
-    engine.start_session(
-        session=session,
-        start_node_id=start_node_id,
-    )
+    with version_conflicts_as_409():
+        engine.start_session(
+            session=session,
+            start_node_id=start_node_id,
+        )
 
     return {"status": "started", "session_id": session_id}
 
@@ -42,43 +181,98 @@ def get_current_question(
     session_id: str,
     db: Session = Depends(get_db),
 ):
-    session = db.query(InterviewSessionRuntime).get(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    # Steady-state polls are served from the cache; the engine
+    # invalidates it whenever it bumps runtime_version.
+    cache = get_session_state_cache()
+    state = cache.get(session_id)
 
-    if session.state != SessionState.RUNNING.value:
+    if state is None:
+        session = db.get(InterviewSessionRuntime, session_id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        # Question content comes directly from orchestrator
+        state = resolve_session_state(session, get_orchestrator_adapter())
+        cache.put(state)
+
+    if state["state"] != SessionState.RUNNING.value:
         raise HTTPException(status_code=400, detail="Session not running")
 
-    # Question content comes directly from orchestrator
-    question = get_orchestrator_adapter().get_node(
-        session.current_node_id
-    )
+    return {
+        "node_id": state["current_node_id"],
+        "question": state["question"],
+        "rendered_question": state["rendered_question"],
+        "progress": state["progress"],
+        "questions_remaining": state["questions_remaining"],
+        "runtime_version": state["runtime_version"],
+    }
+
+
+@router.get("/sessions/{session_id}/scores")
+def get_scores(
+    session_id: str,
+    db: Session = Depends(get_db),
+):
+    # Live view of the running deterministic score; nothing is re-scored
+    session = db.get(InterviewSessionRuntime, session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
 
     return {
-        "node_id": session.current_node_id,
-        "question": question,
+        "session_state": session.state,
+        "runtime_version": session.runtime_version,
+        "deterministic_scores": get_answer_scoring().snapshot(session),
     }
 
 
+@router.get("/sessions/{session_id}/events")
+def get_events(
+    session_id: str,
+    after_seq: int = -1,
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+):
+    # Raw event log page; pass the last seq back as after_seq for the next
+    events = read_events(db, session_id, after_seq=after_seq, limit=limit)
+    if not events and db.get(InterviewSessionRuntime, session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {"session_id": session_id, "events": events}
+
+
+@router.get("/sessions/{session_id}/replay")
+def get_replay(
+    session_id: str,
+    db: Session = Depends(get_db),
+):
+    # Newest snapshot + bounded event tail
+    replayed = replay(db, session_id)
+    if replayed.seq < 0 and db.get(InterviewSessionRuntime, session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {"session_id": session_id, "replay": replayed.to_dict()}
+
+
 @router.post("/sessions/{session_id}/answer")
 def submit_answer(
     session_id: str,
     payload: dict,
     is_final: bool,
     expected_runtime_version: int,
-    db: Session = Depends(get_db),
     engine: InterviewRuntimeEngine = Depends(get_runtime_engine),
 ):
-    session = db.query(InterviewSessionRuntime).get(session_id)
+    check_answer_payload(payload)
+    session = engine.load_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    engine.submit_answer(
-        session=session,
-        answer_payload=payload,
-        is_final=is_final,
-        expected_runtime_version=expected_runtime_version,
-    )
+    with version_conflicts_as_409():
+        engine.submit_answer(
+            session=session,
+            answer_payload=payload,
+            is_final=is_final,
+            expected_runtime_version=expected_runtime_version,
+        )
 
     return {
         "status": "answer_recorded",
@@ -87,21 +281,59 @@ def submit_answer(
     }
 
 
+@router.post("/sessions/{session_id}/answer/audio")
+async def submit_audio_answer(
+    session_id: str,
+    request: Request,
+    is_final: bool,
+    expected_runtime_version: int,
+    engine: InterviewRuntimeEngine = Depends(get_runtime_engine),
+):
+    session = await run_in_threadpool(engine.load_session, session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    check_expected_version(session, expected_runtime_version)
+
+    async with spooled_request_audio(session_id, request) as audio_ref:
+        payload, evidence = await audio_answer_payload(
+            engine, session, audio_ref, request.headers.get("content-type")
+        )
+        with version_conflicts_as_409():
+            await run_in_threadpool(
+                engine.submit_answer,
+                session=session,
+                answer_payload=payload,
+                is_final=is_final,
+                expected_runtime_version=expected_runtime_version,
+                audio_ref=audio_ref,
+                evidence=evidence,
+            )
+
+    return {
+        "status": "answer_recorded",
+        "session_state": session.state,
+        "runtime_version": session.runtime_version,
+        "audio_length": audio_ref["length"],
+        "audio_checksum": audio_ref["checksum"],
+    }
+
+
 @router.post("/sessions/{session_id}/pause")
 def pause_session(
     session_id: str,
     expected_runtime_version: int,
-    db: Session = Depends(get_db),
     engine: InterviewRuntimeEngine = Depends(get_runtime_engine),
 ):
-    session = db.query(InterviewSessionRuntime).get(session_id)
+    session = engine.load_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    engine.pause_session(
-        session=session,
-        expected_runtime_version=expected_runtime_version,
-    )
+    with version_conflicts_as_409():
+        engine.pause_session(
+            session=session,
+            expected_runtime_version=expected_runtime_version,
+        )
 
     return {
         "status": "paused",
@@ -113,17 +345,17 @@ def pause_session(
 def resume_session(
     session_id: str,
     expected_runtime_version: int,
-    db: Session = Depends(get_db),
     engine: InterviewRuntimeEngine = Depends(get_runtime_engine),
 ):
-    session = db.query(InterviewSessionRuntime).get(session_id)
+    session = engine.load_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    engine.resume_session(
-        session=session,
-        expected_runtime_version=expected_runtime_version,
-    )
+    with version_conflicts_as_409():
+        engine.resume_session(
+            session=session,
+            expected_runtime_version=expected_runtime_version,
+        )
 
     return {
         "status": "resumed",
@@ -0,0 +1,19 @@
+from .spool import (
+    AudioChecksumError,
+    AudioSpool,
+    SpoolBusyError,
+    SpoolWriter,
+    get_audio_spool,
+    iter_audio_chunks,
+    open_audio,
+)
+
+__all__ = [
+    "AudioChecksumError",
+    "AudioSpool",
+    "SpoolBusyError",
+    "SpoolWriter",
+    "get_audio_spool",
+    "iter_audio_chunks",
+    "open_audio",
+]
@@ -0,0 +1,217 @@
+"""
+Audio Spool
+-----------
+Append-only spool files for answer audio.
+
+- Upload chunks are written to disk once, as they arrive
+- Each answer is referenced by (path, offset, length, checksum); the
+  bytes never go into answer_payload
+- Readers get memoryview slices over an mmap, so transcription reads
+  the page cache directly instead of copying the recording
+- Memory per in-flight answer is one upload chunk, whatever its length
+- All file I/O here is blocking; async callers run it in a thread
+- An answer whose upload or commit fails is truncated away (abort()),
+  so the spool only holds audio that an attempt points to
+- A writer holds an exclusive flock on the spool file for its whole
+  life, so writers in other threads or API worker processes cannot
+  append to (or truncate) the same file meanwhile
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, Union
+
+DEFAULT_READ_CHUNK = 64 * 1024
+
+
+class AudioChecksumError(Exception):
+    pass
+
+
+class SpoolBusyError(Exception):
+    """
+    Another answer for the same session is still being written (by
+    this process or another one).
+    """
+    pass
+
+
+class SpoolWriter:
+    """
+    Writes one answer to the end of a session spool file.
+
+    write() the chunks, sync() to make them durable and get the audio
+    reference, then close() once the answer is committed, or abort() to
+    drop it. As a context manager: close() on success, abort() on error.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o640)
+        try:
+            # Held until the fd is closed; the offset is only stable
+            # (and the truncate in abort() only safe) under the lock
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            self.offset = os.fstat(self._fd).st_size
+        except BlockingIOError:
+            os.close(self._fd)
+            raise SpoolBusyError(f"Audio for {path.name} is already being written")
+        except OSError:
+            os.close(self._fd)
+            raise
+        self.length = 0
+        self._digest = hashlib.sha256()
+        self._ref = None
+        self._done = False
+
+    def write(self, chunk: Union[bytes, bytearray, memoryview]):
+        view = memoryview(chunk)
+        self._digest.update(view)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+            self.length += written
+
+    def sync(self) -> Dict:
+        """
+        fsyncs the answer and returns its reference; the writer stays
+        open, so the answer can still be aborted.
+        """
+        if self._ref is None:
+            os.fsync(self._fd)
+            self._ref = {
+                "path": str(self.path),
+                "offset": self.offset,
+                "length": self.length,
+                "checksum": f"sha256:{self._digest.hexdigest()}",
+            }
+        return self._ref
+
+    def _release(self):
+        # Closing the fd drops the lock
+        self._done = True
+        os.close(self._fd)
+
+    def close(self) -> Dict:
+        if not self._done:
+            try:
+                self.sync()
+            finally:
+                self._release()
+        return self._ref
+
+    def abort(self):
+        """
+        Drops the answer: the file is truncated back to offset.
+        """
+        if not self._done:
+            try:
+                os.ftruncate(self._fd, self.offset)
+            finally:
+                self._release()
+            self._ref = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class AudioSpool:
+    """
+    One spool file per session under `root`. Answers within a session
+    are appended one at a time; a second concurrent writer for the same
+    session, in any process, gets SpoolBusyError.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, session_id: str) -> Path:
+        return self.root / f"{session_id}.audio"
+
+    def writer(self, session_id: str) -> SpoolWriter:
+        return SpoolWriter(self.path_for(session_id))
+
+
+# -----------------------------
+# Reading
+# -----------------------------
+
+@contextmanager
+def open_audio(ref: Dict, verify: bool = False) -> Iterator[memoryview]:
+    """
+    Yields a read-only memoryview of exactly the referenced bytes.
+    The view (and any slice of it) must not be used after the block.
+    """
+    if ref["length"] == 0:
+        yield memoryview(b"")
+        return
+
+    # mmap offsets must be aligned to the allocation granularity
+    aligned = ref["offset"] - ref["offset"] % mmap.ALLOCATIONGRANULARITY
+    skip = ref["offset"] - aligned
+
+    with open(ref["path"], "rb") as f:
+        with mmap.mmap(
+            f.fileno(),
+            skip + ref["length"],
+            offset=aligned,
+            access=mmap.ACCESS_READ,
+        ) as mapped:
+            view = memoryview(mapped)[skip:skip + ref["length"]]
+            try:
+                if verify:
+                    checksum = f"sha256:{hashlib.sha256(view).hexdigest()}"
+                    if checksum != ref["checksum"]:
+                        raise AudioChecksumError(
+                            f"Checksum mismatch for {ref['path']}@{ref['offset']}"
+                        )
+                yield view
+            finally:
+                view.release()
+
+
+async def iter_audio_chunks(
+    ref: Dict,
+    chunk_size: int = DEFAULT_READ_CHUNK,
+    verify: bool = False,
+) -> AsyncIterator[memoryview]:
+    """
+    Async chunk source for transcribe_stream(): zero-copy slices of the
+    spooled answer. Each slice is released once the consumer asks for
+    the next one.
+    """
+    with open_audio(ref, verify=verify) as view:
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start:start + chunk_size]
+            try:
+                yield chunk
+            finally:
+                chunk.release()
+
+
+_spool = None
+_spool_lock = threading.Lock()
+
+
+def get_audio_spool() -> AudioSpool:
+    """
+    Process-wide spool rooted at AUDIO_SPOOL_DIR.
+    """
+    global _spool
+    if _spool is None:
+        with _spool_lock:
+            if _spool is None:
+                _spool = AudioSpool(os.getenv("AUDIO_SPOOL_DIR", "./audio_spool"))
+    return _spool
@@ -0,0 +1,17 @@
+from .session_state_cache import (
+    SessionCacheConfigError,
+    SessionStateCache,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    get_session_state_cache,
+    resolve_session_state,
+)
+
+__all__ = [
+    "SessionCacheConfigError",
+    "SessionStateCache",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "get_session_state_cache",
+    "resolve_session_state",
+]
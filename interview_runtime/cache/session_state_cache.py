@@ -0,0 +1,245 @@
+"""
+Session State Cache
+-------------------
+Hot cache for what the current-question endpoint serves:
+state, current node, resolved node and rendered question.
+
+- Entries carry the runtime_version they were built from
+- The runtime engine invalidates on every version bump and leaves a
+  tombstone, so a reader that loaded an older row cannot re-insert it
+- Bounded LRU + TTL in process, or a Redis-compatible server
+- Invalidations only reach the process that made them, so the
+  in-process backend is refused when WEB_CONCURRENCY says the app runs
+  more than one worker; use SESSION_CACHE_BACKEND=redis there
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from interview_runtime.ai_layer.render_cache import get_render_cache
+
+TOMBSTONE = "__tombstone__"
+
+
+class SessionCacheConfigError(Exception):
+    pass
+
+
+# -----------------------------
+# Backends
+# -----------------------------
+
+class InMemoryCacheBackend:
+    """
+    LRU with per-entry TTL, bounded by entry count and approximate bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return item[2]
+
+    def set(self, key: str, value: Dict, min_version: Optional[int] = None) -> bool:
+        """
+        With min_version, the write is skipped (atomically) if the stored
+        value has a higher runtime_version.
+        """
+        size = len(json.dumps(value, default=str))
+        with self._lock:
+            if key in self._entries:
+                current = self._entries[key]
+                if min_version is not None and current[0] >= time.monotonic() \
+                        and current[2]["runtime_version"] > min_version:
+                    return False
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+            return True
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def _drop(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+class RedisCacheBackend:
+    """
+    Any Redis-compatible server (Redis, Valkey, KeyDB, ...).
+    Memory is bounded by the server's maxmemory / LRU policy.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float = 300.0, prefix: str = "session-state:"):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Dict]:
+        raw = self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Dict, min_version: Optional[int] = None) -> bool:
+        key = self.prefix + key
+        raw = json.dumps(value, default=str)
+        ttl = max(1, int(self.ttl_seconds))
+
+        if min_version is None:
+            self._client.set(key, raw, ex=ttl)
+            return True
+
+        import redis
+
+        with self._client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                current = pipe.get(key)
+                if current is not None and json.loads(current)["runtime_version"] > min_version:
+                    pipe.reset()
+                    return False
+                pipe.multi()
+                pipe.set(key, raw, ex=ttl)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                # Lost to a concurrent write (typically an invalidation)
+                return False
+
+    def delete(self, key: str):
+        self._client.delete(self.prefix + key)
+
+
+# -----------------------------
+# Cache
+# -----------------------------
+
+class SessionStateCache:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        entry = self.backend.get(session_id)
+        if entry is None or entry.get(TOMBSTONE):
+            return None
+        return entry
+
+    def put(self, entry: Dict) -> bool:
+        """
+        Stores entry unless a newer version (or its tombstone) is present.
+        """
+        return self.backend.set(
+            entry["session_id"],
+            entry,
+            min_version=entry["runtime_version"],
+        )
+
+    def invalidate(self, session_id: str, runtime_version: Optional[int] = None):
+        """
+        Called after a committed version bump. Entries built from any
+        version below runtime_version are rejected from then on.
+        """
+        if runtime_version is None:
+            self.backend.delete(session_id)
+            return
+
+        self.backend.set(session_id, {
+            "session_id": session_id,
+            "runtime_version": runtime_version,
+            TOMBSTONE: True,
+        })
+
+
+def resolve_session_state(session, orchestrator) -> Dict:
+    """
+    Builds the cache entry for a session row: node content from the
+    orchestrator plus the rendered (TTS) question from the render cache.
+    """
+    question = None
+    rendered = None
+    progress = None
+    questions_remaining = None
+
+    if session.current_node_id:
+        question = orchestrator.get_node(session.current_node_id)
+        progress = orchestrator.progress(session.current_node_id)
+        questions_remaining = orchestrator.questions_remaining(session.current_node_id)
+        rendered = get_render_cache().render_node(session.current_node_id, question)
+
+    return {
+        "session_id": session.session_id,
+        "runtime_version": session.runtime_version,
+        "state": session.state,
+        "current_node_id": session.current_node_id,
+        "question": question,
+        "rendered_question": rendered,
+        "progress": progress,
+        "questions_remaining": questions_remaining,
+    }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_session_state_cache() -> SessionStateCache:
+    """
+    Process-wide cache configured from SESSION_CACHE_* env vars.
+    Raises SessionCacheConfigError for the in-process backend when
+    WEB_CONCURRENCY is above 1: other workers would keep serving stale
+    questions until the TTL.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                ttl = float(os.getenv("SESSION_CACHE_TTL", "300"))
+                if os.getenv("SESSION_CACHE_BACKEND", "memory") == "redis":
+                    backend = RedisCacheBackend(
+                        os.getenv("SESSION_CACHE_URL", "redis://localhost:6379/0"),
+                        ttl_seconds=ttl,
+                    )
+                else:
+                    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+                    if workers > 1:
+                        raise SessionCacheConfigError(
+                            f"The in-process session cache cannot be shared by {workers} "
+                            "workers; set SESSION_CACHE_BACKEND=redis"
+                        )
+                    backend = InMemoryCacheBackend(
+                        max_entries=int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000")),
+                        max_bytes=int(os.getenv("SESSION_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+                        ttl_seconds=ttl,
+                    )
+                _cache = SessionStateCache(backend)
+    return _cache
@@ -1,3 +1,28 @@
-from .runtime_engine import InterviewRuntimeEngine
+from .runtime_engine import (
+    InterviewRuntimeEngine,
+    RuntimeInvariantError,
+    VersionConflictError,
+)
+from .answer_scoring import AnswerScoring, get_answer_scoring
+from .batch_start import batch_start_sessions
+from .event_log import (
+    RuntimeEventLog,
+    RuntimeEventType,
+    SessionReplay,
+    read_events,
+    replay,
+)
 
-__all__ = ["InterviewRuntimeEngine"]
+__all__ = [
+    "AnswerScoring",
+    "InterviewRuntimeEngine",
+    "RuntimeEventLog",
+    "RuntimeEventType",
+    "RuntimeInvariantError",
+    "SessionReplay",
+    "VersionConflictError",
+    "batch_start_sessions",
+    "get_answer_scoring",
+    "read_events",
+    "replay",
+]
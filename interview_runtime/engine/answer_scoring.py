@@ -0,0 +1,167 @@
+"""
+Answer Scoring
+--------------
+Keeps a session's deterministic score current as answers are finalized.
+
+- The running score lives on the session row (score_state) and is
+  updated in the same commit as the answer that changed it
+- Evidence is always found on the server: extracted from the payload's
+  "transcript_text", or passed in by the caller for audio it
+  transcribed itself. An "evidence" list sent by the client is never
+  trusted; answers without a transcript leave the score unchanged
+- A session keeps scoring against the rubric version it started with
+  while that version, and evidence rules for it, are loaded; otherwise
+  (e.g. after a restart) its state is re-based onto the current rubric
+- Scoring never fails the interview: an answer that cannot be scored
+  is recorded under "unscored" and leaves the score unchanged
+- Spooled audio answers are transcribed as a stream and their evidence
+  extracted per final segment (transcribe_audio()); a failed
+  transcription leaves the answer without evidence
+"""
+
+import asyncio
+import threading
+from typing import Dict, List, Optional
+
+from backend.metrics import stage_timer
+from evaluation.compiled_rubric import CompiledRubric, RubricValidationError
+from evaluation.evidence_extractor import (
+    EvidenceExtractor,
+    EvidenceRuleError,
+    extract_streamed,
+    get_evidence_extractor,
+)
+from interview_runtime.ai_layer.transcription import transcribe_stream
+from interview_runtime.audio import AudioChecksumError, iter_audio_chunks
+from evaluation.incremental_scoring import IncrementalScorer
+from orchestrator.config_registry import (
+    DEFAULT_EVIDENCE_RULES,
+    DEFAULT_RUBRIC,
+    get_config_registry,
+)
+
+
+class AnswerScoring:
+    def __init__(self, registry=None, rubric_path=DEFAULT_RUBRIC,
+                 rules_path=DEFAULT_EVIDENCE_RULES):
+        self.registry = registry or get_config_registry()
+        self.rubric_path = rubric_path
+        self.rules_path = rules_path
+
+    def rubric_for(self, score_state: Optional[Dict]) -> CompiledRubric:
+        current = self.registry.rubric(self.rubric_path)
+        # Loaded alongside, so the rules for this version outlive a hot swap
+        self.registry.evidence_rules(self.rules_path)
+        version = (score_state or {}).get("rubric_version")
+        if version and version != current.rubric_version:
+            rubric = self.registry.get_version(version, self.rubric_path)
+            rules = self.registry.evidence_rules_for(version, self.rules_path)
+            if rubric is not None and rules is not None:
+                return rubric
+        return current
+
+    def scorer_for(self, session) -> IncrementalScorer:
+        return IncrementalScorer(
+            self.rubric_for(session.score_state),
+            candidate_id=session.session_id,
+            state=session.score_state,
+            rebase=True,
+        )
+
+    def evidence(self, rubric: CompiledRubric, skill_id: str, answer_payload: Dict) -> Optional[List[str]]:
+        text = answer_payload.get("transcript_text")
+        if text is None:
+            return None
+        if not isinstance(text, str):
+            raise TypeError("transcript_text must be a string")
+
+        return self.extractor_for(rubric).extract(text, skill_id=skill_id)["evidence"]
+
+    def extractor_for(self, rubric: CompiledRubric) -> EvidenceExtractor:
+        rules = self.registry.evidence_rules_for(rubric.rubric_version, self.rules_path)
+        if rules is None:
+            raise EvidenceRuleError(f"No evidence rules for rubric {rubric.rubric_version}")
+        return get_evidence_extractor(rubric, rules)
+
+    def transcribe_audio(self, session, skill_id: str, audio_ref: Dict) -> Dict:
+        """
+        Blocking (run it in a thread): streams the spooled answer through
+        transcription and evidence extraction. Returns answer payload
+        fields plus the extracted "evidence" (for record(), not for the
+        payload), or {} when it cannot be transcribed.
+        """
+        try:
+            extractor = self.extractor_for(self.rubric_for(session.score_state))
+            with stage_timer("transcription"):
+                streamed = asyncio.run(extract_streamed(
+                    transcribe_stream(iter_audio_chunks(audio_ref, verify=True)),
+                    extractor,
+                    skill_id=skill_id,
+                ))
+        except (AudioChecksumError, EvidenceRuleError, OSError, ValueError):
+            return {}
+
+        return {
+            "transcript_text": streamed["transcript_text"],
+            "evidence": streamed["evidence"],
+            "evidence_matches": streamed["evidence_matches"],
+        }
+
+    def record(self, session, skill_id: str, answer_payload: Dict,
+               evidence: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Returns the session's new score_state after a final answer.
+        `evidence` is what the server extracted itself (e.g. from spooled
+        audio); otherwise it is extracted from the payload's transcript.
+        """
+        try:
+            scorer = self.scorer_for(session)
+            if evidence is None:
+                evidence = self.evidence(scorer.rubric, skill_id, answer_payload)
+            if evidence is None:
+                return session.score_state
+
+            with stage_timer("scoring"):
+                scorer.add_response(skill_id, evidence, node_id=session.current_node_id)
+            return self._with_unscored(session, scorer.state())
+
+        except KeyError:
+            return self._unscored(session, skill_id, f"Skill {skill_id} is not in the rubric")
+        except (RubricValidationError, EvidenceRuleError, TypeError) as e:
+            return self._unscored(session, skill_id, str(e))
+
+    def _with_unscored(self, session, state: Dict, *entries: Dict) -> Dict:
+        unscored = list((session.score_state or {}).get("unscored", [])) + list(entries)
+        if unscored:
+            state["unscored"] = unscored
+        return state
+
+    def _unscored(self, session, skill_id: str, reason: str) -> Dict:
+        # The answer stays recorded; only its score is missing
+        return self._with_unscored(session, dict(session.score_state or {}), {
+            "node_id": session.current_node_id,
+            "skill_id": skill_id,
+            "reason": reason,
+        })
+
+    def snapshot(self, session) -> Dict:
+        """
+        Current scores for a session, shaped like the end-of-interview
+        deterministic scores.
+        """
+        snapshot = self.scorer_for(session).snapshot()
+        snapshot["unscored"] = list((session.score_state or {}).get("unscored", []))
+        return snapshot
+
+
+_scoring = None
+_scoring_lock = threading.Lock()
+
+
+def get_answer_scoring() -> AnswerScoring:
+    global _scoring
+    if _scoring is None:
+        with _scoring_lock:
+            if _scoring is None:
+                _scoring = AnswerScoring()
+    return _scoring
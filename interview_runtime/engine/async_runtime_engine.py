@@ -0,0 +1,79 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_runtime.engine.runtime_engine import InterviewRuntimeEngine
+from interview_runtime.models import InterviewSessionRuntime
+
+
+class AsyncInterviewRuntimeEngine:
+    """
+    AsyncSession front for InterviewRuntimeEngine.
+    One instance per AsyncSession.
+
+    Each operation runs the synchronous engine through
+    AsyncSession.run_sync, so transition rules, versioning and failure
+    handling are shared with the sync engine while DB I/O is awaited on
+    the async driver instead of blocking a threadpool worker.
+    """
+
+    def __init__(self, db: AsyncSession, orchestrator_adapter, state_cache=None, answer_scoring=None):
+        self.db = db
+        self.orchestrator = orchestrator_adapter
+        self.answer_scoring = answer_scoring
+        self._engine = InterviewRuntimeEngine(
+            db.sync_session,
+            orchestrator_adapter,
+            state_cache=state_cache,
+            answer_scoring=answer_scoring,
+        )
+
+    async def load_session(self, session_id: str) -> InterviewSessionRuntime | None:
+        return await self.db.run_sync(
+            lambda _: self._engine.load_session(session_id)
+        )
+
+    async def start_session(
+        self,
+        session: InterviewSessionRuntime,
+        start_node_id: str,
+    ):
+        await self.db.run_sync(
+            lambda _: self._engine.start_session(session, start_node_id)
+        )
+
+    async def submit_answer(
+        self,
+        session: InterviewSessionRuntime,
+        answer_payload: dict,
+        is_final: bool,
+        expected_runtime_version: int,
+        audio_ref: dict | None = None,
+        evidence: list | None = None,
+    ):
+        await self.db.run_sync(
+            lambda _: self._engine.submit_answer(
+                session,
+                answer_payload,
+                is_final,
+                expected_runtime_version,
+                audio_ref,
+                evidence,
+            )
+        )
+
+    async def pause_session(
+        self,
+        session: InterviewSessionRuntime,
+        expected_runtime_version: int,
+    ):
+        await self.db.run_sync(
+            lambda _: self._engine.pause_session(session, expected_runtime_version)
+        )
+
+    async def resume_session(
+        self,
+        session: InterviewSessionRuntime,
+        expected_runtime_version: int,
+    ):
+        await self.db.run_sync(
+            lambda _: self._engine.resume_session(session, expected_runtime_version)
+        )
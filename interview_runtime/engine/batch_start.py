@@ -0,0 +1,194 @@
+"""
+Batch Start
+-----------
+Creates and starts many runtime sessions at once (scheduled interview
+waves), with the same end state as one start_session() per session.
+
+- Per chunk: one SELECT for ids that already exist, then one executemany
+  INSERT each for sessions, first turns and their runtime events, and
+  one commit
+- Every session starts RUNNING on the graph's start node at
+  runtime_version 1, exactly like a single start
+- Per-item outcome: started / exists / duplicate / invalid / failed;
+  a failed chunk does not undo the chunks committed before it
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.metrics import FSM_TRANSITIONS, inc
+from interview_runtime.engine.event_log import RuntimeEventType
+from interview_runtime.models import (
+    InterviewQuestionTurn,
+    InterviewRuntimeEvent,
+    InterviewSessionRuntime,
+)
+from interview_runtime.state_machine import SessionState, SessionStateMachine
+
+DEFAULT_CHUNK_SIZE = 500
+
+STARTED = "started"
+EXISTS = "exists"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+FAILED = "failed"
+
+
+def _rows(session_ids: List[str], start_node_id: str, graph_version: str) -> tuple:
+    sessions, turns, events = [], [], []
+
+    for session_id in session_ids:
+        turn_id = str(uuid4())
+        sessions.append({
+            "session_id": session_id,
+            "state": SessionState.RUNNING.value,
+            "current_node_id": start_node_id,
+            "open_turn_id": turn_id,
+            "next_turn_index": 1,
+            "next_event_seq": 2,
+            "orchestrator_graph_version": graph_version,
+            "runtime_version": 1,
+        })
+        turns.append({
+            "turn_id": turn_id,
+            "session_id": session_id,
+            "node_id": start_node_id,
+            "turn_index": 0,
+            "attempt_count": 0,
+        })
+        events.append({
+            "session_id": session_id,
+            "seq": 0,
+            "event_type": RuntimeEventType.TRANSITION.value,
+            "payload": {
+                "from": SessionState.CREATED.value,
+                "to": SessionState.RUNNING.value,
+                "node_id": start_node_id,
+            },
+            "runtime_version": 1,
+        })
+        events.append({
+            "session_id": session_id,
+            "seq": 1,
+            "event_type": RuntimeEventType.TURN_OPENED.value,
+            "payload": {"turn_id": turn_id, "node_id": start_node_id, "turn_index": 0},
+            "runtime_version": 1,
+        })
+
+    return sessions, turns, events
+
+
+def _existing(db: Session, session_ids: List[str]) -> set:
+    return set(db.scalars(
+        select(InterviewSessionRuntime.session_id)
+        .where(InterviewSessionRuntime.session_id.in_(session_ids))
+    ))
+
+
+def _insert_chunk(db: Session, session_ids: List[str], start_node_id: str, graph_version: str):
+    sessions, turns, events = _rows(session_ids, start_node_id, graph_version)
+    db.execute(insert(InterviewSessionRuntime), sessions)
+    db.execute(insert(InterviewQuestionTurn), turns)
+    db.execute(insert(InterviewRuntimeEvent), events)
+    db.commit()
+
+
+def _start_chunk(db: Session, session_ids: List[str], start_node_id: str,
+                 graph_version: str) -> Dict[str, Dict]:
+    existing = _existing(db, session_ids)
+    new_ids = [s for s in session_ids if s not in existing]
+    outcomes = {s: {"session_id": s, "status": EXISTS} for s in existing}
+
+    if new_ids:
+        try:
+            _insert_chunk(db, new_ids, start_node_id, graph_version)
+        except IntegrityError:
+            # Another writer created some of these ids since the SELECT;
+            # retry once without them.
+            db.rollback()
+            raced = _existing(db, new_ids)
+            outcomes.update({s: {"session_id": s, "status": EXISTS} for s in raced})
+            new_ids = [s for s in new_ids if s not in raced]
+            if new_ids:
+                _insert_chunk(db, new_ids, start_node_id, graph_version)
+
+    outcomes.update({
+        s: {"session_id": s, "status": STARTED, "runtime_version": 1}
+        for s in new_ids
+    })
+    return outcomes
+
+
+def batch_start_sessions(
+    db: Session,
+    orchestrator_adapter,
+    session_ids: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict:
+    """
+    Creates and starts every session id; returns the per-item results
+    (in request order) and the run's throughput.
+    """
+    started_at = time.perf_counter()
+
+    # Same transition check start_session() makes, once for the batch
+    SessionStateMachine.transition(SessionState.CREATED, SessionState.RUNNING)
+    start_node_id = orchestrator_adapter.start_node_id()
+    graph_version = orchestrator_adapter.graph_version()
+
+    session_ids = list(session_ids)
+    results: List[Optional[Dict]] = [None] * len(session_ids)
+    seen = set()
+    pending: List[int] = []
+
+    def flush(positions: List[int]):
+        chunk = [session_ids[i] for i in positions]
+        try:
+            outcomes = _start_chunk(db, chunk, start_node_id, graph_version)
+        except SQLAlchemyError as e:
+            db.rollback()
+            outcomes = {
+                s: {"session_id": s, "status": FAILED, "error": type(e).__name__}
+                for s in chunk
+            }
+        for i in positions:
+            results[i] = outcomes[session_ids[i]]
+
+        started = sum(1 for o in outcomes.values() if o["status"] == STARTED)
+        if started:
+            inc(FSM_TRANSITIONS, SessionState.CREATED.value, SessionState.RUNNING.value,
+                amount=started)
+
+    for i, session_id in enumerate(session_ids):
+        if not isinstance(session_id, str) or not session_id:
+            results[i] = {"session_id": session_id, "status": INVALID}
+            continue
+        if session_id in seen:
+            results[i] = {"session_id": session_id, "status": DUPLICATE}
+            continue
+        seen.add(session_id)
+
+        pending.append(i)
+        if len(pending) >= chunk_size:
+            flush(pending)
+            pending = []
+
+    if pending:
+        flush(pending)
+
+    elapsed = time.perf_counter() - started_at
+    started = sum(1 for r in results if r["status"] == STARTED)
+
+    return {
+        "requested": len(session_ids),
+        "started": started,
+        "not_started": len(session_ids) - started,
+        "elapsed_seconds": round(elapsed, 4),
+        "sessions_per_second": round(started / elapsed, 1) if elapsed else 0.0,
+        "results": results,
+    }
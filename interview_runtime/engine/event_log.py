@@ -0,0 +1,251 @@
+"""
+Runtime Event Log
+-----------------
+Append-only history of a session: one InterviewRuntimeEvent per FSM
+transition, turn open / close and answer attempt, committed together
+with the change it records.
+
+- Events are numbered per session from the session row's
+  next_event_seq, so (session_id, seq) is a dense, ordered key
+- Every SNAPSHOT_INTERVAL events the replayed state is stored as an
+  InterviewSessionSnapshot
+- replay() reads the newest snapshot and the events after it: one range
+  scan over a tail of about SNAPSHOT_INTERVAL events, however many turns
+  and retries the session had
+
+Configuration: RUNTIME_SNAPSHOT_INTERVAL (default 64).
+"""
+
+import copy
+import os
+from enum import Enum
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from interview_runtime.models import (
+    InterviewRuntimeEvent,
+    InterviewSessionRuntime,
+    InterviewSessionSnapshot,
+)
+
+SNAPSHOT_INTERVAL = int(os.getenv("RUNTIME_SNAPSHOT_INTERVAL", "64"))
+
+
+class RuntimeEventType(str, Enum):
+    TRANSITION = "transition"      # {"from", "to", "node_id"[, "reason"]}
+    TURN_OPENED = "turn_opened"    # {"turn_id", "node_id", "turn_index"}
+    ATTEMPT = "attempt"            # {"attempt_id", "turn_id", "attempt_index",
+                                   #  "is_final", "answer_payload", "audio"}
+    TURN_CLOSED = "turn_closed"    # {"turn_id", "node_id"}
+
+
+# -----------------------------
+# Replayed state
+# -----------------------------
+
+class SessionReplay:
+    """
+    Session state derived from its events. Non-final attempts are only
+    counted; final answers are kept (one per closed turn), so the state
+    stays small however many retries there were.
+    """
+
+    def __init__(self, state: Optional[Dict] = None):
+        state = copy.deepcopy(state or {})
+        self.seq: int = state.get("seq", -1)
+        self.state: Optional[str] = state.get("state")
+        self.current_node_id: Optional[str] = state.get("current_node_id")
+        # {"turn_id", "node_id", "turn_index", "attempts"}
+        self.open_turn: Optional[Dict] = state.get("open_turn")
+        self.turns_closed: int = state.get("turns_closed", 0)
+        self.attempts: int = state.get("attempts", 0)
+        self.retries: int = state.get("retries", 0)
+        # [{"turn_id", "node_id", "attempt_id", "answer_payload", "audio"}]
+        self.final_answers: List[Dict] = state.get("final_answers", [])
+
+    def apply(self, seq: int, event_type: str, payload: Dict):
+        event_type = RuntimeEventType(event_type)
+
+        if event_type == RuntimeEventType.TRANSITION:
+            self.state = payload["to"]
+            if "node_id" in payload:
+                self.current_node_id = payload["node_id"]
+
+        elif event_type == RuntimeEventType.TURN_OPENED:
+            self.open_turn = {
+                "turn_id": payload["turn_id"],
+                "node_id": payload["node_id"],
+                "turn_index": payload["turn_index"],
+                "attempts": 0,
+            }
+            self.current_node_id = payload["node_id"]
+
+        elif event_type == RuntimeEventType.ATTEMPT:
+            self.attempts += 1
+            turn = self.open_turn
+            if turn is not None and turn["turn_id"] == payload["turn_id"]:
+                turn["attempts"] += 1
+            if payload["is_final"]:
+                self.final_answers.append({
+                    "turn_id": payload["turn_id"],
+                    "node_id": turn["node_id"] if turn else None,
+                    "attempt_id": payload["attempt_id"],
+                    "answer_payload": payload["answer_payload"],
+                    "audio": payload.get("audio"),
+                })
+            else:
+                self.retries += 1
+
+        elif event_type == RuntimeEventType.TURN_CLOSED:
+            self.open_turn = None
+            self.turns_closed += 1
+
+        self.seq = seq
+
+    def to_dict(self) -> Dict:
+        return copy.deepcopy({
+            "seq": self.seq,
+            "state": self.state,
+            "current_node_id": self.current_node_id,
+            "open_turn": self.open_turn,
+            "turns_closed": self.turns_closed,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "final_answers": self.final_answers,
+        })
+
+
+# -----------------------------
+# Reading
+# -----------------------------
+
+def _event_dict(event: InterviewRuntimeEvent) -> Dict:
+    return {
+        "seq": event.seq,
+        "event_type": event.event_type,
+        "payload": event.payload,
+        "runtime_version": event.runtime_version,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+    }
+
+
+def read_events(
+    db: Session,
+    session_id: str,
+    after_seq: int = -1,
+    limit: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Events with seq > after_seq, in order; one (session_id, seq) range scan.
+    """
+    query = (
+        db.query(InterviewRuntimeEvent)
+        .filter(
+            InterviewRuntimeEvent.session_id == session_id,
+            InterviewRuntimeEvent.seq > after_seq,
+        )
+        .order_by(InterviewRuntimeEvent.seq)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return [_event_dict(event) for event in query]
+
+
+def replay(db: Session, session_id: str) -> SessionReplay:
+    """
+    Newest snapshot plus the events after it.
+    """
+    snapshot = (
+        db.query(InterviewSessionSnapshot)
+        .filter(InterviewSessionSnapshot.session_id == session_id)
+        .order_by(InterviewSessionSnapshot.seq.desc())
+        .first()
+    )
+    replayed = SessionReplay(snapshot.state if snapshot is not None else None)
+
+    tail = (
+        db.query(
+            InterviewRuntimeEvent.seq,
+            InterviewRuntimeEvent.event_type,
+            InterviewRuntimeEvent.payload,
+        )
+        .filter(
+            InterviewRuntimeEvent.session_id == session_id,
+            InterviewRuntimeEvent.seq > replayed.seq,
+        )
+        .order_by(InterviewRuntimeEvent.seq)
+    )
+    for seq, event_type, payload in tail:
+        replayed.apply(seq, event_type, payload)
+    return replayed
+
+
+# -----------------------------
+# Writing
+# -----------------------------
+
+class RuntimeEventLog:
+    """
+    Buffers a transaction's events; the engine flushes them just before
+    commit (stamped with the committed runtime_version) and discards
+    them on rollback.
+    """
+
+    def __init__(self, db: Session, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.db = db
+        self.snapshot_interval = snapshot_interval
+        self._pending: List[InterviewRuntimeEvent] = []
+
+    def record(self, session: InterviewSessionRuntime, event_type: RuntimeEventType, payload: Dict):
+        seq = session.next_event_seq or 0
+        session.next_event_seq = seq + 1
+        self._pending.append(InterviewRuntimeEvent(
+            session_id=session.session_id,
+            seq=seq,
+            event_type=event_type.value,
+            payload=payload,
+        ))
+
+    def discard(self):
+        self._pending.clear()
+
+    def flush(self, session: InterviewSessionRuntime):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        for event in pending:
+            event.runtime_version = session.runtime_version
+        self.db.add_all(pending)
+
+        if any((e.seq + 1) % self.snapshot_interval == 0 for e in pending):
+            self._snapshot(session.session_id, pending)
+
+    def _snapshot(self, session_id: str, pending: List[InterviewRuntimeEvent]):
+        # Committed state comes from the previous snapshot + its tail;
+        # this transaction's events are applied in memory.
+        replayed = replay(self.db, session_id)
+        for event in pending:
+            if event.seq > replayed.seq:
+                replayed.apply(event.seq, event.event_type, event.payload)
+
+        self.db.add(InterviewSessionSnapshot(
+            session_id=session_id,
+            seq=replayed.seq,
+            state=replayed.to_dict(),
+        ))
+
+    def record_committed(self, session_id: str, seq: int, runtime_version: int,
+                         event_type: RuntimeEventType, payload: Dict):
+        """
+        For writes that bypass the ORM session row (e.g. failing a
+        session with a single UPDATE that already reserved `seq`).
+        """
+        self.db.add(InterviewRuntimeEvent(
+            session_id=session_id,
+            seq=seq,
+            event_type=event_type.value,
+            payload=payload,
+            runtime_version=runtime_version,
+        ))
@@ -1,6 +1,8 @@
 from uuid import uuid4
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
 from interview_runtime.models import (
     InterviewSessionRuntime,
@@ -12,45 +14,214 @@ from interview_runtime.state_machine import (
     SessionStateMachine,
     InvalidTransitionError,
 )
+from interview_runtime.engine.event_log import RuntimeEventLog, RuntimeEventType
+from backend.metrics import (
+    FSM_TRANSITIONS,
+    SESSION_FAILURES,
+    VERSION_CONFLICTS,
+    inc,
+    timed_operation,
+)
 
 
 class RuntimeInvariantError(Exception):
     pass
 
 
+class VersionConflictError(Exception):
+    """
+    The session changed since the caller read it.
+    Nothing was written; the caller should re-read and retry.
+    """
+    pass
+
+
 class InterviewRuntimeEngine:
     """
     Transactional runtime engine.
     One instance per DB session.
+
+    Hot-path operations read one row set (session + open turn) and write
+    once at commit; turn and attempt indexes come from denormalized
+    counters instead of extra queries.
+
+    Concurrency is optimistic: the session and turn rows are versioned
+    (runtime_version / attempt_count), so a racing writer's UPDATE matches
+    no row and surfaces as VersionConflictError instead of a lost update.
+
+    Every transition, turn open / close and attempt is also appended to
+    the session's event log in the same commit.
     """
 
-    def __init__(self, db: Session, orchestrator_adapter):
+    def __init__(self, db: Session, orchestrator_adapter, state_cache=None, answer_scoring=None):
         self.db = db
         self.orchestrator = orchestrator_adapter
+        self.state_cache = state_cache
+        self.answer_scoring = answer_scoring
+        self.event_log = RuntimeEventLog(db)
+        # (from, to) made by the current operation; counted once committed
+        self._transitions = []
+
+        # Strong refs to turns loaded alongside their session; the
+        # identity map alone is weak and would let them be collected.
+        self._loaded_turns = {}
+        self._loaded_versions = {}
+
+    # -----------------------------
+    # Loading
+    # -----------------------------
+
+    @timed_operation("load_session")
+    def load_session(self, session_id: str) -> InterviewSessionRuntime | None:
+        """
+        Loads the session row together with its open turn in a single
+        round trip. The turn is kept on the engine, so later lookups by
+        open_turn_id do not hit the database. No row lock is taken;
+        writes are guarded by the version columns.
+        """
+        row = (
+            self.db.query(InterviewSessionRuntime, InterviewQuestionTurn)
+            .outerjoin(
+                InterviewQuestionTurn,
+                InterviewQuestionTurn.turn_id == InterviewSessionRuntime.open_turn_id,
+            )
+            .filter(InterviewSessionRuntime.session_id == session_id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+
+        session, turn = row
+        self._loaded_versions[session.session_id] = session.runtime_version
+        if turn is not None:
+            self._loaded_turns[turn.turn_id] = turn
+        return session
 
     # -----------------------------
     # Internal helpers
     # -----------------------------
 
-    def _fail_session(self, session: InterviewSessionRuntime, reason: str):
-        session.state = SessionState.FAILED.value
-        self.db.add(session)
+    def _fail_session(self, session: InterviewSessionRuntime, error: Exception):
+        # Single UPDATE: no reload of the rolled-back row. FAILED is a
+        # state change like any other, so it bumps the version (and
+        # reserves an event seq) too.
+        session_id = session.session_id
+        reason = str(error)
+        self.event_log.discard()
+        self._transitions.clear()
+        seq, runtime_version = self.db.execute(
+            update(InterviewSessionRuntime)
+            .where(InterviewSessionRuntime.session_id == session_id)
+            .values(
+                state=SessionState.FAILED.value,
+                runtime_version=InterviewSessionRuntime.runtime_version + 1,
+                next_event_seq=InterviewSessionRuntime.next_event_seq + 1,
+            )
+            .returning(
+                InterviewSessionRuntime.next_event_seq - 1,
+                InterviewSessionRuntime.runtime_version,
+            )
+        ).one()
+        self.event_log.record_committed(
+            session_id,
+            seq,
+            runtime_version,
+            RuntimeEventType.TRANSITION,
+            {"from": None, "to": SessionState.FAILED.value, "reason": reason},
+        )
         self.db.commit()
+
+        inc(SESSION_FAILURES, type(error).__name__)
+        inc(FSM_TRANSITIONS, "unknown", SessionState.FAILED.value)
+
+        loaded_version = self._loaded_versions.get(session_id)
+        self._invalidate_state(
+            session_id,
+            loaded_version + 1 if loaded_version is not None else None,
+        )
         raise RuntimeInvariantError(reason)
 
+    def _commit_version_bump(self, session: InterviewSessionRuntime):
+        session_id = session.session_id
+        new_version = session.runtime_version
+
+        self.db.add(session)
+        self.event_log.flush(session)
+        self.db.commit()
+
+        for from_state, to_state in self._transitions:
+            inc(FSM_TRANSITIONS, from_state, to_state)
+        self._transitions.clear()
+
+        self._invalidate_state(session_id, new_version)
+
+    def _invalidate_state(self, session_id: str, runtime_version: int | None):
+        if self.state_cache is not None:
+            self.state_cache.invalidate(session_id, runtime_version)
+
     def _assert_version(self, session: InterviewSessionRuntime, expected_version: int):
+        # Cheap early reject for stale clients; races between clients that
+        # read the same version are caught by the versioned UPDATE.
         if session.runtime_version != expected_version:
-            raise RuntimeInvariantError(
+            raise VersionConflictError(
                 "Concurrent modification detected for session"
             )
 
+    def _conflict(self, e: Exception, operation: str):
+        self.db.rollback()
+        self.event_log.discard()
+        self._transitions.clear()
+        inc(VERSION_CONFLICTS, operation)
+        if isinstance(e, VersionConflictError):
+            raise e
+        raise VersionConflictError(
+            "Concurrent modification detected for session"
+        ) from e
+
     def _increment_version(self, session: InterviewSessionRuntime):
         session.runtime_version += 1
 
+    def _open_turn(self, session: InterviewSessionRuntime) -> InterviewQuestionTurn | None:
+        if session.open_turn_id is None:
+            return None
+        turn = self._loaded_turns.get(session.open_turn_id)
+        if turn is None:
+            turn = self.db.get(InterviewQuestionTurn, session.open_turn_id)
+        return turn
+
+    def _present_node(self, session: InterviewSessionRuntime, node_id: str) -> InterviewQuestionTurn:
+        turn = InterviewQuestionTurn(
+            turn_id=str(uuid4()),
+            session_id=session.session_id,
+            node_id=node_id,
+            turn_index=session.next_turn_index or 0,
+            attempt_count=0,
+        )
+        session.open_turn_id = turn.turn_id
+        session.next_turn_index = turn.turn_index + 1
+        self.db.add(turn)
+        self.event_log.record(session, RuntimeEventType.TURN_OPENED, {
+            "turn_id": turn.turn_id,
+            "node_id": node_id,
+            "turn_index": turn.turn_index,
+        })
+        return turn
+
+    def _set_state(self, session: InterviewSessionRuntime, to_state: SessionState):
+        from_state = session.state
+        session.state = to_state.value
+        self._transitions.append((from_state, to_state.value))
+        self.event_log.record(session, RuntimeEventType.TRANSITION, {
+            "from": from_state,
+            "to": to_state.value,
+            "node_id": session.current_node_id,
+        })
+
     # -----------------------------
     # Public runtime operations
     # -----------------------------
 
+    @timed_operation("start_session")
     def start_session(
         self,
         session: InterviewSessionRuntime,
@@ -62,76 +233,93 @@ class InterviewRuntimeEngine:
                 SessionState.RUNNING,
             )
 
-            session.state = SessionState.RUNNING.value
             session.current_node_id = start_node_id
+            self._set_state(session, SessionState.RUNNING)
 
-            turn = InterviewQuestionTurn(
-                turn_id=str(uuid4()),
-                session_id=session.session_id,
-                node_id=start_node_id,
-                turn_index=0,
-            )
+            self._present_node(session, start_node_id)
 
             self._increment_version(session)
 
-            self.db.add(turn)
-            self.db.add(session)
-            self.db.commit()
+            self._commit_version_bump(session)
+
+        except (StaleDataError, IntegrityError) as e:
+            self._conflict(e, "start_session")
 
         except (InvalidTransitionError, SQLAlchemyError) as e:
             self.db.rollback()
-            self._fail_session(session, str(e))
+            self._fail_session(session, e)
 
+    @timed_operation("submit_answer")
     def submit_answer(
         self,
         session: InterviewSessionRuntime,
         answer_payload: dict,
         is_final: bool,
         expected_runtime_version: int,
+        audio_ref: dict | None = None,
+        evidence: list | None = None,
     ):
+        # evidence: extracted by the server (e.g. from spooled audio);
+        # never taken from the client's payload
         try:
             self._assert_version(session, expected_runtime_version)
 
             if not SessionStateMachine.can_accept_answers(SessionState(session.state)):
                 raise RuntimeInvariantError("Session not accepting answers")
 
-            # Fetch current open turn
-            turn = (
-                self.db.query(InterviewQuestionTurn)
-                .filter(
-                    InterviewQuestionTurn.session_id == session.session_id,
-                    InterviewQuestionTurn.closed_at.is_(None),
-                )
-                .one_or_none()
-            )
+            # Current open turn (already loaded by load_session)
+            turn = self._open_turn(session)
 
             if not turn:
                 raise RuntimeInvariantError("No open question turn")
 
-            # Determine attempt index
-            attempt_count = (
-                self.db.query(InterviewAnswerAttempt)
-                .filter(InterviewAnswerAttempt.turn_id == turn.turn_id)
-                .count()
-            )
-
             attempt = InterviewAnswerAttempt(
                 attempt_id=str(uuid4()),
                 turn_id=turn.turn_id,
-                attempt_index=attempt_count,
+                attempt_index=turn.attempt_count,
                 answer_payload=answer_payload,
                 is_final=is_final,
             )
+            if audio_ref is not None:
+                # Reference to spooled audio; the bytes stay on disk
+                attempt.audio_path = audio_ref["path"]
+                attempt.audio_offset = audio_ref["offset"]
+                attempt.audio_length = audio_ref["length"]
+                attempt.audio_checksum = audio_ref["checksum"]
+            turn.attempt_count += 1
 
             self.db.add(attempt)
+            self.event_log.record(session, RuntimeEventType.ATTEMPT, {
+                "attempt_id": attempt.attempt_id,
+                "turn_id": turn.turn_id,
+                "attempt_index": attempt.attempt_index,
+                "is_final": is_final,
+                "answer_payload": answer_payload,
+                "audio": audio_ref,
+            })
 
             # If not final, no transition
             if not is_final:
+                self.event_log.flush(session)
                 self.db.commit()
                 return
 
+            # Fold the answer into the running score (same commit)
+            if self.answer_scoring is not None:
+                session.score_state = self.answer_scoring.record(
+                    session,
+                    self.orchestrator.get_node(session.current_node_id)["skill_id"],
+                    answer_payload,
+                    evidence=evidence,
+                )
+
             # Close turn
-            turn.closed_at = self.db.func.now()
+            turn.closed_at = func.now()
+            session.open_turn_id = None
+            self.event_log.record(session, RuntimeEventType.TURN_CLOSED, {
+                "turn_id": turn.turn_id,
+                "node_id": turn.node_id,
+            })
 
             # Ask orchestrator for next node
             next_node_id = self.orchestrator.next_node(
@@ -144,29 +332,25 @@ class InterviewRuntimeEngine:
                     SessionState(session.state),
                     SessionState.COMPLETED,
                 )
-                session.state = SessionState.COMPLETED.value
                 session.current_node_id = None
+                self._set_state(session, SessionState.COMPLETED)
             else:
                 # Advance to next node
-                new_turn = InterviewQuestionTurn(
-                    turn_id=str(uuid4()),
-                    session_id=session.session_id,
-                    node_id=next_node_id,
-                    turn_index=turn.turn_index + 1,
-                )
                 session.current_node_id = next_node_id
-                self.db.add(new_turn)
+                self._present_node(session, next_node_id)
 
             self._increment_version(session)
 
-            self.db.add(turn)
-            self.db.add(session)
-            self.db.commit()
+            self._commit_version_bump(session)
+
+        except (VersionConflictError, StaleDataError, IntegrityError) as e:
+            self._conflict(e, "submit_answer")
 
         except (InvalidTransitionError, RuntimeInvariantError, SQLAlchemyError) as e:
             self.db.rollback()
-            self._fail_session(session, str(e))
+            self._fail_session(session, e)
 
+    @timed_operation("pause_session")
     def pause_session(
         self,
         session: InterviewSessionRuntime,
@@ -181,30 +365,24 @@ class InterviewRuntimeEngine:
             )
 
             # Ensure no open question
-            open_turn = (
-                self.db.query(InterviewQuestionTurn)
-                .filter(
-                    InterviewQuestionTurn.session_id == session.session_id,
-                    InterviewQuestionTurn.closed_at.is_(None),
-                )
-                .one_or_none()
-            )
-
-            if open_turn:
+            if session.open_turn_id is not None:
                 raise RuntimeInvariantError(
                     "Cannot pause with an open question turn"
                 )
 
-            session.state = SessionState.PAUSED.value
+            self._set_state(session, SessionState.PAUSED)
             self._increment_version(session)
 
-            self.db.add(session)
-            self.db.commit()
+            self._commit_version_bump(session)
+
+        except (VersionConflictError, StaleDataError, IntegrityError) as e:
+            self._conflict(e, "pause_session")
 
         except (InvalidTransitionError, RuntimeInvariantError, SQLAlchemyError) as e:
             self.db.rollback()
-            self._fail_session(session, str(e))
+            self._fail_session(session, e)
 
+    @timed_operation("resume_session")
     def resume_session(
         self,
         session: InterviewSessionRuntime,
@@ -219,45 +397,24 @@ class InterviewRuntimeEngine:
             )
 
             # Ensure there is no open turn
-            open_turn = (
-                self.db.query(InterviewQuestionTurn)
-                .filter(
-                    InterviewQuestionTurn.session_id == session.session_id,
-                    InterviewQuestionTurn.closed_at.is_(None),
-                )
-                .one_or_none()
-            )
-
-            if open_turn:
+            if session.open_turn_id is not None:
                 raise RuntimeInvariantError("Open turn exists on resume")
 
             if not session.current_node_id:
                 raise RuntimeInvariantError("No current node to resume")
 
-            # Create new turn for the current node
-            last_turn = (
-                self.db.query(InterviewQuestionTurn)
-                .filter(InterviewQuestionTurn.session_id == session.session_id)
-                .order_by(InterviewQuestionTurn.turn_index.desc())
-                .first()
-            )
-
-            next_index = 0 if not last_turn else last_turn.turn_index + 1
+            self._set_state(session, SessionState.RUNNING)
 
-            turn = InterviewQuestionTurn(
-                turn_id=str(uuid4()),
-                session_id=session.session_id,
-                node_id=session.current_node_id,
-                turn_index=next_index,
-            )
+            # Create new turn for the current node
+            self._present_node(session, session.current_node_id)
 
-            session.state = SessionState.RUNNING.value
             self._increment_version(session)
 
-            self.db.add(turn)
-            self.db.add(session)
-            self.db.commit()
+            self._commit_version_bump(session)
+
+        except (VersionConflictError, StaleDataError, IntegrityError) as e:
+            self._conflict(e, "resume_session")
 
         except (InvalidTransitionError, RuntimeInvariantError, SQLAlchemyError) as e:
             self.db.rollback()
-            self._fail_session(session, str(e))
+            self._fail_session(session, e)
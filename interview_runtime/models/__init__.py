@@ -1,9 +1,13 @@
 from .session_runtime import InterviewSessionRuntime
 from .question_turn import InterviewQuestionTurn
 from .answer_attempt import InterviewAnswerAttempt
+from .runtime_event import InterviewRuntimeEvent
+from .session_snapshot import InterviewSessionSnapshot
 
 __all__ = [
     "InterviewSessionRuntime",
     "InterviewQuestionTurn",
     "InterviewAnswerAttempt",
+    "InterviewRuntimeEvent",
+    "InterviewSessionSnapshot",
 ]
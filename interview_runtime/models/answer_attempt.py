@@ -2,14 +2,16 @@ from sqlalchemy import (
     Column,
     String,
     Integer,
+    BigInteger,
     DateTime,
     Boolean,
     ForeignKey,
+    JSON,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
-from db.base import Base
+from backend.database import Base
 
 
 class InterviewAnswerAttempt(Base):
@@ -23,7 +25,13 @@ class InterviewAnswerAttempt(Base):
     turn_id = Column(String, ForeignKey("interview_question_turn.turn_id"), nullable=False)
 
     attempt_index = Column(Integer, nullable=False)
-    answer_payload = Column(JSONB, nullable=False)
+    answer_payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    # Spooled audio (see interview_runtime.audio); never inlined in the payload
+    audio_path = Column(String, nullable=True)
+    audio_offset = Column(BigInteger, nullable=True)
+    audio_length = Column(BigInteger, nullable=True)
+    audio_checksum = Column(String, nullable=True)
 
     is_final = Column(Boolean, nullable=False, default=False)
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -8,7 +8,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.sql import func
 
-from db.base import Base
+from backend.database import Base
 
 
 class InterviewQuestionTurn(Base):
@@ -24,9 +24,19 @@ class InterviewQuestionTurn(Base):
     node_id = Column(String, nullable=False)
     turn_index = Column(Integer, nullable=False)
 
+    # Number of attempts recorded so far (next attempt_index)
+    attempt_count = Column(Integer, nullable=False, default=0)
+
     presented_at = Column(DateTime(timezone=True), server_default=func.now())
     closed_at = Column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
         UniqueConstraint("session_id", "turn_index", name="uq_session_turn_index"),
     )
+
+    # Concurrent attempts on the same turn race on attempt_count;
+    # the loser's UPDATE matches no row and is rejected.
+    __mapper_args__ = {
+        "version_id_col": attempt_count,
+        "version_id_generator": False,
+    }
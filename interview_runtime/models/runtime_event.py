@@ -0,0 +1,38 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    JSON,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from backend.database import Base
+
+
+class InterviewRuntimeEvent(Base):
+    """
+    One row = one runtime event (FSM transition, turn open / close,
+    answer attempt), numbered per session.
+    Append-only.
+    """
+    __tablename__ = "interview_runtime_event"
+
+    # (session_id, seq) is the primary key, so a session's history is one
+    # index range scan; a racing writer reusing a seq fails on insert.
+    session_id = Column(
+        String,
+        ForeignKey("interview_session_runtime.session_id"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True, autoincrement=False)
+
+    event_type = Column(String, nullable=False)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    # Session runtime_version the event was committed with
+    runtime_version = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
-from db.base import Base  # adjust import if needed
+from backend.database import Base
 
 
 class InterviewSessionRuntime(Base):
@@ -17,8 +18,27 @@ class InterviewSessionRuntime(Base):
     state = Column(String, nullable=False)  # CREATED, RUNNING, PAUSED, COMPLETED, FAILED
     current_node_id = Column(String, nullable=True)
 
+    # Denormalized turn bookkeeping (avoids per-answer lookups)
+    open_turn_id = Column(String, nullable=True)
+    next_turn_index = Column(Integer, nullable=False, default=0)
+
+    # Next InterviewRuntimeEvent.seq for this session
+    next_event_seq = Column(Integer, nullable=False, default=0)
+
     # Determinism & safety
     orchestrator_graph_version = Column(String, nullable=False)
     runtime_version = Column(Integer, nullable=False, default=0)
 
+    # Running deterministic score (IncrementalScorer.state()), updated
+    # with every final answer
+    score_state = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+
     state_updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Optimistic concurrency: every UPDATE is issued as
+    # "... WHERE session_id = ? AND runtime_version = <loaded>"; the engine
+    # sets the new value itself.
+    __mapper_args__ = {
+        "version_id_col": runtime_version,
+        "version_id_generator": False,
+    }
@@ -0,0 +1,31 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    JSON,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from backend.database import Base
+
+
+class InterviewSessionSnapshot(Base):
+    """
+    One row = the replayed session state after event `seq`.
+    Immutable; replay starts from the newest one.
+    """
+    __tablename__ = "interview_session_snapshot"
+
+    session_id = Column(
+        String,
+        ForeignKey("interview_session_runtime.session_id"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True, autoincrement=False)
+
+    state = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,60 @@
+"""
+Orchestrator Adapter
+--------------------
+Read-only view of the active question graph for the runtime engine.
+
+- Backed by the config registry (no JSON I/O per call)
+- NO persistence
+- NO scoring
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from evaluation.compiled_rubric import thaw
+from orchestrator.config_registry import (
+    DEFAULT_QUESTION_GRAPH,
+    CompiledQuestionGraph,
+    get_config_registry,
+)
+
+
+class OrchestratorAdapter:
+    def __init__(self, graph_path: Path = DEFAULT_QUESTION_GRAPH, registry=None):
+        self.graph_path = graph_path
+        self.registry = registry or get_config_registry()
+
+    def graph(self) -> CompiledQuestionGraph:
+        return self.registry.question_graph(self.graph_path)
+
+    def graph_version(self) -> str:
+        return self.graph().config_version
+
+    def start_node_id(self) -> str:
+        return self.graph().start_node
+
+    def get_node(self, node_id: str) -> Dict:
+        return thaw(self.graph().nodes[node_id])
+
+    def next_node(self, current_node_id: str) -> Optional[str]:
+        return self.graph().next_node(current_node_id)
+
+    def progress(self, node_id: str) -> float:
+        return self.graph().progress(node_id)
+
+    def questions_remaining(self, node_id: str) -> int:
+        return self.graph().questions_remaining(node_id)
+
+
+_adapter = None
+_adapter_lock = threading.Lock()
+
+
+def get_orchestrator_adapter() -> OrchestratorAdapter:
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = OrchestratorAdapter()
+    return _adapter
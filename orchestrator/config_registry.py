@@ -0,0 +1,232 @@
+"""
+Config Registry
+---------------
+Process-wide cache of compiled interview configs.
+
+- Each file is read, validated and compiled exactly once per version
+- Compiled configs are immutable and keyed by (version, path)
+- Files are re-checked by mtime and hot-swapped atomically
+- Reload is lazy: a lookup re-stats its file once check_interval
+  (CONFIG_CHECK_INTERVAL) has passed since the last check; there is no
+  background watcher
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from evaluation.compiled_rubric import (
+    CompiledRubric,
+    RubricValidationError,
+    compile_rubric,
+    freeze,
+)
+from evaluation.evidence_extractor import (
+    CompiledEvidenceRules,
+    EvidenceRuleError,
+    compile_evidence_rules,
+)
+from orchestrator.graph_compiler import (
+    CompiledQuestionGraph,
+    GraphValidationError,
+    compile_question_graph,
+)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_ROLE_CONFIG = ROOT_DIR / "configs" / "roles" / "swe_entry_mid.json"
+DEFAULT_QUESTION_GRAPH = ROOT_DIR / "configs" / "question_graphs" / "swe_graph.json"
+DEFAULT_RUBRIC = ROOT_DIR / "configs" / "rubrics" / "swe_rubric.json"
+DEFAULT_EVIDENCE_RULES = ROOT_DIR / "configs" / "evidence_rules" / "swe_evidence_rules.json"
+
+
+class ConfigValidationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledRoleConfig:
+    config_version: str
+    config: Mapping[str, Any]
+
+    def __getitem__(self, key):
+        return self.config[key]
+
+
+def compile_role_config(role_config: Dict) -> CompiledRoleConfig:
+    for field in ("role", "level"):
+        if field not in role_config:
+            raise ConfigValidationError(f"Role config is missing {field}")
+
+    return CompiledRoleConfig(
+        config_version=role_config.get("versioning", {}).get("config_version", ""),
+        config=freeze(role_config),
+    )
+
+
+def _version_of(compiled) -> str:
+    if isinstance(compiled, CompiledRubric):
+        return compiled.rubric_version
+    return compiled.config_version
+
+
+@dataclass
+class _Entry:
+    key: Tuple[str, str]
+    mtime_ns: int
+    size: int
+    compiled: Any
+    checked_at: float
+
+
+class ConfigRegistry:
+    """
+    Thread-safe registry of compiled configs.
+
+    Readers never block on a reload: the current entry for a path is
+    replaced in a single assignment once the new version has compiled.
+    A file that fails validation on reload keeps serving the previous
+    version; the error is kept in `last_errors`.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self.last_errors: Dict[str, str] = {}
+        self._current: Dict[str, _Entry] = {}
+        self._versions: Dict[Tuple[str, str], Any] = {}
+        self._compilers: Dict[str, Callable[[Dict], Any]] = {}
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # Loading
+    # -----------------------------
+
+    def _load(self, path: str, compiler: Callable[[Dict], Any]) -> _Entry:
+        stat = os.stat(path)
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+
+        compiled = compiler(raw)
+        key = (_version_of(compiled), path)
+
+        return _Entry(
+            key=key,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            compiled=compiled,
+            checked_at=time.monotonic(),
+        )
+
+    def _install(self, path: str, entry: _Entry):
+        self._versions.setdefault(entry.key, entry.compiled)
+        self._current[path] = entry
+        self.last_errors.pop(path, None)
+
+    def _reload_if_changed(self, path: str, entry: _Entry) -> _Entry:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return entry
+
+        if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+            entry.checked_at = time.monotonic()
+            return entry
+
+        with self._lock:
+            current = self._current[path]
+            if current is not entry:
+                return current
+            try:
+                new_entry = self._load(path, self._compilers[path])
+            except (
+                OSError,
+                ValueError,
+                ConfigValidationError,
+                GraphValidationError,
+                RubricValidationError,
+                EvidenceRuleError,
+            ) as e:
+                self.last_errors[path] = str(e)
+                entry.checked_at = time.monotonic()
+                return entry
+            self._install(path, new_entry)
+            return new_entry
+
+    def _get(self, path, compiler: Callable[[Dict], Any]):
+        path = str(Path(path).resolve())
+        entry = self._current.get(path)
+
+        if entry is None:
+            with self._lock:
+                entry = self._current.get(path)
+                if entry is None:
+                    if not os.path.exists(path):
+                        raise FileNotFoundError(f"Missing file: {path}")
+                    entry = self._load(path, compiler)
+                    self._compilers[path] = compiler
+                    self._install(path, entry)
+            return entry.compiled
+
+        if time.monotonic() - entry.checked_at >= self.check_interval:
+            entry = self._reload_if_changed(path, entry)
+
+        return entry.compiled
+
+    # -----------------------------
+    # Public accessors
+    # -----------------------------
+
+    def question_graph(self, path=DEFAULT_QUESTION_GRAPH) -> CompiledQuestionGraph:
+        return self._get(path, compile_question_graph)
+
+    def rubric(self, path=DEFAULT_RUBRIC) -> CompiledRubric:
+        return self._get(path, compile_rubric)
+
+    def role_config(self, path=DEFAULT_ROLE_CONFIG) -> CompiledRoleConfig:
+        return self._get(path, compile_role_config)
+
+    def evidence_rules(self, path=DEFAULT_EVIDENCE_RULES) -> CompiledEvidenceRules:
+        return self._get(path, compile_evidence_rules)
+
+    def get_version(self, version: str, path) -> Optional[Any]:
+        """
+        Returns a previously loaded version, e.g. the graph a running
+        session was started on, even after the file has moved on.
+        """
+        return self._versions.get((version, str(Path(path).resolve())))
+
+    def evidence_rules_for(self, rubric_version: str,
+                           path=DEFAULT_EVIDENCE_RULES) -> Optional[CompiledEvidenceRules]:
+        """
+        The evidence rules written for a rubric version: the current file
+        if it matches, else the newest loaded version that does.
+        """
+        current = self.evidence_rules(path)
+        if current.rubric_version in ("", rubric_version):
+            return current
+
+        path = str(Path(path).resolve())
+        matching = None
+        for (_, versioned_path), rules in list(self._versions.items()):
+            if versioned_path == path and rules.rubric_version == rubric_version:
+                matching = rules
+        return matching
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_config_registry() -> ConfigRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ConfigRegistry(
+                    check_interval=float(os.getenv("CONFIG_CHECK_INTERVAL", "1.0"))
+                )
+    return _registry
@@ -0,0 +1,225 @@
+"""
+Question Graph Compiler
+-----------------------
+Validates a question graph once at load time and precomputes a
+traversal index, so runtime lookups never walk the graph.
+
+- Every node must be reachable from start_node and must reach end_node
+- Traversal follows move_forward; conditional branches (success /
+  partial / failure, ...) are validated and indexed but their
+  conditions are not evaluated, so every node but end_node needs a
+  move_forward transition
+- The graph must be acyclic (no visited-set needed while traversing)
+- Nodes get a dense index in topological order
+- One successor table per transition name (move_forward, conditional
+  success / partial / failure branches, ...)
+- Remaining depth per node gives constant-time progress and
+  "questions remaining"
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from evaluation.compiled_rubric import freeze
+
+DEFAULT_TRANSITION = "move_forward"
+
+# Marks "no successor" in the dense successor tables
+NO_NODE = -1
+
+REQUIRED_NODE_FIELDS = ("section", "skill_id", "prompt_id", "transitions")
+THRESHOLD_FIELDS = ("success_threshold", "partial_threshold", "failure_threshold")
+
+
+class GraphValidationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledQuestionGraph:
+    config_version: str
+    start_node: str
+    end_node: str
+    nodes: Mapping[str, Mapping[str, Any]]
+    transitions: Mapping[str, Mapping[str, str]]
+
+    # Traversal index (positions follow topological order)
+    node_ids: Tuple[str, ...]
+    node_index: Mapping[str, int]
+    successors: Mapping[str, Tuple[int, ...]]
+    depth: Tuple[int, ...]
+    remaining_depth: Tuple[int, ...]
+
+    @property
+    def topological_order(self) -> Tuple[str, ...]:
+        return self.node_ids
+
+    def next_node(self, node_id: str, transition: str = DEFAULT_TRANSITION) -> Optional[str]:
+        table = self.successors.get(transition)
+        if table is None:
+            return None
+        target = table[self.node_index[node_id]]
+        return None if target == NO_NODE else self.node_ids[target]
+
+    def questions_remaining(self, node_id: str) -> int:
+        """
+        Questions still to come after node_id on the longest path.
+        """
+        return self.remaining_depth[self.node_index[node_id]] - 1
+
+    def progress(self, node_id: str) -> float:
+        """
+        Fraction of the interview completed when node_id is presented,
+        measured along the longest path through node_id.
+        """
+        i = self.node_index[node_id]
+        return self.depth[i] / (self.depth[i] + self.remaining_depth[i])
+
+
+# -----------------------------
+# Validation
+# -----------------------------
+
+def _validate_structure(graph: Dict):
+    for field in ("start_node", "end_node", "nodes"):
+        if field not in graph:
+            raise GraphValidationError(f"Question graph is missing {field}")
+
+    nodes = graph["nodes"]
+    for field in ("start_node", "end_node"):
+        if graph[field] not in nodes:
+            raise GraphValidationError(f"Unknown {field}: {graph[field]}")
+
+    for node_id, node in nodes.items():
+        for field in REQUIRED_NODE_FIELDS:
+            if field not in node:
+                raise GraphValidationError(f"Node {node_id} is missing {field}")
+
+        for field in THRESHOLD_FIELDS:
+            if field in node and not isinstance(node[field], (int, float)):
+                raise GraphValidationError(f"Node {node_id} {field} must be a number")
+
+        if node_id != graph["end_node"] and DEFAULT_TRANSITION not in node["transitions"]:
+            raise GraphValidationError(
+                f"Node {node_id} has no {DEFAULT_TRANSITION} transition"
+            )
+
+        for name, transition in node["transitions"].items():
+            target = transition.get("then")
+            if target not in nodes:
+                raise GraphValidationError(
+                    f"Node {node_id} transition {name} targets unknown node {target}"
+                )
+            if "if" in transition and not isinstance(transition["if"], str):
+                raise GraphValidationError(
+                    f"Node {node_id} transition {name} has a non-string condition"
+                )
+
+
+def _topological_order(nodes: Dict) -> List[str]:
+    """
+    Kahn's algorithm; ties keep file order so indexes are stable.
+    """
+    in_degree = {node_id: 0 for node_id in nodes}
+    for node in nodes.values():
+        for target in {t["then"] for t in node["transitions"].values()}:
+            in_degree[target] += 1
+
+    ready = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    order = []
+    while ready:
+        node_id = ready.popleft()
+        order.append(node_id)
+        for target in dict.fromkeys(t["then"] for t in nodes[node_id]["transitions"].values()):
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+
+    if len(order) != len(nodes):
+        cyclic = sorted(node_id for node_id, degree in in_degree.items() if degree > 0)
+        raise GraphValidationError(f"Question graph has a cycle through: {', '.join(cyclic)}")
+
+    return order
+
+
+# -----------------------------
+# Compilation
+# -----------------------------
+
+def compile_question_graph(graph: Dict) -> CompiledQuestionGraph:
+    _validate_structure(graph)
+
+    nodes = graph["nodes"]
+    start_node = graph["start_node"]
+    end_node = graph["end_node"]
+
+    order = _topological_order(nodes)
+    index = {node_id: i for i, node_id in enumerate(order)}
+    edges = [
+        sorted({index[t["then"]] for t in nodes[node_id]["transitions"].values()})
+        for node_id in order
+    ]
+
+    # Longest path (in questions) from start, forward over topological order
+    depth = [None] * len(order)
+    depth[index[start_node]] = 0
+    for i in range(len(order)):
+        if depth[i] is None:
+            continue
+        for j in edges[i]:
+            if depth[j] is None or depth[j] < depth[i] + 1:
+                depth[j] = depth[i] + 1
+
+    unreachable = [order[i] for i, d in enumerate(depth) if d is None]
+    if unreachable:
+        raise GraphValidationError(
+            f"Nodes unreachable from {start_node}: {', '.join(unreachable)}"
+        )
+
+    # Longest path (in questions, inclusive) to end, backward
+    remaining = [None] * len(order)
+    remaining[index[end_node]] = 1
+    for i in reversed(range(len(order))):
+        for j in edges[i]:
+            if remaining[j] is not None and (remaining[i] is None or remaining[i] < remaining[j] + 1):
+                remaining[i] = remaining[j] + 1
+
+    dead_ends = [order[i] for i, r in enumerate(remaining) if r is None]
+    if dead_ends:
+        raise GraphValidationError(
+            f"Nodes that never reach {end_node}: {', '.join(dead_ends)}"
+        )
+
+    transition_names = dict.fromkeys(
+        name for node in nodes.values() for name in node["transitions"]
+    )
+    successors = {}
+    for name in transition_names:
+        table = [NO_NODE] * len(order)
+        for node_id, i in index.items():
+            transition = nodes[node_id]["transitions"].get(name)
+            if transition is not None:
+                table[i] = index[transition["then"]]
+        successors[name] = tuple(table)
+
+    transitions = {
+        node_id: MappingProxyType({
+            name: t["then"] for name, t in node["transitions"].items()
+        })
+        for node_id, node in nodes.items()
+    }
+
+    return CompiledQuestionGraph(
+        config_version=graph.get("versioning", {}).get("config_version", ""),
+        start_node=start_node,
+        end_node=end_node,
+        nodes=freeze(nodes),
+        transitions=MappingProxyType(transitions),
+        node_ids=tuple(order),
+        node_index=MappingProxyType(index),
+        successors=MappingProxyType(successors),
+        depth=tuple(depth),
+        remaining_depth=tuple(remaining),
+    )
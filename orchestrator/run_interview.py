@@ -10,20 +10,43 @@ sys.path.insert(0, str(ROOT_DIR))
 # ============================================================
 # STANDARD IMPORTS
 # ============================================================
+import asyncio
 import json
+from concurrent.futures import Future
 
 # ============================================================
 # AI RUNTIME (ASSISTIVE ONLY – NOT SCORING)
 # ============================================================
-from interview_runtime.ai_layer.ai_interviewer import render_question
-from interview_runtime.ai_layer.transcription import transcribe_audio
+from interview_runtime.ai_layer.render_cache import get_render_cache
+from interview_runtime.ai_layer.transcription import transcribe_stream
 
 # ============================================================
 # EVALUATION (PURE / DETERMINISTIC)
 # ============================================================
-from evaluation.scoring_engine import evaluate_candidate
-from evaluation.confidence import derive_overall_confidence
-from evaluation.ai_score_advisor import ai_score_advisor
+from evaluation.incremental_scoring import IncrementalScorer
+from evaluation.advisory_runner import get_advisory_runner
+from evaluation.compiled_rubric import CompiledRubric, compile_rubric
+from evaluation.evidence_extractor import extract_streamed, get_evidence_extractor
+
+# ============================================================
+# METRICS (NO-OPS UNLESS METRICS_ENABLED)
+# ============================================================
+from backend.metrics import (
+    ADVISORY_OUTCOMES,
+    STAGE_SECONDS,
+    inc,
+    observe,
+    stage_timer,
+)
+
+# ============================================================
+# CONFIGS (COMPILED / CACHED)
+# ============================================================
+from orchestrator.config_registry import (
+    CompiledQuestionGraph,
+    compile_question_graph,
+    get_config_registry,
+)
 
 # ============================================================
 # PROJECT ROOT
@@ -53,10 +76,72 @@ def save_final_evaluation(payload: dict):
     print(f"\n[SAVE] outputs/final_evaluation.json")
 
 
+# ============================================================
+# STREAMED ANSWERS
+# ============================================================
+async def spoken_chunks(text: str):
+    """
+    Placeholder audio source: the answer arrives word by word, the way
+    a live STT stream would deliver it.
+    """
+    yield "[AUDIO] "
+    for word in text.split():
+        yield word + " "
+
+
+async def stream_answer(
+    audio_chunks,
+    evidence_extractor,
+    skill_id: str,
+    transcription_backend=None,
+) -> dict:
+    """
+    Transcribes an answer while it is spoken and extracts evidence from
+    each final segment as it arrives, so the response is ready for
+    scoring as soon as the audio stream ends.
+
+    Returns the transcript, its segments (partials included) and the
+    evidence / evidence_matches simulate_interview records.
+    """
+    return await extract_streamed(
+        transcribe_stream(audio_chunks, backend=transcription_backend),
+        evidence_extractor,
+        skill_id=skill_id,
+    )
+
+
 # ============================================================
 # INTERVIEW LOOP
 # ============================================================
-def simulate_interview(role_config: dict, question_graph: dict) -> dict:
+def simulate_interview(
+    role_config,
+    question_graph,
+    answer_provider=None,
+    evidence_extractor=None,
+    on_response=None,
+) -> dict:
+    """
+    Walks the question graph and collects deterministic evidence.
+
+    question_graph may be a raw dict or a CompiledQuestionGraph.
+    answer_provider(node_id) -> str supplies the candidate's spoken answer
+    for a node. Defaults to reading from stdin.
+    evidence_extractor defaults to the active rubric + evidence rules.
+    on_response(response) is called as each response is recorded.
+    """
+    if not isinstance(question_graph, CompiledQuestionGraph):
+        question_graph = compile_question_graph(question_graph)
+
+    if evidence_extractor is None:
+        registry = get_config_registry()
+        evidence_extractor = get_evidence_extractor(
+            registry.rubric(),
+            registry.evidence_rules(),
+        )
+
+    if answer_provider is None:
+        answer_provider = lambda _node_id: input("\nCandidate says: ")
+
     print("\n========== INTERVIEW START ==========")
     print("Role :", role_config["role"])
     print("Level:", ", ".join(role_config["level"]))
@@ -65,71 +150,151 @@ def simulate_interview(role_config: dict, question_graph: dict) -> dict:
     evaluation_input = {
         "candidate_id": "CAND_SIM_001",
         "role": role_config["role"],
-        "level": role_config["level"],
+        "level": list(role_config["level"]),
         "responses": []
     }
 
-    nodes = question_graph["nodes"]
-    current_node_id = question_graph["start_node"]
-    end_node_id = question_graph["end_node"]
-
-    visited = set()
-
-    while current_node_id and current_node_id not in visited:
-        visited.add(current_node_id)
-        node = nodes[current_node_id]
-
-        print("\n[QUESTION]")
-        print("Node      :", current_node_id)
-        print("Section   :", node["section"])
-        print("Skill ID  :", node["skill_id"])
-        print("Prompt    :", node["prompt_id"])
-        print("Difficulty:", node["difficulty"])
-
-        ai_q = render_question(
-            question_id=current_node_id,
-            question_text=node["prompt_id"],
-            allowed_template_ids=["F1"],
-            followup_policy={
-                "enabled": False,
-                "max_followups": 0
+    nodes = question_graph.nodes
+    current_node_id = question_graph.start_node
+
+    # One event loop per interview drives the streamed answers
+    loop = asyncio.new_event_loop()
+    try:
+        # Compiled graphs are acyclic, so the walk always terminates
+        while current_node_id:
+            node = nodes[current_node_id]
+
+            print("\n[QUESTION]")
+            print("Node      :", current_node_id)
+            print("Section   :", node["section"])
+            print("Skill ID  :", node["skill_id"])
+            print("Prompt    :", node["prompt_id"])
+            print("Difficulty:", node["difficulty"])
+            print("Progress  : {:.0%} ({} remaining)".format(
+                question_graph.progress(current_node_id),
+                question_graph.questions_remaining(current_node_id),
+            ))
+
+            with stage_timer("render"):
+                ai_q = get_render_cache().render_node(current_node_id, node)
+
+            print("\n[AI SPEAKS]")
+            print(ai_q["spoken_question_audio"])
+
+            candidate_text = answer_provider(current_node_id)
+
+            # -------------------------------
+            # STREAMED TRANSCRIPTION + DETERMINISTIC EVIDENCE
+            # -------------------------------
+            # Evidence is extracted per final segment while the answer
+            # streams in; nothing is left to do when it ends.
+            with stage_timer("transcription"):
+                extracted = loop.run_until_complete(stream_answer(
+                    spoken_chunks(candidate_text),
+                    evidence_extractor,
+                    node["skill_id"],
+                ))
+
+            print("\n[TRANSCRIPTION]")
+            print("Text :", extracted["transcript_text"])
+
+            response = {
+                "node_id": current_node_id,
+                "section_id": node["section"],
+                "skill_id": node["skill_id"],
+                "evidence": extracted["evidence"],
+                "evidence_matches": extracted["evidence_matches"]
             }
-        )
+            evaluation_input["responses"].append(response)
 
-        print("\n[AI SPEAKS]")
-        print(ai_q["spoken_question_audio"])
+            if on_response is not None:
+                on_response(response)
 
-        candidate_text = input("\nCandidate says: ")
-        transcript = transcribe_audio(f"[AUDIO] {candidate_text}")
+            current_node_id = question_graph.next_node(current_node_id)
+    finally:
+        loop.close()
 
-        print("\n[TRANSCRIPTION]")
-        print("Text :", transcript["transcript_text"])
-
-        # -------------------------------
-        # BUILD DETERMINISTIC EVIDENCE
-        # -------------------------------
-        evidence = []
+    print("\n========== INTERVIEW END ==========")
+    return evaluation_input
 
-        if "because" in transcript["transcript_text"].lower():
-            evidence.append("Clear articulation of reasoning")
 
-        if any(k in transcript["transcript_text"].lower() for k in ["o(", "time complexity"]):
-            evidence.append("Stated time complexity")
+# ============================================================
+# PIPELINE
+# ============================================================
+def execute_interview(
+    role_config: dict,
+    question_graph: dict,
+    rubric: dict,
+    answer_provider=None,
+    on_advisory=None,
+) -> dict:
+    """
+    Runs interview and deterministic scoring in memory; the AI advisory
+    runs concurrently and never delays the deterministic result.
+
+    Returns:
+        dict: final payload (same shape as outputs/final_evaluation.json).
+        "ai_advisory" is the advisory artifact as of return (usually
+        PENDING); on_advisory(artifact) receives its terminal version.
+    """
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
 
-        evaluation_input["responses"].append({
-            "node_id": current_node_id,
-            "section_id": node["section"],
-            "skill_id": node["skill_id"],
-            "evidence": evidence
-        })
+    # -----------------------------
+    # RUN INTERVIEW (SCORED PER ANSWER)
+    # -----------------------------
+    scorer = IncrementalScorer(rubric)
+
+    def score_response(response):
+        with stage_timer("scoring"):
+            scorer.add_response(
+                response["skill_id"],
+                response["evidence"],
+                node_id=response["node_id"],
+            )
+
+    with stage_timer("interview"):
+        evaluation_input = simulate_interview(
+            role_config,
+            question_graph,
+            answer_provider=answer_provider,
+            evidence_extractor=get_evidence_extractor(
+                rubric,
+                get_config_registry().evidence_rules(),
+            ),
+            on_response=score_response,
+        )
+    scorer.candidate_id = evaluation_input["candidate_id"]
 
-        if current_node_id == end_node_id:
-            break
+    # -----------------------------
+    # AI ADVISORY (NON-AUTHORITATIVE, CONCURRENT)
+    # -----------------------------
+    def advisory_done(artifact):
+        if artifact["elapsed_ms"] is not None:
+            observe(STAGE_SECONDS, artifact["elapsed_ms"] / 1000, "advisor")
+        inc(ADVISORY_OUTCOMES, artifact["status"])
+        if on_advisory is not None:
+            on_advisory(artifact)
+
+    advisory = get_advisory_runner().submit(
+        transcript_bundle=evaluation_input,
+        on_done=advisory_done,
+    )
 
-        current_node_id = node["transitions"]["move_forward"]["then"]
+    # -----------------------------
+    # DETERMINISTIC SCORING
+    # -----------------------------
+    # Already up to date; same output as score_candidate()
+    with stage_timer("scoring"):
+        scoring_output = scorer.snapshot()
 
-    print("\n========== INTERVIEW END ==========")
-    return evaluation_input
+    # -----------------------------
+    # FINAL OUTPUT
+    # -----------------------------
+    return {
+        "deterministic_scores": scoring_output,
+        "ai_advisory": advisory.artifact()
+    }
 
 
 # ============================================================
@@ -137,47 +302,35 @@ def simulate_interview(role_config: dict, question_graph: dict) -> dict:
 # ============================================================
 def main():
     # -----------------------------
-    # LOAD CONFIGS (EXPLICIT)
+    # LOAD CONFIGS (COMPILED ONCE)
     # -----------------------------
-    role_config = load_json(
+    registry = get_config_registry()
+
+    role_config = registry.role_config(
         BASE_DIR / "configs" / "roles" / "swe_entry_mid.json"
     )
 
-    question_graph = load_json(
+    question_graph = registry.question_graph(
         BASE_DIR / "configs" / "question_graphs" / "swe_graph.json"
     )
 
-    rubric = load_json(
+    rubric = registry.rubric(
         BASE_DIR / "configs" / "rubrics" / "swe_rubric.json"
     )
 
-    # -----------------------------
-    # RUN INTERVIEW
-    # -----------------------------
-    evaluation_input = simulate_interview(role_config, question_graph)
-
-    # -----------------------------
-    # DETERMINISTIC SCORING
-    # -----------------------------
-    scoring_output = evaluate_candidate(evaluation_input, rubric)
-    confidence_output = derive_overall_confidence(scoring_output["final_scores"])
-    scoring_output.update(confidence_output)
-
-    # -----------------------------
-    # AI ADVISORY (NON-AUTHORITATIVE)
-    # -----------------------------
-    ai_advisory = ai_score_advisor(
-        transcript_bundle=evaluation_input
+    advisory = Future()
+    final_payload = execute_interview(
+        role_config,
+        question_graph,
+        rubric,
+        on_advisory=advisory.set_result,
     )
 
-    # -----------------------------
-    # FINAL OUTPUT
-    # -----------------------------
-    final_payload = {
-        "deterministic_scores": scoring_output,
-        "ai_advisory": ai_advisory
-    }
+    # Deterministic scores are saved first; the advisory is attached
+    # once it completes, times out or is skipped.
+    save_final_evaluation(final_payload)
 
+    final_payload["ai_advisory"] = advisory.result()
     save_final_evaluation(final_payload)
 
 
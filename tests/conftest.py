@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base, get_db
+from backend.main import app
+from interview_runtime.ai_layer import render_cache as render_cache_module
+from interview_runtime.ai_layer.render_cache import RenderCache
+from interview_runtime.audio import AudioSpool
+from interview_runtime.audio import spool as spool_module
+
+
+@pytest.fixture(autouse=True)
+def render_cache(tmp_path, monkeypatch):
+    """
+    Keeps rendered prompts under tmp_path instead of ./render_cache.
+    """
+    cache = RenderCache(directory=tmp_path / "render_cache")
+    monkeypatch.setattr(render_cache_module, "_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def client(session_factory, tmp_path, monkeypatch):
+    """
+    The app on an in-memory database, with the audio spool under tmp_path.
+    """
+    def get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(spool_module, "_spool", AudioSpool(tmp_path / "spool"))
+    app.dependency_overrides[get_db] = get_test_db
+    try:
+        with TestClient(app, raise_server_exceptions=False) as test_client:
+            test_client.SessionLocal = session_factory
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
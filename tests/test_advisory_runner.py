@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from evaluation.advisory_runner import AdvisoryRunner, AdvisoryStatus
+
+BUNDLE = {"candidate_id": "CAND_001", "responses": []}
+
+
+class BlockingAdvisor:
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self, transcript_bundle, rubric):
+        self.calls += 1
+        self.release.wait(5)
+        return {"summary": "late"}
+
+
+@pytest.fixture
+def blocking():
+    advisor = BlockingAdvisor()
+    yield advisor
+    advisor.release.set()
+
+
+def _collect():
+    outcomes = []
+    return outcomes, outcomes.append
+
+
+def test_completed_and_failed_advisories():
+    runner = AdvisoryRunner(advisor=lambda transcript_bundle, rubric: {"summary": "ok"})
+    outcomes, on_done = _collect()
+
+    artifact = runner.submit(BUNDLE, on_done=on_done).wait(5)
+    assert artifact["status"] == AdvisoryStatus.COMPLETED.value
+    assert artifact["advisory"] == {"summary": "ok"}
+
+    def broken(transcript_bundle, rubric):
+        raise ValueError("model unavailable")
+
+    runner.advisor = broken
+    artifact = runner.submit(BUNDLE, on_done=on_done).wait(5)
+    assert artifact["status"] == AdvisoryStatus.FAILED.value
+    assert artifact["error"] == "ValueError: model unavailable"
+
+    runner.shutdown()
+    assert [a["status"] for a in outcomes] == ["COMPLETED", "FAILED"]
+
+
+def test_slow_advisory_times_out_once(blocking):
+    runner = AdvisoryRunner(advisor=blocking, timeout=0.05)
+    outcomes, on_done = _collect()
+
+    handle = runner.submit(BUNDLE, on_done=on_done)
+    artifact = handle.wait(5)
+    assert artifact["status"] == AdvisoryStatus.TIMED_OUT.value
+    assert artifact["advisory"] is None
+
+    # The late result does not replace the timeout
+    blocking.release.set()
+    runner.shutdown()
+    assert handle.artifact()["status"] == AdvisoryStatus.TIMED_OUT.value
+    assert [a["status"] for a in outcomes] == ["TIMED_OUT"]
+
+
+def test_exhausted_budget_skips_without_blocking(blocking):
+    runner = AdvisoryRunner(advisor=blocking, timeout=5, max_workers=1, max_in_flight=1)
+    outcomes, on_done = _collect()
+
+    runner.submit(BUNDLE)
+    skipped = runner.submit(BUNDLE, on_done=on_done)
+
+    assert skipped.done()
+    assert skipped.artifact()["status"] == AdvisoryStatus.SKIPPED.value
+    assert [a["status"] for a in outcomes] == ["SKIPPED"]
+
+
+def test_timed_out_advisory_keeps_its_slot_until_it_returns(blocking):
+    runner = AdvisoryRunner(advisor=blocking, timeout=0.05, max_workers=1, max_in_flight=2)
+
+    running = runner.submit(BUNDLE)
+    # Queued behind the running call; its timeout cancels it and frees the slot
+    queued = runner.submit(BUNDLE)
+    assert queued.wait(5)["status"] == AdvisoryStatus.TIMED_OUT.value
+    assert running.wait(5)["status"] == AdvisoryStatus.TIMED_OUT.value
+
+    # The abandoned running call still holds one slot
+    assert runner.submit(BUNDLE, timeout=5).artifact()["status"] == AdvisoryStatus.PENDING.value
+    assert runner.submit(BUNDLE).artifact()["status"] == AdvisoryStatus.SKIPPED.value
+
+    blocking.release.set()
+    runner.shutdown()
+    assert blocking.calls == 2
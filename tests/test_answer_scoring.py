@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+
+from evaluation.compiled_rubric import RubricValidationError
+from evaluation.incremental_scoring import IncrementalScorer
+from interview_runtime.engine import AnswerScoring
+from orchestrator.config_registry import (
+    DEFAULT_EVIDENCE_RULES,
+    DEFAULT_RUBRIC,
+    ConfigRegistry,
+)
+
+SKILL = "dsa_problem_decomposition"
+EVIDENCE = "Clear articulation of subproblems"
+
+
+def _set_version(path, version):
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    config["versioning"]["rubric_version"] = version
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    # Same size either way; make sure the reload sees a new mtime
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def configs(tmp_path):
+    rubric = tmp_path / "rubric.json"
+    rules = tmp_path / "rules.json"
+    shutil.copy(DEFAULT_RUBRIC, rubric)
+    shutil.copy(DEFAULT_EVIDENCE_RULES, rules)
+    return rubric, rules
+
+
+def _scoring(configs):
+    rubric, rules = configs
+    return AnswerScoring(ConfigRegistry(check_interval=0), rubric, rules)
+
+
+def _session(score_state=None, node_id="n1"):
+    return SimpleNamespace(session_id="s1", score_state=score_state, current_node_id=node_id)
+
+
+def test_state_from_an_unloaded_rubric_is_rebased(configs):
+    rubric, _ = configs
+    _set_version(rubric, "1.1.0")
+    old = _scoring(configs)
+    state = old.record(_session(), SKILL, {}, evidence=[EVIDENCE])
+    assert state["rubric_version"] == "1.1.0"
+
+    # A restart after the rubric moved on: 1.1.0 was never loaded here
+    _set_version(rubric, "1.2.0")
+    scoring = _scoring(configs)
+    state = scoring.record(_session(state, "n2"), SKILL, {}, evidence=[])
+
+    assert state["rubric_version"] == "1.2.0"
+    assert "unscored" not in state
+    result = scoring.snapshot(_session(state))["final_scores"][SKILL]
+    assert EVIDENCE in result["evidence_used"]
+    assert [p["node_id"] for p in result["provenance"]] == ["n1", "n2"]
+
+
+def test_session_keeps_its_rubric_and_rules_across_a_hot_swap(configs):
+    rubric, rules = configs
+    scoring = _scoring(configs)
+    state = scoring.record(_session(), SKILL, {}, evidence=[])
+    assert state["rubric_version"] == "1.2.0"
+
+    _set_version(rubric, "1.3.0")
+    _set_version(rules, "1.3.0")
+    assert scoring.registry.rubric(rubric).rubric_version == "1.3.0"
+
+    state = scoring.record(
+        _session(state), SKILL, {"transcript_text": "I would break it down into subproblems."}
+    )
+    assert state["rubric_version"] == "1.2.0"
+    assert "unscored" not in state
+    assert EVIDENCE in scoring.snapshot(_session(state))["final_scores"][SKILL]["evidence_used"]
+
+
+def test_scoring_errors_leave_the_answer_unscored(configs):
+    scoring = _scoring(configs)
+    state = scoring.record(_session(), SKILL, {}, evidence=[EVIDENCE])
+
+    state = scoring.record(_session(state, "n2"), "no_such_skill", {}, evidence=[EVIDENCE])
+    assert state["unscored"] == [
+        {"node_id": "n2", "skill_id": "no_such_skill", "reason": "Skill no_such_skill is not in the rubric"}
+    ]
+    # The score itself is untouched and later answers still count
+    state = scoring.record(_session(state, "n3"), SKILL, {}, evidence=[])
+    assert len(state["unscored"]) == 1
+    assert len(state["skills"][0][1]) == 2
+
+
+def test_state_keeps_evidence_names_and_rebases_only_when_asked(configs):
+    rubric = _scoring(configs).rubric_for(None)
+    scorer = IncrementalScorer(rubric)
+    scorer.add_response(SKILL, [EVIDENCE, "not rubric evidence"], node_id="n1")
+    state = scorer.state()
+    assert state["skills"] == [[SKILL, [["n1", [EVIDENCE]]]]]
+
+    state["rubric_version"] = "0.9.0"
+    with pytest.raises(RubricValidationError):
+        IncrementalScorer(rubric, state=state)
+    rebased = IncrementalScorer(rubric, state=state, rebase=True)
+    assert rebased.snapshot() == scorer.snapshot()
+
+
+def test_client_evidence_is_never_trusted(configs):
+    scoring = _scoring(configs)
+    state = scoring.record(
+        _session(), SKILL, {"transcript_text": "no idea", "evidence": [EVIDENCE]}
+    )
+    assert EVIDENCE not in scoring.snapshot(_session(state))["final_scores"][SKILL]["evidence_used"]
+
+
+@pytest.mark.parametrize("payload", [{"transcript_text": 5}, {"transcript_text": ["a"]}])
+def test_malformed_transcripts_are_unscored(configs, payload):
+    scoring = _scoring(configs)
+    state = scoring.record(_session(), SKILL, payload)
+    assert state["unscored"][0]["reason"] == "transcript_text must be a string"
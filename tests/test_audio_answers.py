@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from interview_runtime.audio import spool as spool_module
+from interview_runtime.engine import InterviewRuntimeEngine, VersionConflictError
+from interview_runtime.models import InterviewAnswerAttempt
+
+ANSWER = b"First I would break it down into subproblems. Then I go step by step."
+
+
+def _start(client, session_id):
+    response = client.post(
+        "/interview-runtime/sessions/batch-start", json={"session_ids": [session_id]}
+    )
+    assert response.json()["started"] == 1
+    return client.get(
+        f"/interview-runtime/sessions/{session_id}/current-question"
+    ).json()["runtime_version"]
+
+
+def _post_audio(client, session_id, version, body=ANSWER):
+    return client.post(
+        f"/interview-runtime/sessions/{session_id}/answer/audio",
+        params={"is_final": "true", "expected_runtime_version": version},
+        content=body,
+        headers={"content-type": "audio/wav"},
+    )
+
+
+def test_audio_answer_is_transcribed_and_scored(client):
+    version = _start(client, "audio-1")
+    response = _post_audio(client, "audio-1", version)
+    assert response.status_code == 200
+    assert response.json()["audio_length"] == len(ANSWER)
+
+    with client.SessionLocal() as db:
+        attempt = db.query(InterviewAnswerAttempt).one()
+        assert attempt.answer_payload["transcript_text"] == ANSWER.decode()
+        assert "evidence" not in attempt.answer_payload
+        assert "Clear articulation of subproblems" in {
+            m["evidence"] for m in attempt.answer_payload["evidence_matches"]
+        }
+
+    scores = client.get("/interview-runtime/sessions/audio-1/scores").json()
+    skill = scores["deterministic_scores"]["final_scores"]["dsa_problem_decomposition"]
+    assert "Clear articulation of subproblems" in skill["evidence_used"]
+
+    # The writer's lock is gone once the answer is committed
+    spool_module.get_audio_spool().writer("audio-1").abort()
+
+
+def test_conflicted_upload_is_truncated_away(client, monkeypatch):
+    version = _start(client, "audio-2")
+    assert _post_audio(client, "audio-2", version, b"kept answer.").status_code == 200
+    path = spool_module.get_audio_spool().path_for("audio-2")
+    kept = os.path.getsize(path)
+
+    version += 1
+    def conflict(self, *args, **kwargs):
+        raise VersionConflictError("Concurrent modification detected for session")
+
+    monkeypatch.setattr(InterviewRuntimeEngine, "submit_answer", conflict)
+    assert _post_audio(client, "audio-2", version).status_code == 409
+
+    assert os.path.getsize(path) == kept
+    spool_module.get_audio_spool().writer("audio-2").abort()
+
+
+def _post_answer(client, session_id, version, payload):
+    return client.post(
+        f"/interview-runtime/sessions/{session_id}/answer",
+        params={"is_final": "true", "expected_runtime_version": version},
+        json=payload,
+    )
+
+
+def test_client_sent_evidence_is_ignored(client):
+    version = _start(client, "text-1")
+    evidence = ["Clear articulation of subproblems", "Stepwise approach to solving the task"]
+    response = _post_answer(client, "text-1", version, {"transcript_text": "no idea", "evidence": evidence})
+    assert response.status_code == 200
+
+    scores = client.get("/interview-runtime/sessions/text-1/scores").json()
+    skill = scores["deterministic_scores"]["final_scores"]["dsa_problem_decomposition"]
+    assert skill["evidence_used"] == []
+
+
+@pytest.mark.parametrize("payload", [{"transcript_text": 5}, {"transcript_text": {"a": 1}}])
+def test_malformed_transcript_is_422(client, payload):
+    version = _start(client, "text-2")
+    assert _post_answer(client, "text-2", version, payload).status_code == 422
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from interview_runtime.audio import AudioSpool, SpoolBusyError, open_audio
+
+HOLD_WRITER = """
+import sys
+from interview_runtime.audio import AudioSpool
+writer = AudioSpool(sys.argv[1]).writer("s1")
+writer.write(b"other worker")
+print("locked", flush=True)
+sys.stdin.readline()
+writer.abort()
+"""
+
+
+def test_a_second_writer_is_busy_until_the_first_is_done(tmp_path):
+    spool = AudioSpool(tmp_path)
+    with spool.writer("s1") as writer:
+        writer.write(b"first")
+        with pytest.raises(SpoolBusyError):
+            spool.writer("s1")
+        # Other sessions are not affected
+        spool.writer("s2").close()
+
+    with spool.writer("s1") as writer:
+        writer.write(b"second")
+    assert os.path.getsize(spool.path_for("s1")) == len(b"firstsecond")
+
+
+def test_a_writer_in_another_process_keeps_the_file(tmp_path):
+    spool = AudioSpool(tmp_path)
+    with spool.writer("s1") as writer:
+        writer.write(b"committed")
+    committed = writer.close()
+
+    child = subprocess.Popen(
+        [sys.executable, "-c", HOLD_WRITER, str(tmp_path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    try:
+        assert child.stdout.readline().strip() == "locked"
+        with pytest.raises(SpoolBusyError):
+            spool.writer("s1")
+    finally:
+        child.communicate("\n", timeout=30)
+    assert child.returncode == 0
+
+    # The other worker's abort only dropped its own bytes
+    with open_audio(committed, verify=True) as view:
+        assert bytes(view) == b"committed"
+    assert os.path.getsize(spool.path_for("s1")) == len(b"committed")
+
+
+def test_abort_truncates_back_to_the_answer_offset(tmp_path):
+    spool = AudioSpool(tmp_path)
+    with spool.writer("s1") as writer:
+        writer.write(b"kept")
+
+    writer = spool.writer("s1")
+    writer.write(b"dropped")
+    assert writer.sync()["offset"] == len(b"kept")
+    writer.abort()
+    assert os.path.getsize(spool.path_for("s1")) == len(b"kept")
@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from interview_runtime.api import routes
+from interview_runtime.engine import batch_start as batch_module
+from interview_runtime.engine import InterviewRuntimeEngine, batch_start_sessions
+from interview_runtime.models import (
+    InterviewQuestionTurn,
+    InterviewRuntimeEvent,
+    InterviewSessionRuntime,
+)
+from interview_runtime.state_machine import SessionState
+from orchestrator.adapter import get_orchestrator_adapter
+
+
+def _start(session_factory, session_ids, **kwargs):
+    with session_factory() as db:
+        return batch_start_sessions(db, get_orchestrator_adapter(), session_ids, **kwargs)
+
+
+def _count(session_factory, model):
+    with session_factory() as db:
+        return db.scalar(select(func.count()).select_from(model))
+
+
+def test_per_item_outcomes_in_request_order(session_factory):
+    _start(session_factory, ["old"])
+
+    result = _start(session_factory, ["a", "old", "a", "", None, 7, "b"])
+
+    assert [(r["session_id"], r["status"]) for r in result["results"]] == [
+        ("a", "started"),
+        ("old", "exists"),
+        ("a", "duplicate"),
+        ("", "invalid"),
+        (None, "invalid"),
+        (7, "invalid"),
+        ("b", "started"),
+    ]
+    assert (result["requested"], result["started"], result["not_started"]) == (7, 2, 5)
+
+
+def _snapshot(db, session_id):
+    session = db.get(InterviewSessionRuntime, session_id)
+    turn = db.get(InterviewQuestionTurn, session.open_turn_id)
+    events = db.scalars(
+        select(InterviewRuntimeEvent)
+        .where(InterviewRuntimeEvent.session_id == session_id)
+        .order_by(InterviewRuntimeEvent.seq)
+    ).all()
+    return {
+        "state": session.state,
+        "current_node_id": session.current_node_id,
+        "runtime_version": session.runtime_version,
+        "next_turn_index": session.next_turn_index,
+        "next_event_seq": session.next_event_seq,
+        "turn": (turn.node_id, turn.turn_index, turn.attempt_count),
+        "events": [(e.seq, e.event_type, e.runtime_version) for e in events],
+    }
+
+
+def test_started_sessions_match_a_single_start(session_factory):
+    adapter = get_orchestrator_adapter()
+    _start(session_factory, ["batched"])
+
+    with session_factory() as db:
+        db.add(InterviewSessionRuntime(
+            session_id="single",
+            state=SessionState.CREATED.value,
+            orchestrator_graph_version=adapter.graph_version(),
+            runtime_version=0,
+            next_turn_index=0,
+        ))
+        db.commit()
+    with session_factory() as db:
+        engine = InterviewRuntimeEngine(db, adapter)
+        engine.start_session(engine.load_session("single"), adapter.start_node_id())
+
+    with session_factory() as db:
+        assert _snapshot(db, "batched") == _snapshot(db, "single")
+
+
+def test_chunks_commit_independently(session_factory, monkeypatch):
+    insert_chunk = batch_module._insert_chunk
+    calls = []
+
+    def second_chunk_fails(db, session_ids, *args):
+        calls.append(list(session_ids))
+        if len(calls) == 2:
+            raise OperationalError("INSERT", {}, Exception("disk full"))
+        insert_chunk(db, session_ids, *args)
+
+    monkeypatch.setattr(batch_module, "_insert_chunk", second_chunk_fails)
+    result = _start(session_factory, ["s1", "s2", "s3", "s4", "s5"], chunk_size=2)
+
+    assert calls == [["s1", "s2"], ["s3", "s4"], ["s5"]]
+    assert [r["status"] for r in result["results"]] == [
+        "started", "started", "failed", "failed", "started",
+    ]
+    assert result["results"][2]["error"] == "OperationalError"
+    assert _count(session_factory, InterviewSessionRuntime) == 3
+    assert _count(session_factory, InterviewQuestionTurn) == 3
+
+
+def test_route_starts_a_counted_batch(client):
+    response = client.post("/interview-runtime/sessions/batch-start", json={"count": 3})
+    assert response.status_code == 200
+    assert response.json()["started"] == 3
+
+
+def test_route_rejects_oversized_batches(client, monkeypatch):
+    monkeypatch.setattr(routes, "MAX_BATCH_START", 2)
+    response = client.post(
+        "/interview-runtime/sessions/batch-start", json={"session_ids": ["a", "b", "c"]}
+    )
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("payload", [
+    {"session_ids": "a"},
+    {"count": -1},
+    {"count": "3"},
+    {},
+])
+def test_route_rejects_malformed_requests(client, payload):
+    response = client.post("/interview-runtime/sessions/batch-start", json=payload)
+    assert response.status_code == 422
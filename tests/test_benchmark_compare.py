@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.suite import compare
+
+
+def _run(cases, profile="smoke", database="sqlite"):
+    return {"profile": profile, "database": database, "cases": cases}
+
+
+BASELINE = _run({
+    "scoring": {"candidates_per_second": 1000.0, "score_p99_us": 50.0},
+    "graph": {"compile_ms": 10.0},
+    "api": {"requests_per_second": 200.0},
+})
+
+
+def test_slower_metrics_beyond_tolerance_regress():
+    current = _run({
+        "scoring": {"candidates_per_second": 700.0, "score_p99_us": 55.0},
+        "graph": {"compile_ms": 10.0},
+        "api": {"requests_per_second": 200.0},
+    })
+    result = compare(BASELINE, current, tolerance=0.25)
+    assert [(r["case"], r["metric"]) for r in result["regressions"]] == [
+        ("scoring", "candidates_per_second"),
+    ]
+    assert len(result["compared"]) == 4
+
+
+def test_errored_and_missing_cases_regress():
+    current = _run({
+        "scoring": {"candidates_per_second": 1000.0, "score_p99_us": 50.0},
+        "graph": {"error": ["MemoryError"]},
+    })
+    regressions = compare(BASELINE, current)["regressions"]
+    assert [(r["case"], r["current"]) for r in regressions] == [
+        ("graph", ["MemoryError"]),
+        ("api", ["missing"]),
+    ]
+
+
+@pytest.mark.parametrize("field, value", [("profile", "large"), ("database", "postgresql")])
+def test_runs_from_other_profiles_or_databases_are_refused(field, value):
+    current = dict(BASELINE, **{field: value})
+    with pytest.raises(ValueError):
+        compare(BASELINE, current)
@@ -0,0 +1,61 @@
+import io
+import json
+
+from evaluation.bulk_rescore import rescore
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.scoring_engine import load_rubric, score_candidate
+from orchestrator.config_registry import DEFAULT_RUBRIC
+
+
+def _candidates(rubric):
+    skills = list(rubric.evidence_by_id)
+    candidates = []
+    for i in range(23):
+        candidate_id = f"CAND_{i:03d}"
+        if i % 7 == 3:
+            # Unknown skill: KeyError in the worker
+            candidates.append({
+                "candidate_id": candidate_id,
+                "responses": [{"skill_id": "no_such_skill", "evidence": []}],
+            })
+        elif i % 7 == 5:
+            candidates.append({"candidate_id": candidate_id})
+        else:
+            skill_id = skills[i % len(skills)]
+            candidates.append({
+                "candidate_id": candidate_id,
+                "responses": [{
+                    "skill_id": skill_id,
+                    "evidence": rubric.evidence_by_id[skill_id][: i % 3],
+                }],
+            })
+    return candidates
+
+
+def test_output_is_in_input_order_with_per_candidate_errors(tmp_path):
+    rubric = compile_rubric(load_rubric(str(DEFAULT_RUBRIC)))
+    candidates = _candidates(rubric)
+    source = tmp_path / "inputs.jsonl"
+    source.write_text("".join(json.dumps(c) + "\n" for c in candidates))
+
+    output = io.StringIO()
+    summary = rescore(
+        [str(source)], str(DEFAULT_RUBRIC), output,
+        workers=2, chunk_size=4, progress_stream=io.StringIO(),
+    )
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["candidate_id"] for line in lines] == [c["candidate_id"] for c in candidates]
+
+    failed = []
+    for candidate, line in zip(candidates, lines):
+        if "responses" in candidate and candidate["responses"][0]["skill_id"] != "no_such_skill":
+            assert line == score_candidate(candidate, rubric)
+        else:
+            assert line["error"].startswith("KeyError: ")
+            failed.append(candidate["candidate_id"])
+
+    assert failed
+    assert summary["candidates"] == len(candidates)
+    assert summary["failures"] == len(failed)
+    assert summary["chunks"] == 6
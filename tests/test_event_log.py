@@ -0,0 +1,173 @@
+import pytest
+from sqlalchemy import func, select
+
+from interview_runtime.engine import InterviewRuntimeEngine, RuntimeInvariantError
+from interview_runtime.engine.event_log import (
+    RuntimeEventLog,
+    RuntimeEventType,
+    read_events,
+    replay,
+)
+from interview_runtime.models import (
+    InterviewAnswerAttempt,
+    InterviewQuestionTurn,
+    InterviewSessionRuntime,
+    InterviewSessionSnapshot,
+)
+from interview_runtime.state_machine import SessionState
+from orchestrator.adapter import get_orchestrator_adapter
+
+SESSION_ID = "s1"
+
+
+def _create(session_factory):
+    adapter = get_orchestrator_adapter()
+    with session_factory() as db:
+        db.add(InterviewSessionRuntime(
+            session_id=SESSION_ID,
+            state=SessionState.CREATED.value,
+            orchestrator_graph_version=adapter.graph_version(),
+            runtime_version=0,
+            next_turn_index=0,
+        ))
+        db.commit()
+    with session_factory() as db:
+        engine = InterviewRuntimeEngine(db, adapter)
+        engine.start_session(engine.load_session(SESSION_ID), adapter.start_node_id())
+
+
+def _engine(db):
+    engine = InterviewRuntimeEngine(db, get_orchestrator_adapter())
+    engine.event_log.snapshot_interval = 3
+    return engine
+
+
+def _answer(session_factory, is_final):
+    with session_factory() as db:
+        engine = _engine(db)
+        session = engine.load_session(SESSION_ID)
+        engine.submit_answer(
+            session,
+            {"transcript_text": "an answer"},
+            is_final=is_final,
+            expected_runtime_version=session.runtime_version,
+        )
+
+
+def _assert_replay_matches_row(session_factory):
+    with session_factory() as db:
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        replayed = replay(db, SESSION_ID)
+        attempts = db.scalars(select(InterviewAnswerAttempt)).all()
+        closed = db.scalar(
+            select(func.count())
+            .select_from(InterviewQuestionTurn)
+            .where(InterviewQuestionTurn.closed_at.is_not(None))
+        )
+
+        assert replayed.seq == session.next_event_seq - 1
+        assert replayed.state == session.state
+        assert replayed.current_node_id == session.current_node_id
+        if session.open_turn_id is None:
+            assert replayed.open_turn is None
+        else:
+            turn = db.get(InterviewQuestionTurn, session.open_turn_id)
+            assert replayed.open_turn == {
+                "turn_id": turn.turn_id,
+                "node_id": turn.node_id,
+                "turn_index": turn.turn_index,
+                "attempts": turn.attempt_count,
+            }
+        assert replayed.turns_closed == closed
+        assert replayed.attempts == len(attempts)
+        assert replayed.retries == sum(not a.is_final for a in attempts)
+        assert sorted(a["attempt_id"] for a in replayed.final_answers) == sorted(
+            a.attempt_id for a in attempts if a.is_final
+        )
+
+
+def _snapshots(session_factory):
+    with session_factory() as db:
+        return db.scalar(select(func.count()).select_from(InterviewSessionSnapshot))
+
+
+def test_replay_from_snapshot_and_tail_matches_session_row(session_factory):
+    _create(session_factory)
+    _assert_replay_matches_row(session_factory)
+
+    for is_final in (False, True, False, False, True, True):
+        _answer(session_factory, is_final)
+        _assert_replay_matches_row(session_factory)
+
+    assert _snapshots(session_factory) > 0
+
+
+def test_replay_matches_session_row_after_fail_session(session_factory):
+    _create(session_factory)
+    _answer(session_factory, False)
+    _answer(session_factory, True)
+
+    with session_factory() as db:
+        engine = _engine(db)
+        session = engine.load_session(SESSION_ID)
+        # Pausing with an open turn breaks an invariant and fails the session
+        with pytest.raises(RuntimeInvariantError):
+            engine.pause_session(session, session.runtime_version)
+
+    _assert_replay_matches_row(session_factory)
+    with session_factory() as db:
+        assert replay(db, SESSION_ID).state == SessionState.FAILED.value
+
+
+def test_rolled_back_operation_leaves_no_events(session_factory, monkeypatch):
+    _create(session_factory)
+    with session_factory() as db:
+        before = read_events(db, SESSION_ID)
+
+    def broken_next_node(current_node_id):
+        raise RuntimeInvariantError("graph unavailable")
+
+    with session_factory() as db:
+        engine = _engine(db)
+        monkeypatch.setattr(engine.orchestrator, "next_node", broken_next_node)
+        session = engine.load_session(SESSION_ID)
+        # ATTEMPT and TURN_CLOSED are recorded before the failure
+        with pytest.raises(RuntimeInvariantError):
+            engine.submit_answer(
+                session,
+                {"transcript_text": "an answer"},
+                is_final=True,
+                expected_runtime_version=session.runtime_version,
+            )
+
+    with session_factory() as db:
+        after = read_events(db, SESSION_ID)
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        assert db.scalar(select(func.count()).select_from(InterviewAnswerAttempt)) == 0
+
+    # Only the FAILED transition was added, at the next dense seq
+    assert after[:len(before)] == before
+    assert [(e["seq"], e["event_type"], e["payload"]["to"]) for e in after[len(before):]] == [
+        (len(before), RuntimeEventType.TRANSITION.value, SessionState.FAILED.value),
+    ]
+    assert session.next_event_seq == len(after)
+    _assert_replay_matches_row(session_factory)
+
+
+def test_discard_drops_pending_events(session_factory):
+    _create(session_factory)
+
+    with session_factory() as db:
+        before = read_events(db, SESSION_ID)
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        log = RuntimeEventLog(db, snapshot_interval=1)
+        log.record(session, RuntimeEventType.TRANSITION, {"from": "RUNNING", "to": "PAUSED"})
+        log.discard()
+        db.rollback()
+        log.flush(session)
+        db.commit()
+
+    with session_factory() as db:
+        assert read_events(db, SESSION_ID) == before
+        assert _snapshots(session_factory) == 0
+        assert db.get(InterviewSessionRuntime, SESSION_ID).next_event_seq == len(before)
@@ -0,0 +1,116 @@
+import copy
+import json
+
+import pytest
+
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.evidence_extractor import (
+    EvidenceExtractor,
+    EvidenceRuleError,
+    StreamingEvidenceScanner,
+    compile_evidence_rules,
+    get_evidence_extractor,
+)
+from orchestrator.config_registry import (
+    DEFAULT_EVIDENCE_RULES,
+    DEFAULT_RUBRIC,
+    get_config_registry,
+)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    registry = get_config_registry()
+    return get_evidence_extractor(registry.rubric(), registry.evidence_rules())
+
+
+def test_other_skills_rules_do_not_hide_the_nodes_skill(extractor):
+    # "O(1) lookup" is also data-structure evidence, matched at the same offset
+    text = "The time is O(1) lookup per element"
+
+    assert extractor.extract(text, skill_id="dsa_complexity_awareness")["evidence"] == [
+        "Stated time complexity"
+    ]
+    assert extractor.extract("The time is O(1) per element",
+                             skill_id="dsa_complexity_awareness")["evidence"] == [
+        "Stated time complexity"
+    ]
+
+
+def test_every_overlapping_rule_is_reported(extractor):
+    found = extractor.extract("The time is O(1) lookup per element")["evidence"]
+    assert set(found) == {
+        "Stated time complexity",
+        "Justification tied to access patterns or constraints",
+    }
+
+
+def test_rules_of_one_skill_overlapping_at_one_offset():
+    rubric = compile_rubric({
+        "versioning": {"rubric_version": "t-1"},
+        "sections": [{"section_id": "s", "skills": [{
+            "skill_id": "skill",
+            "required_evidence": ["short", "long"],
+            "explicitly_disallowed_evidence": [],
+        }]}],
+    })
+    rules = compile_evidence_rules({
+        "versioning": {"config_version": "r-1", "rubric_version": "t-1"},
+        "rules": [
+            {"evidence": "long", "patterns": ["hash map lookup"]},
+            {"evidence": "short", "patterns": ["hash"]},
+        ],
+    })
+    result = EvidenceExtractor(rubric, rules).extract("use a hash map lookup", skill_id="skill")
+
+    assert result["evidence"] == ["short", "long"]
+    assert [(m["evidence"], m["text"]) for m in result["matches"]] == [
+        ("long", "hash map lookup"),
+        ("short", "hash"),
+    ]
+
+
+def test_streaming_matches_whole_transcript(extractor):
+    segments = ["The time is O(1)", "lookup per element, and I would break it", "down first."]
+    scanner = StreamingEvidenceScanner(extractor, skill_id="dsa_complexity_awareness")
+    for text in segments:
+        scanner.feed({"transcript_text": text, "is_final": True})
+
+    assert scanner.result() == extractor.extract(
+        " ".join(segments), skill_id="dsa_complexity_awareness"
+    )
+
+
+def test_same_version_rubric_edit_gets_a_new_extractor():
+    registry_rules = get_config_registry().evidence_rules()
+    with open(DEFAULT_RUBRIC, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    edited = copy.deepcopy(raw)
+    for section in edited["sections"]:
+        for skill in section["skills"]:
+            if skill["skill_id"] == "dsa_problem_decomposition":
+                skill["required_evidence"].remove("Clear articulation of subproblems")
+
+    text = "I would break it down into subproblems."
+    before = get_evidence_extractor(compile_rubric(raw), registry_rules)
+    assert "Clear articulation of subproblems" in before.extract(text)["evidence"]
+
+    # The reloaded rubric no longer knows that evidence, so its rules are refused
+    with pytest.raises(EvidenceRuleError):
+        get_evidence_extractor(compile_rubric(edited), registry_rules)
+
+
+def test_same_version_rules_edit_gets_a_new_extractor():
+    rubric = get_config_registry().rubric()
+    with open(DEFAULT_EVIDENCE_RULES, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    edited = copy.deepcopy(raw)
+    for rule in edited["rules"]:
+        if rule["evidence"] == "Clear articulation of subproblems":
+            rule["patterns"].append(r"divide and conquer")
+
+    text = "Divide and conquer."
+    before = get_evidence_extractor(rubric, compile_evidence_rules(raw))
+    after = get_evidence_extractor(rubric, compile_evidence_rules(edited))
+    assert "Clear articulation of subproblems" not in before.extract(text)["evidence"]
+    assert "Clear articulation of subproblems" in after.extract(text)["evidence"]
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from benchmarks.synthetic import make_question_graph
+from orchestrator.config_registry import DEFAULT_QUESTION_GRAPH
+from orchestrator.graph_compiler import GraphValidationError, compile_question_graph
+
+
+def _node(**transitions):
+    return {
+        "section": "dsa",
+        "skill_id": "dsa_problem_decomposition",
+        "prompt_id": "prompt",
+        "transitions": {name: {"then": target} for name, target in transitions.items()},
+    }
+
+
+def _graph(nodes, start="A", end="Z"):
+    return {"start_node": start, "end_node": end, "nodes": nodes}
+
+
+def test_the_packaged_graph_walks_to_the_end():
+    with open(DEFAULT_QUESTION_GRAPH, "r", encoding="utf-8") as f:
+        graph = compile_question_graph(json.load(f))
+
+    node_id, walked = graph.start_node, 1
+    while node_id != graph.end_node:
+        assert graph.questions_remaining(node_id) >= 1
+        node_id = graph.next_node(node_id)
+        walked += 1
+    assert walked == len(graph.node_ids)
+    assert graph.next_node(graph.end_node) is None
+
+
+def test_synthetic_graphs_compile():
+    graph = compile_question_graph(make_question_graph(200, ["s1", "s2"], seed=3))
+    assert graph.next_node(graph.start_node) is not None
+
+
+@pytest.mark.parametrize("nodes, message", [
+    (
+        {"A": _node(move_forward="Z"), "B": _node(move_forward="Z"), "Z": _node()},
+        "unreachable from A: B",
+    ),
+    (
+        {"A": _node(move_forward="B", branch="C"), "B": _node(move_forward="Z"),
+         "C": _node(move_forward="C2"), "C2": _node(move_forward="C"), "Z": _node()},
+        "cycle through: C, C2",
+    ),
+    (
+        {"A": _node(success="B", failure="Z"), "B": _node(move_forward="Z"), "Z": _node()},
+        "Node A has no move_forward transition",
+    ),
+    (
+        {"A": _node(move_forward="Z"), "Z": _node(move_forward="A")},
+        "cycle",
+    ),
+])
+def test_invalid_graphs_are_rejected(nodes, message):
+    with pytest.raises(GraphValidationError, match=message):
+        compile_question_graph(_graph(nodes))
+
+
+def test_dead_ends_are_rejected():
+    # Y never reaches Z: as a non-end node without move_forward, it would
+    # end the interview early
+    nodes = {
+        "A": _node(move_forward="Z", branch="B"),
+        "B": _node(move_forward="Y"),
+        "Y": _node(),
+        "Z": _node(),
+    }
+    with pytest.raises(GraphValidationError, match="Node Y has no move_forward"):
+        compile_question_graph(_graph(nodes))
@@ -0,0 +1,75 @@
+from concurrent.futures import Future
+
+from backend.jobs import InterviewJobRunner
+from backend.sessions import InterviewSession, InterviewSessionStatus
+
+
+class ManualService:
+    """Execution service whose jobs are finished by the test."""
+
+    def submit(self, on_start=None, on_advisory=None):
+        self.future = Future()
+        on_start()
+        return self.future
+
+
+def _created(session_factory):
+    with session_factory() as db:
+        session = InterviewSession(
+            role_config="role.json",
+            question_graph="graph.json",
+            status=InterviewSessionStatus.CREATED,
+        )
+        db.add(session)
+        db.commit()
+        return session.id
+
+
+def _row(session_factory, session_id):
+    with session_factory() as db:
+        return db.get(InterviewSession, session_id)
+
+
+def test_completed_job_is_stored(session_factory):
+    service = ManualService()
+    runner = InterviewJobRunner(execution_service=service, session_factory=session_factory)
+    session_id = _created(session_factory)
+
+    runner.enqueue(session_id)
+    assert runner.status(session_id) == InterviewSessionStatus.RUNNING
+
+    service.future.set_result({"candidate_id": "C1"})
+    row = _row(session_factory, session_id)
+    assert row.status == InterviewSessionStatus.COMPLETED
+    assert row.evaluation == {"candidate_id": "C1"}
+    assert runner.status(session_id) is None
+
+
+def test_unstorable_evaluation_fails_the_job(session_factory):
+    service = ManualService()
+    runner = InterviewJobRunner(execution_service=service, session_factory=session_factory)
+    session_id = _created(session_factory)
+
+    runner.enqueue(session_id)
+    service.future.set_result({"not_json": object()})
+
+    row = _row(session_factory, session_id)
+    assert row.status == InterviewSessionStatus.FAILED
+    assert row.error_message.startswith("Could not store the evaluation")
+    assert runner.status(session_id) is None
+
+
+def test_terminal_status_is_kept_when_the_database_is_down(session_factory):
+    service = ManualService()
+    runner = InterviewJobRunner(execution_service=service, session_factory=session_factory)
+    session_id = _created(session_factory)
+    runner.enqueue(session_id)
+
+    def unavailable():
+        raise RuntimeError("database unavailable")
+
+    runner._session_factory = unavailable
+    service.future.set_result({"candidate_id": "C1"})
+
+    # Pollers and event streams still see the job end
+    assert runner.status(session_id) == InterviewSessionStatus.FAILED
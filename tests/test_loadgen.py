@@ -0,0 +1,83 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from benchmarks.loadgen import AnswerScript, GeneratedScript, distribution
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# in_process_client must run before backend.database is imported, which
+# this test process has already done; drive it in a fresh interpreter.
+LOAD_RUN = textwrap.dedent("""
+    import asyncio, json, sys
+
+    from benchmarks.loadgen import AnswerScript, in_process_client, run_load
+
+    script = AnswerScript.from_dict(json.loads(sys.argv[1]))
+
+    async def main():
+        async with in_process_client() as client:
+            report = await run_load(client, clients=3, sessions=5, scripts=lambda i: script)
+
+            from backend.database import SessionLocal
+            from interview_runtime.models import InterviewSessionRuntime
+            with SessionLocal() as db:
+                states = [s.state for s in db.query(InterviewSessionRuntime)]
+        return {"report": report, "states": states}
+
+    print(json.dumps(asyncio.run(main())))
+""")
+
+
+def test_scripted_load_completes_every_session(tmp_path):
+    script = {
+        "default": ["Let me think about that.", "I would break this down into subproblems first."],
+    }
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "RENDER_CACHE_DIR": ""}
+    env.pop("DATABASE_URL", None)
+    env.pop("WEB_CONCURRENCY", None)
+
+    completed = subprocess.run(
+        [sys.executable, "-c", LOAD_RUN, json.dumps(script)],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    result = json.loads(completed.stdout.splitlines()[-1])
+    report = result["report"]
+    assert report["outcomes"] == {"completed": 5}
+    assert report["error_rate"] == 0.0
+    assert result["states"] == ["COMPLETED"] * 5
+    # Every node got one retry and one final answer
+    answers = report["endpoints"]["answer"]
+    assert answers["requests"] == 2 * report["endpoints"]["current_question"]["requests"]
+    assert answers["status_codes"] == {"200": answers["requests"]}
+
+
+def test_answer_script_attempts():
+    script = AnswerScript.from_dict({
+        "answers": {"n1": ["retry", {"transcript_text": "final", "extra": 1}]},
+        "default": "fallback",
+    })
+    assert script.attempts("n1") == [
+        {"transcript_text": "retry"},
+        {"transcript_text": "final", "extra": 1},
+    ]
+    assert script.attempts("n2") == [{"transcript_text": "fallback"}]
+
+
+def test_generated_script_retries_at_most_twice():
+    script = GeneratedScript(random.Random(0), retry_rate=1.0)
+    assert len(script.attempts("n1")) == 3
+    assert len(GeneratedScript(random.Random(0), retry_rate=0.0).attempts("n1")) == 1
+
+
+def test_distribution_in_milliseconds():
+    assert distribution([]) == {}
+    assert distribution([0.001, 0.003, 0.002]) == {
+        "mean": 2.0, "p50": 2.0, "p90": 2.0, "p99": 2.0, "max": 3.0,
+    }
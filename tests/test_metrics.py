@@ -0,0 +1,84 @@
+from sqlalchemy import create_engine, text
+
+from backend import metrics
+from interview_runtime.models import InterviewSessionRuntime
+from interview_runtime.state_machine import SessionState
+from orchestrator.adapter import get_orchestrator_adapter
+
+
+def _create(client, session_id):
+    with client.SessionLocal() as db:
+        db.add(InterviewSessionRuntime(
+            session_id=session_id,
+            state=SessionState.CREATED.value,
+            orchestrator_graph_version=get_orchestrator_adapter().graph_version(),
+            runtime_version=0,
+            next_turn_index=0,
+        ))
+        db.commit()
+
+
+def test_metrics_404_when_disabled(client, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    transitions = metrics.FSM_TRANSITIONS.value("CREATED", "RUNNING")
+
+    _create(client, "s1")
+    assert client.post("/interview-runtime/sessions/s1/start").status_code == 200
+
+    assert client.get("/metrics").status_code == 404
+    assert metrics.FSM_TRANSITIONS.value("CREATED", "RUNNING") == transitions
+
+
+def test_metrics_count_operations_when_enabled(client, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+    transitions = metrics.FSM_TRANSITIONS.value("CREATED", "RUNNING")
+    started = metrics.RUNTIME_OPERATION_SECONDS.count("start_session", "ok")
+    answers = metrics.RUNTIME_OPERATION_SECONDS.count("submit_answer", "ok")
+
+    _create(client, "s1")
+    assert client.post("/interview-runtime/sessions/s1/start").status_code == 200
+    response = client.post(
+        "/interview-runtime/sessions/s1/answer",
+        params={"is_final": False, "expected_runtime_version": 1},
+        json={"transcript_text": "an answer"},
+    )
+    assert response.status_code == 200
+
+    assert metrics.FSM_TRANSITIONS.value("CREATED", "RUNNING") == transitions + 1
+    assert metrics.RUNTIME_OPERATION_SECONDS.count("start_session", "ok") == started + 1
+    assert metrics.RUNTIME_OPERATION_SECONDS.count("submit_answer", "ok") == answers + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE runtime_operation_seconds histogram" in body
+    assert 'runtime_operation_seconds_bucket{operation="start_session",outcome="ok",le="+Inf"}' in body
+    assert 'runtime_operation_seconds_count{operation="submit_answer",outcome="ok"}' in body
+    assert "# TYPE runtime_fsm_transitions_total counter" in body
+    assert 'runtime_fsm_transitions_total{from_state="CREATED",to_state="RUNNING"}' in body
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("h", "Test.", ("op",), buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(seconds, "x")
+
+    assert histogram.render()[2:] == [
+        'h_bucket{op="x",le="0.1"} 1',
+        'h_bucket{op="x",le="1"} 3',
+        'h_bucket{op="x",le="+Inf"} 4',
+        'h_sum{op="x"} 6.050000',
+        'h_count{op="x"} 4',
+    ]
+
+
+def test_instrumented_engine_times_statements(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+    selects = metrics.DB_QUERY_SECONDS.count("SELECT")
+
+    engine = metrics.instrument_engine(create_engine("sqlite://"))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert metrics.DB_QUERY_SECONDS.count("SELECT") == selects + 1
@@ -0,0 +1,77 @@
+import pytest
+
+from interview_runtime.ai_layer import render_cache as render_cache_module
+from interview_runtime.ai_layer.ai_interviewer import FOLLOW_UP_TEMPLATES
+from interview_runtime.ai_layer.render_cache import RenderCache, render_key
+from orchestrator.adapter import get_orchestrator_adapter
+
+INPUTS = {
+    "question_id": "q1",
+    "question_text": "Tell me about a hard bug.",
+    "allowed_template_ids": ["F1", "F2"],
+    "followup_policy": {"enabled": True, "max_followups": 1},
+}
+
+
+def _with(**changes):
+    return {**INPUTS, **changes}
+
+
+def test_key_is_stable_for_equal_inputs():
+    reordered = dict(reversed(list(INPUTS.items())))
+    assert render_key("question", INPUTS, "default") == render_key("question", reordered, "default")
+
+
+@pytest.mark.parametrize("inputs, voice", [
+    (_with(allowed_template_ids=["F1"]), "default"),
+    (_with(followup_policy={"enabled": False, "max_followups": 0}), "default"),
+    (_with(followup_policy={"enabled": True, "max_followups": 2}), "default"),
+    (_with(question_text="Tell me about an easy bug."), "default"),
+    (INPUTS, "alto"),
+])
+def test_key_changes_with_template_policy_and_voice(inputs, voice):
+    assert render_key("question", inputs, voice) != render_key("question", INPUTS, "default")
+
+
+def test_key_changes_with_tts_config_version(monkeypatch):
+    before = render_key("question", INPUTS, "default")
+    monkeypatch.setattr(render_cache_module, "TTS_CONFIG_VERSION", "placeholder-2")
+    assert render_key("question", INPUTS, "default") != before
+
+
+def test_changed_inputs_miss_and_equal_inputs_hit(tmp_path):
+    cache = RenderCache(directory=tmp_path)
+
+    first = cache.render_question(**INPUTS)
+    assert cache.render_question(**INPUTS) == first
+    cache.render_question(**_with(allowed_template_ids=["F1"]))
+    cache.render_question(**_with(followup_policy={"enabled": False, "max_followups": 0}))
+    RenderCache(directory=tmp_path, voice="alto").render_question(**INPUTS)
+
+    assert cache.stats() == {"entries": 3, "hits": 1, "disk_hits": 0, "misses": 3}
+
+
+def test_tts_config_version_bump_misses_disk(tmp_path, monkeypatch):
+    RenderCache(directory=tmp_path).render_question(**INPUTS)
+
+    monkeypatch.setattr(render_cache_module, "TTS_CONFIG_VERSION", "placeholder-2")
+    cache = RenderCache(directory=tmp_path)
+    cache.render_question(**INPUTS)
+
+    assert cache.stats()["misses"] == 1
+
+
+def test_warm_prerenders_every_node_and_followup(tmp_path):
+    question_graph = get_orchestrator_adapter().graph()
+    expected = len(question_graph.nodes) + len(FOLLOW_UP_TEMPLATES)
+
+    summary = RenderCache(directory=tmp_path).warm(question_graph)
+    assert summary == {"entries": expected, "hits": 0, "disk_hits": 0, "misses": expected}
+
+    # A fresh process finds everything on disk
+    cache = RenderCache(directory=tmp_path)
+    for node_id, node in question_graph.nodes.items():
+        cache.render_node(node_id, node)
+    for template_id in FOLLOW_UP_TEMPLATES:
+        cache.render_followup(template_id)
+    assert cache.stats() == {"entries": expected, "hits": 0, "disk_hits": expected, "misses": 0}
@@ -0,0 +1,55 @@
+import copy
+import json
+
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.incremental_scoring import IncrementalScorer
+from evaluation.rubric_tables import tables_for
+from evaluation.scoring_rules import (
+    DEFAULT_CONFIDENCE_RULES,
+    compile_scoring_rules,
+    get_scoring_rules,
+)
+from orchestrator.config_registry import DEFAULT_RUBRIC
+
+SKILL = "dsa_problem_decomposition"
+
+
+def _raw_rubric():
+    with open(DEFAULT_RUBRIC, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _skill(raw):
+    for section in raw["sections"]:
+        for skill in section["skills"]:
+            if skill["skill_id"] == SKILL:
+                return skill
+
+
+def test_same_version_rubric_edit_gets_new_tables():
+    rules = get_scoring_rules()
+    raw = _raw_rubric()
+    edited = copy.deepcopy(raw)
+    _skill(edited)["required_evidence"] = _skill(edited)["required_evidence"][:1]
+
+    rubric, reloaded = compile_rubric(raw), compile_rubric(edited)
+    assert rubric.rubric_version == reloaded.rubric_version
+    assert tables_for(compile_rubric(raw), rules) is tables_for(rubric, rules)
+    assert tables_for(reloaded, rules) is not tables_for(rubric, rules)
+
+    scorer = IncrementalScorer(reloaded)
+    result = scorer.add_response(SKILL, _skill(edited)["required_evidence"])
+    assert result["missing_evidence"] == []
+
+
+def test_same_version_rules_edit_gets_new_tables():
+    with open(DEFAULT_CONFIDENCE_RULES, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    edited = copy.deepcopy(raw)
+    edited["scoring_rules"]["outcomes"]["full"]["score"] += 1
+
+    rubric = compile_rubric(_raw_rubric())
+    rules, reloaded = compile_scoring_rules(raw), compile_scoring_rules(edited)
+    assert rules.config_version == reloaded.config_version
+    assert tables_for(rubric, reloaded) is not tables_for(rubric, rules)
+    assert tables_for(rubric, reloaded).rules is reloaded
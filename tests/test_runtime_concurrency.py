@@ -0,0 +1,139 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+
+from interview_runtime.engine import InterviewRuntimeEngine, VersionConflictError
+from interview_runtime.engine.event_log import read_events
+from interview_runtime.models import (
+    InterviewAnswerAttempt,
+    InterviewQuestionTurn,
+    InterviewSessionRuntime,
+)
+from interview_runtime.state_machine import SessionState
+from orchestrator.adapter import get_orchestrator_adapter
+
+SESSION_ID = "s1"
+
+
+@pytest.fixture
+def started(session_factory):
+    adapter = get_orchestrator_adapter()
+    with session_factory() as db:
+        db.add(InterviewSessionRuntime(
+            session_id=SESSION_ID,
+            state=SessionState.CREATED.value,
+            orchestrator_graph_version=adapter.graph_version(),
+            runtime_version=0,
+            next_turn_index=0,
+        ))
+        db.commit()
+    with session_factory() as db:
+        engine = InterviewRuntimeEngine(db, adapter)
+        engine.start_session(engine.load_session(SESSION_ID), adapter.start_node_id())
+    return session_factory
+
+
+def _loaded(db):
+    engine = InterviewRuntimeEngine(db, get_orchestrator_adapter())
+    return engine, engine.load_session(SESSION_ID)
+
+
+@pytest.mark.parametrize("is_final", [False, True])
+def test_racing_answers_on_same_version_conflict(started, is_final):
+    first_db, second_db = started(), started()
+    try:
+        # Both engines read the same row and open turn before either writes
+        first, first_session = _loaded(first_db)
+        second, second_session = _loaded(second_db)
+        version = first_session.runtime_version
+        assert second_session.runtime_version == version
+
+        first.submit_answer(
+            first_session, {"transcript_text": "first"},
+            is_final=is_final, expected_runtime_version=version,
+        )
+        with pytest.raises(VersionConflictError) as excinfo:
+            second.submit_answer(
+                second_session, {"transcript_text": "second"},
+                is_final=is_final, expected_runtime_version=version,
+            )
+        assert isinstance(excinfo.value.__cause__, StaleDataError)
+    finally:
+        first_db.close()
+        second_db.close()
+
+    with started() as db:
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        attempts = db.scalars(select(InterviewAnswerAttempt)).all()
+        events = read_events(db, SESSION_ID)
+
+    # The winner's write stands; the loser changed nothing and did not
+    # fail the session
+    assert session.state == SessionState.RUNNING.value
+    assert session.runtime_version == version + (1 if is_final else 0)
+    assert [a.answer_payload["transcript_text"] for a in attempts] == ["first"]
+    assert [e["seq"] for e in events] == list(range(session.next_event_seq))
+    assert [e["payload"].get("answer_payload") for e in events if e["event_type"] == "attempt"] == [
+        {"transcript_text": "first"},
+    ]
+
+
+def test_losing_answer_returns_409_without_failing_session(started, client):
+    with started() as db:
+        engine, session = _loaded(db)
+        version = session.runtime_version
+        engine.submit_answer(
+            session, {"transcript_text": "first"},
+            is_final=True, expected_runtime_version=version,
+        )
+
+    response = client.post(
+        f"/interview-runtime/sessions/{SESSION_ID}/answer",
+        params={"is_final": True, "expected_runtime_version": version},
+        json={"transcript_text": "second"},
+    )
+
+    assert response.status_code == 409
+    with started() as db:
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        assert session.state == SessionState.RUNNING.value
+        assert session.runtime_version == version + 1
+        assert db.scalar(select(func.count()).select_from(InterviewAnswerAttempt)) == 1
+
+
+def test_racing_resumes_from_load_session_conflict(started):
+    with started() as db:
+        # Paused between turns: no open turn
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        db.get(InterviewQuestionTurn, session.open_turn_id).closed_at = func.now()
+        session.state = SessionState.PAUSED.value
+        session.open_turn_id = None
+        db.commit()
+
+    first_db, second_db = started(), started()
+    try:
+        # load_session takes no row lock; both see the paused row
+        first, first_session = _loaded(first_db)
+        second, second_session = _loaded(second_db)
+        version = first_session.runtime_version
+
+        first.resume_session(first_session, version)
+        with pytest.raises(VersionConflictError) as excinfo:
+            second.resume_session(second_session, version)
+        # The loser's turn insert may hit uq_session_turn_index before
+        # its versioned UPDATE; either way it is a conflict
+        assert isinstance(excinfo.value.__cause__, (StaleDataError, IntegrityError))
+    finally:
+        first_db.close()
+        second_db.close()
+
+    with started() as db:
+        session = db.get(InterviewSessionRuntime, SESSION_ID)
+        open_turns = db.scalars(
+            select(InterviewQuestionTurn).where(InterviewQuestionTurn.closed_at.is_(None))
+        ).all()
+
+    assert session.state == SessionState.RUNNING.value
+    assert session.runtime_version == version + 1
+    assert [t.turn_id for t in open_turns] == [session.open_turn_id]
@@ -0,0 +1,47 @@
+import copy
+import gc
+import json
+import weakref
+
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.scoring_cache import ScoringCache
+from evaluation.scoring_rules import get_scoring_rules
+from orchestrator.config_registry import DEFAULT_RUBRIC
+
+
+def _raw_rubric():
+    with open(DEFAULT_RUBRIC, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_hash_memo_does_not_keep_rubrics_alive():
+    cache = ScoringCache()
+    rules = get_scoring_rules()
+    raw = _raw_rubric()
+
+    first = compile_rubric(raw)
+    expected = cache.scoring_hash(first, rules)
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
+
+    # Recompiling the same version reuses its memo entry
+    for _ in range(100):
+        assert cache.scoring_hash(compile_rubric(raw), rules) == expected
+    assert len(cache._hashes) == 1
+
+
+def test_edited_rubric_with_the_same_version_invalidates():
+    cache = ScoringCache()
+    rules = get_scoring_rules()
+    raw = _raw_rubric()
+    first = cache.scoring_hash(compile_rubric(raw), rules)
+
+    edited = copy.deepcopy(raw)
+    skill = edited["sections"][0]["skills"][0]
+    skill["required_evidence"] = skill["required_evidence"][:1]
+    second = cache.scoring_hash(compile_rubric(edited), rules)
+
+    assert second != first
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,207 @@
+"""
+Every scoring path must give the same output as the reference one:
+
+- evaluate_candidates_batch()  == score_candidate()             (user-004)
+- ... under every merge policy, incl. IncrementalScorer         (user-017)
+- score_candidate()            == evaluate_candidate()
+                                  + derive_overall_confidence()  (user-018)
+- all of them decide review from confidence_rules.json          (user-018)
+- ScoreTable / CompactEvaluation.to_dict() == score_candidate() (user-019)
+"""
+
+import random
+
+import pytest
+
+from evaluation.batch_scoring import evaluate_candidates_batch
+from evaluation.compact_results import ScoreTable, compact_result, score_candidate_compact
+from evaluation.compiled_rubric import compile_rubric
+from evaluation.confidence import derive_overall_confidence
+from evaluation.incremental_scoring import IncrementalScorer
+from evaluation.scoring_engine import evaluate_candidate, load_rubric, score_candidate
+from evaluation.skill_aggregation import MergePolicy
+from orchestrator.config_registry import DEFAULT_RUBRIC
+
+POLICIES = list(MergePolicy)
+
+# Duplicated evidence, overlap between required and disallowed, and
+# skills with nothing required or nothing disallowed
+EDGE_RUBRIC = {
+    "versioning": {"rubric_version": "edge-1"},
+    "sections": [{
+        "section_id": "edge",
+        "skills": [
+            {
+                "skill_id": "dup",
+                "required_evidence": ["a", "b", "a"],
+                "explicitly_disallowed_evidence": ["x", "x"],
+            },
+            {
+                "skill_id": "overlap",
+                "required_evidence": ["a", "shared"],
+                "explicitly_disallowed_evidence": ["shared"],
+            },
+            {
+                "skill_id": "nothing_required",
+                "required_evidence": [],
+                "explicitly_disallowed_evidence": ["x"],
+            },
+            {
+                "skill_id": "nothing_disallowed",
+                "required_evidence": ["a"],
+                "explicitly_disallowed_evidence": [],
+            },
+        ],
+    }],
+}
+
+
+@pytest.fixture(scope="module", params=["swe", "edge"])
+def rubric(request):
+    raw = load_rubric(DEFAULT_RUBRIC) if request.param == "swe" else EDGE_RUBRIC
+    return compile_rubric(raw)
+
+
+def random_candidates(rubric, n, seed):
+    rng = random.Random(seed)
+    skill_ids = list(rubric.skills)
+    candidates = []
+
+    for c in range(n):
+        responses = []
+        for r in range(rng.randint(0, 8)):
+            skill_id = rng.choice(skill_ids)
+            # Rubric evidence (with repeats) plus some outside the vocabulary
+            vocabulary = list(rubric.evidence_by_id[skill_id]) + ["unrelated", ""]
+            response = {
+                "skill_id": skill_id,
+                "evidence": [rng.choice(vocabulary) for _ in range(rng.randint(0, 5))],
+            }
+            if rng.random() < 0.9:
+                response["node_id"] = f"n{r}"
+            if rng.random() < 0.05:
+                del response["evidence"]
+            responses.append(response)
+        candidates.append({"candidate_id": f"C{c}", "responses": responses})
+
+    return candidates
+
+
+def edge_candidates(rubric):
+    skill_id = next(iter(rubric.skills))
+    required = list(rubric.required_evidence[skill_id])
+    disallowed = list(rubric.disallowed_evidence[skill_id])
+    return [
+        {"candidate_id": "no_responses", "responses": []},
+        {"candidate_id": "empty_evidence", "responses": [
+            {"node_id": "n0", "skill_id": skill_id, "evidence": []},
+        ]},
+        {"candidate_id": "full_then_empty", "responses": [
+            {"node_id": "n0", "skill_id": skill_id, "evidence": required},
+            {"node_id": "n1", "skill_id": skill_id, "evidence": []},
+        ]},
+        {"candidate_id": "forbidden_only", "responses": [
+            {"node_id": "n0", "skill_id": skill_id, "evidence": disallowed},
+        ]},
+        {"candidate_id": "conflict", "responses": [
+            {"node_id": "n0", "skill_id": skill_id, "evidence": required + disallowed},
+        ]},
+        {"candidate_id": "split_across_nodes", "responses": [
+            {"node_id": f"n{i}", "skill_id": skill_id, "evidence": [e]}
+            for i, e in enumerate(required + required[:1])
+        ]},
+        {"candidate_id": "same_node_twice", "responses": [
+            {"node_id": "n0", "skill_id": skill_id, "evidence": required[:1]},
+            {"node_id": "n0", "skill_id": skill_id, "evidence": required[1:]},
+        ]},
+    ]
+
+
+def corpus(rubric):
+    return edge_candidates(rubric) + random_candidates(rubric, 300, seed=7)
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_batch_matches_score_candidate(rubric, policy):
+    candidates = corpus(rubric)
+    expected = [score_candidate(c, rubric, merge_policy=policy) for c in candidates]
+    assert evaluate_candidates_batch(candidates, rubric, merge_policy=policy) == expected
+
+
+def test_batch_accepts_a_raw_rubric():
+    raw = load_rubric(DEFAULT_RUBRIC)
+    candidates = random_candidates(compile_rubric(raw), 20, seed=1)
+    assert evaluate_candidates_batch(candidates, raw) == [
+        score_candidate(c, raw) for c in candidates
+    ]
+
+
+def test_batch_of_nothing():
+    assert evaluate_candidates_batch([], load_rubric(DEFAULT_RUBRIC)) == []
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_score_candidate_matches_two_pass(rubric, policy):
+    for candidate in corpus(rubric):
+        two_pass = evaluate_candidate(candidate, rubric, merge_policy=policy)
+        two_pass.update(derive_overall_confidence(two_pass["final_scores"]))
+        assert score_candidate(candidate, rubric, merge_policy=policy) == two_pass
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_incremental_matches_score_candidate(rubric, policy):
+    for candidate in corpus(rubric):
+        scorer = IncrementalScorer(rubric, candidate["candidate_id"], merge_policy=policy)
+        for response in candidate["responses"]:
+            scorer.add_response(
+                response["skill_id"], response.get("evidence", []), response.get("node_id")
+            )
+        expected = score_candidate(candidate, rubric, merge_policy=policy)
+        assert scorer.snapshot() == expected
+
+        # Resumed from its JSON state, it still agrees
+        resumed = IncrementalScorer(rubric, state=scorer.state())
+        assert resumed.snapshot() == expected
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_score_table_round_trip_matches_score_candidate(rubric, policy):
+    candidates = corpus(rubric)
+    table = ScoreTable(rubric)
+    table.extend([score_candidate_compact(c, rubric, merge_policy=policy) for c in candidates])
+
+    expected = [score_candidate(c, rubric, merge_policy=policy) for c in candidates]
+    assert len(table) == len(candidates)
+    assert list(table.to_dicts()) == expected
+    # Packing an existing result gives it back unchanged
+    assert [compact_result(result, rubric).to_dict() for result in expected] == expected
+
+
+def test_score_table_rejects_another_rubric():
+    table = ScoreTable(load_rubric(DEFAULT_RUBRIC))
+    other = compile_rubric(EDGE_RUBRIC)
+    with pytest.raises(ValueError):
+        table.append(score_candidate_compact(edge_candidates(other)[0], other))
+
+
+def test_every_path_uses_the_confidence_rules():
+    # One required item per skill: partial everywhere, MEDIUM only, which
+    # is above max_medium_ratio in confidence_rules.json
+    rubric = compile_rubric(load_rubric(DEFAULT_RUBRIC))
+    candidate = {
+        "candidate_id": "partial",
+        "responses": [
+            {"skill_id": skill_id, "node_id": skill_id, "evidence": list(required[:1])}
+            for skill_id, required in rubric.required_evidence.items()
+            if len(required) > 1
+        ],
+    }
+    scorer = IncrementalScorer(rubric, "partial")
+    for response in candidate["responses"]:
+        scorer.add_response(response["skill_id"], response["evidence"], response["node_id"])
+
+    expected = score_candidate(candidate, rubric)
+    assert expected["human_review_required"] is True
+    assert evaluate_candidate(candidate, rubric) == expected
+    assert evaluate_candidates_batch([candidate], rubric) == [expected]
+    assert scorer.snapshot() == expected
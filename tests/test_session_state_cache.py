@@ -0,0 +1,63 @@
+import pytest
+
+from interview_runtime.cache import (
+    InMemoryCacheBackend,
+    SessionCacheConfigError,
+    SessionStateCache,
+)
+from interview_runtime.cache import session_state_cache as cache_module
+
+
+def _entry(version, node="n1"):
+    return {"session_id": "s1", "runtime_version": version, "current_node_id": node}
+
+
+@pytest.fixture
+def cache():
+    return SessionStateCache(InMemoryCacheBackend())
+
+
+def test_invalidate_hides_the_entry(cache):
+    assert cache.put(_entry(1))
+    assert cache.get("s1") == _entry(1)
+
+    cache.invalidate("s1", runtime_version=2)
+    assert cache.get("s1") is None
+
+
+def test_a_reader_with_an_older_row_cannot_reinsert_it(cache):
+    cache.put(_entry(1))
+    # The engine commits version 2 and invalidates; a reader that loaded
+    # version 1 before the commit tries to fill the cache afterwards
+    cache.invalidate("s1", runtime_version=2)
+    assert not cache.put(_entry(1))
+    assert cache.get("s1") is None
+
+    assert cache.put(_entry(2, node="n2"))
+    assert cache.get("s1") == _entry(2, node="n2")
+    assert not cache.put(_entry(1))
+    assert cache.get("s1")["current_node_id"] == "n2"
+
+
+def test_invalidate_without_a_version_deletes(cache):
+    cache.put(_entry(3))
+    cache.invalidate("s1")
+    assert cache.get("s1") is None
+    assert cache.put(_entry(1))
+
+
+def test_entries_expire():
+    cache = SessionStateCache(InMemoryCacheBackend(ttl_seconds=-1))
+    cache.put(_entry(1))
+    assert cache.get("s1") is None
+
+
+def test_in_process_cache_is_refused_with_several_workers(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache", None)
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    monkeypatch.delenv("SESSION_CACHE_BACKEND", raising=False)
+    with pytest.raises(SessionCacheConfigError):
+        cache_module.get_session_state_cache()
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    assert isinstance(cache_module.get_session_state_cache().backend, InMemoryCacheBackend)
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from evaluation.evidence_extractor import get_evidence_extractor
+from interview_runtime.ai_layer.transcription import FakeStreamingBackend, transcribe_stream
+from orchestrator.config_registry import get_config_registry
+from orchestrator.run_interview import simulate_interview, spoken_chunks, stream_answer
+
+ANSWER = (
+    "First I would break it down into subproblems. "
+    "Then a hash map gives O(1) lookup per element, so the time is O(n)! "
+    "I think that covers it"
+)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    registry = get_config_registry()
+    return get_evidence_extractor(registry.rubric(), registry.evidence_rules())
+
+
+async def _chunks(pieces):
+    for piece in pieces:
+        yield piece
+
+
+def _segments(pieces):
+    async def collect():
+        return [s async for s in transcribe_stream(_chunks(pieces), backend=FakeStreamingBackend())]
+    return asyncio.run(collect())
+
+
+def test_partials_carry_only_new_text():
+    pieces = ["one two ", "three ", "four. five", " six"]
+    segments = _segments(pieces)
+
+    partials = [s["transcript_text"] for s in segments if not s["is_final"]]
+    finals = [s["transcript_text"] for s in segments if s["is_final"]]
+    assert partials == ["one two ", "three ", " five", " six"]
+    assert finals == ["one two three four.", "five six"]
+
+    # Partials of an utterance concatenate to its final text
+    first = "".join(s["transcript_text"] for s in segments
+                    if s["segment_index"] == 0 and not s["is_final"])
+    assert "one two three four.".startswith(first.strip())
+
+
+def test_partial_work_is_linear_in_the_answer():
+    words = ["word "] * 2000
+    segments = _segments(words)
+    emitted = sum(len(s["transcript_text"]) for s in segments)
+    # Each character is sent at most once as a partial and once as final
+    assert emitted <= 2 * len("".join(words))
+
+
+@pytest.mark.parametrize("skill_id", ["dsa_problem_decomposition", "dsa_complexity_awareness"])
+def test_streamed_answer_matches_whole_transcript(extractor, skill_id):
+    streamed = asyncio.run(stream_answer(spoken_chunks(ANSWER), extractor, skill_id))
+    whole = extractor.extract(streamed["transcript_text"], skill_id=skill_id)
+
+    assert streamed["transcript_text"] == ANSWER
+    assert streamed["evidence"] == whole["evidence"]
+    assert streamed["evidence_matches"] == whole["matches"]
+    assert streamed["evidence"]
+
+
+def test_simulate_interview_streams_answers(extractor, monkeypatch):
+    monkeypatch.setenv("RENDER_CACHE_DIR", "")
+    registry = get_config_registry()
+    graph = registry.question_graph()
+    result = simulate_interview(
+        registry.role_config(),
+        graph,
+        answer_provider=lambda node_id: ANSWER,
+        evidence_extractor=extractor,
+    )
+
+    for response in result["responses"]:
+        expected = extractor.extract(ANSWER, skill_id=response["skill_id"])
+        assert response["evidence"] == expected["evidence"]